@@ -1,24 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Optional
 import logging
+import os
 
 from app.database import get_database
 from app.auth.models import User, UserCreate, UserInDB, Token, TokenData
 from app.auth.utils import (
-    verify_password, 
-    get_password_hash, 
+    verify_password_async,
+    get_password_hash_async,
     create_access_token, 
     verify_token,
     create_credentials_exception,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
+from app.shared.profiling import phase
+from app.shared.response_cache import LOCAL_CACHE_FALLBACK_TTL_SECONDS, ScopedLocalCache, response_cache
 
 logger = logging.getLogger(__name__)
 
 auth_router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
+oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="api/auth/login", auto_error=False)
+
+# Token subject (email) -> User cache'i; her istekte users sorgusunu önler.
+# Kayıtlar principal:<email> versiyonuna bağlıdır; invalidate tüm worker'lara ulaşır.
+principal_cache = ScopedLocalCache(
+    response_cache,
+    maxsize=int(os.getenv("PRINCIPAL_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60")),
+    fallback_ttl=LOCAL_CACHE_FALLBACK_TTL_SECONDS,
+)
+
+async def invalidate_principal(email: str) -> None:
+    """Kullanıcının cache'teki kimlik bilgisini geçersiz kıl
+
+    users dokümanını değiştiren (ör. pasifleştirme) her yazımdan sonra
+    çağrılmalıdır; aksi halde eski kayıt TTL dolana kadar kullanılır.
+    """
+    await principal_cache.invalidate(f"principal:{email}")
 
 async def get_user_by_email(email: str) -> Optional[UserInDB]:
     """Email ile kullanıcı getir"""
@@ -35,7 +56,7 @@ async def get_user_by_email(email: str) -> Optional[UserInDB]:
 async def authenticate_user(email: str, password: str) -> Optional[UserInDB]:
     """Kullanıcı doğrula"""
     user = await get_user_by_email(email)
-    if not user or not verify_password(password, user.hashed_password):
+    if not user or not await verify_password_async(password, user.hashed_password):
         return None
     return user
 
@@ -43,11 +64,19 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     """Mevcut kullanıcıyı getir"""
     credentials_exception = create_credentials_exception()
     
-    email = verify_token(token, credentials_exception)
-    user = await get_user_by_email(email)
-    if user is None:
-        raise credentials_exception
-    return User(**user.dict())
+    with phase("auth"):
+        email = verify_token(token)
+        if email is None:
+            raise credentials_exception
+
+        async def load() -> Optional[User]:
+            user = await get_user_by_email(email)
+            return User(**user.dict(exclude={"hashed_password"})) if user else None
+
+        current_user = await principal_cache.get_or_load(f"principal:{email}", email, load)
+        if current_user is None:
+            raise credentials_exception
+        return current_user
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """Aktif kullanıcıyı getir"""
@@ -55,6 +84,16 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
+async def get_current_stream_user(
+    token: Optional[str] = Depends(oauth2_scheme_optional),
+    access_token: Optional[str] = Query(None, description="EventSource gibi header gönderemeyen istemciler için token")
+) -> User:
+    """Authorization header'ı ya da access_token query parametresiyle aktif kullanıcıyı getir"""
+    token = token or access_token
+    if not token:
+        raise create_credentials_exception()
+    return await get_current_active_user(await get_current_user(token))
+
 @auth_router.post("/register", response_model=User)
 async def register(user_data: UserCreate):
     """Yeni kullanıcı kaydı"""
@@ -84,17 +123,21 @@ async def register(user_data: UserCreate):
             )
         
         # Kullanıcı oluştur
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         user_dict = user_data.dict()
         del user_dict["password"]
         user_dict["hashed_password"] = hashed_password
         user_dict["full_name"] = user_dict["full_name"].strip()
         
+        now = datetime.utcnow()
+        user_dict["created_at"] = now
+        user_dict["updated_at"] = now
+        
         result = await db.users.insert_one(user_dict)
-        created_user = await db.users.find_one({"_id": result.inserted_id})
+        user_dict["_id"] = result.inserted_id
         
         logger.info(f"New user registered: {user_data.email}")
-        return User(**created_user)
+        return User(**user_dict)
         
     except HTTPException:
         raise
@@ -144,4 +187,4 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
 @auth_router.get("/me", response_model=User)
 async def get_current_user_info(current_user: User = Depends(get_current_active_user)):
     """Mevcut kullanıcı bilgilerini getir"""
-    return current_user
\ No newline at end of file
+    return current_user
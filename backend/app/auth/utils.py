@@ -1,7 +1,9 @@
 import os
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from fastapi import HTTPException, status
@@ -50,6 +52,74 @@ def get_password_hash(password: str) -> str:
             detail="Şifre işleme sırasında hata oluştu"
         )
 
+class PasswordHashingPool:
+    """BCrypt işlemlerini event loop dışında, sınırlı bir thread havuzunda çalıştır"""
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self.rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="bcrypt",
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Fonksiyonu havuzda çalıştır; havuz doluysa 503 döndür"""
+        if self._pending >= self.capacity:
+            self.rejected += 1
+            logger.warning(f"Password hashing pool saturated ({self._pending}/{self.capacity})")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Sunucu şu anda yoğun, lütfen tekrar deneyin",
+                headers={"Retry-After": "1"},
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._pending -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Havuz doluluk bilgilerini döndür"""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "pending": self._pending,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        """Thread havuzunu kapat"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+password_pool = PasswordHashingPool(
+    max_workers=int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))),
+    max_queue=int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32")),
+)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Şifre doğrulamayı thread havuzunda yap"""
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Şifre hash'lemeyi thread havuzunda yap"""
+    return await password_pool.run(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Access token oluştur"""
     try:
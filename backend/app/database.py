@@ -1,25 +1,209 @@
 import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
 from pymongo.errors import ConnectionFailure
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
 import logging
 
+from app.shared.metrics import mongo_command_metrics
+
 logger = logging.getLogger(__name__)
 
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+@dataclass(frozen=True)
+class MongoSettings:
+    """MongoDB bağlantı ve connection pool ayarları"""
+
+    url: str = "mongodb://localhost:27017"
+    database_name: str = "project_management"
+    app_name: str = "project-management-api"
+    max_pool_size: int = 100
+    min_pool_size: int = 0
+    max_idle_time_ms: Optional[int] = None
+    wait_queue_timeout_ms: Optional[int] = None
+    server_selection_timeout_ms: int = 30000
+    connect_timeout_ms: int = 20000
+    socket_timeout_ms: Optional[int] = None
+    compressors: Tuple[str, ...] = ()
+    # Dashboard ve export gibi salt okunur analitik okumaların yönlendirileceği üye
+    analytics_read_preference: str = "primary"
+    analytics_max_staleness_seconds: int = -1
+
+    @classmethod
+    def from_env(cls) -> "MongoSettings":
+        """Ayarları ortam değişkenlerinden oku"""
+        defaults = cls()
+        compressors = os.getenv("MONGODB_COMPRESSORS", "")
+        return cls(
+            url=os.getenv("MONGODB_URL", defaults.url),
+            database_name=os.getenv("DATABASE_NAME", defaults.database_name),
+            app_name=os.getenv("MONGODB_APP_NAME", defaults.app_name),
+            max_pool_size=_env_int("MONGODB_MAX_POOL_SIZE", defaults.max_pool_size),
+            min_pool_size=_env_int("MONGODB_MIN_POOL_SIZE", defaults.min_pool_size),
+            max_idle_time_ms=_env_int("MONGODB_MAX_IDLE_TIME_MS", defaults.max_idle_time_ms),
+            wait_queue_timeout_ms=_env_int("MONGODB_WAIT_QUEUE_TIMEOUT_MS", defaults.wait_queue_timeout_ms),
+            server_selection_timeout_ms=_env_int(
+                "MONGODB_SERVER_SELECTION_TIMEOUT_MS", defaults.server_selection_timeout_ms
+            ),
+            connect_timeout_ms=_env_int("MONGODB_CONNECT_TIMEOUT_MS", defaults.connect_timeout_ms),
+            socket_timeout_ms=_env_int("MONGODB_SOCKET_TIMEOUT_MS", defaults.socket_timeout_ms),
+            compressors=tuple(c.strip() for c in compressors.split(",") if c.strip()),
+            analytics_read_preference=os.getenv(
+                "MONGODB_ANALYTICS_READ_PREFERENCE", defaults.analytics_read_preference
+            ),
+            analytics_max_staleness_seconds=_env_int(
+                "MONGODB_ANALYTICS_MAX_STALENESS_SECONDS", defaults.analytics_max_staleness_seconds
+            ),
+        )
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        """AsyncIOMotorClient'a verilecek seçenekler (None olanlar sürücü varsayılanına bırakılır)"""
+        options = {
+            "appname": self.app_name,
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "maxIdleTimeMS": self.max_idle_time_ms,
+            "waitQueueTimeoutMS": self.wait_queue_timeout_ms,
+            "serverSelectionTimeoutMS": self.server_selection_timeout_ms,
+            "connectTimeoutMS": self.connect_timeout_ms,
+            "socketTimeoutMS": self.socket_timeout_ms,
+            "compressors": ",".join(self.compressors) or None,
+        }
+        return {key: value for key, value in options.items() if value is not None}
+
+    def analytics_read_pref(self):
+        """Analitik okumalar için pymongo read preference nesnesi"""
+        return make_read_preference(
+            read_pref_mode_from_name(self.analytics_read_preference),
+            None,
+            self.analytics_max_staleness_seconds
+        )
+
+@dataclass
+class _PoolCounters:
+    created: int = 0
+    closed: int = 0
+    checked_out: int = 0
+    wait_queue: int = 0
+    max_wait_queue: int = 0
+    checkouts: int = 0
+    checkout_failures: Dict[str, int] = field(default_factory=dict)
+    cleared: int = 0
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """Connection pool olaylarından sunucu bazında anlık pool durumunu tutar"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools: Dict[str, _PoolCounters] = {}
+
+    def _pool(self, address) -> _PoolCounters:
+        key = f"{address[0]}:{address[1]}"
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _PoolCounters()
+        return pool
+
+    def pool_created(self, event):
+        with self._lock:
+            self._pool(event.address)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self._pool(event.address).cleared += 1
+
+    def pool_closed(self, event):
+        with self._lock:
+            self._pools.pop(f"{event.address[0]}:{event.address[1]}", None)
+
+    def connection_created(self, event):
+        with self._lock:
+            self._pool(event.address).created += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self._pool(event.address).closed += 1
+
+    def connection_check_out_started(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.wait_queue += 1
+            pool.max_wait_queue = max(pool.max_wait_queue, pool.wait_queue)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.wait_queue = max(pool.wait_queue - 1, 0)
+            reason = str(event.reason)
+            pool.checkout_failures[reason] = pool.checkout_failures.get(reason, 0) + 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.wait_queue = max(pool.wait_queue - 1, 0)
+            pool.checked_out += 1
+            pool.checkouts += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.checked_out = max(pool.checked_out - 1, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Sunucu bazında açık/kullanımdaki bağlantı ve bekleme kuyruğu sayıları"""
+        with self._lock:
+            return {
+                address: {
+                    "open_connections": pool.created - pool.closed,
+                    "checked_out": pool.checked_out,
+                    "available": pool.created - pool.closed - pool.checked_out,
+                    "wait_queue": pool.wait_queue,
+                    "max_wait_queue": pool.max_wait_queue,
+                    "total_checkouts": pool.checkouts,
+                    "checkout_failures": dict(pool.checkout_failures),
+                    "pool_cleared": pool.cleared,
+                }
+                for address, pool in self._pools.items()
+            }
+
 class Database:
     client: AsyncIOMotorClient = None
     database = None
+    analytics_database = None
+    settings: MongoSettings = None
 
 db = Database()
+pool_monitor = PoolMonitor()
 
-async def connect_to_mongo():
+async def connect_to_mongo(settings: Optional[MongoSettings] = None):
     """MongoDB bağlantısını oluştur"""
     try:
-        mongo_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
-        db_name = os.getenv("DATABASE_NAME", "project_management")
+        settings = settings or MongoSettings.from_env()
         
-        logger.info(f"Connecting to MongoDB: {mongo_url}")
-        db.client = AsyncIOMotorClient(mongo_url)
-        db.database = db.client[db_name]
+        logger.info(f"Connecting to MongoDB: {settings.url}")
+        db.settings = settings
+        db.client = AsyncIOMotorClient(
+            settings.url,
+            event_listeners=[pool_monitor, mongo_command_metrics],
+            **settings.client_kwargs()
+        )
+        db.database = db.client[settings.database_name]
+        db.analytics_database = db.client.get_database(
+            settings.database_name,
+            read_preference=settings.analytics_read_pref()
+        )
         
         # Bağlantıyı test et
         await db.client.admin.command('ping')
@@ -45,6 +229,26 @@ def get_database():
     """Database instance'ını döndür"""
     return db.database
 
+def get_analytics_database():
+    """Analitik okumalar için ayarlanan read preference ile database instance'ı"""
+    return db.analytics_database if db.analytics_database is not None else db.database
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Connection pool ayarları ve anlık kullanım"""
+    settings = db.settings or MongoSettings.from_env()
+    return {
+        "settings": {
+            "max_pool_size": settings.max_pool_size,
+            "min_pool_size": settings.min_pool_size,
+            "max_idle_time_ms": settings.max_idle_time_ms,
+            "wait_queue_timeout_ms": settings.wait_queue_timeout_ms,
+            "server_selection_timeout_ms": settings.server_selection_timeout_ms,
+            "compressors": list(settings.compressors),
+            "analytics_read_preference": settings.analytics_read_preference,
+        },
+        "servers": pool_monitor.stats(),
+    }
+
 async def create_indexes():
     """Veritabanı indexlerini oluştur"""
     try:
@@ -60,6 +264,8 @@ async def create_indexes():
         await database.projects.create_index("status")
         await database.projects.create_index("created_at")
         await database.projects.create_index("updated_at")
+        # Arka plan silme taraması: sadece silinmekte olan projeler index'e girer
+        await database.projects.create_index("deletion.lease_until", sparse=True)
         
         # Tasks collection indexes
         await database.tasks.create_index("project_id")
@@ -79,8 +285,32 @@ async def create_indexes():
         await database.tasks.create_index([("project_id", 1), ("status", 1)])
         await database.tasks.create_index([("project_id", 1), ("task_type", 1)])
         await database.tasks.create_index([("project_id", 1), ("assigned_to", 1)])
+        # Keyset pagination: (created_at, _id) sıralaması
+        await database.tasks.create_index([("project_id", 1), ("created_at", 1), ("_id", 1)])
+        # Successor araması: dependencies multikey index
+        await database.tasks.create_index([("project_id", 1), ("dependencies", 1)])
+        # Metin sorgusu olmayan aramalar: son güncellenene göre sıralı
+        await database.tasks.create_index([("project_id", 1), ("updated_at", -1)])
+        # Task araması: koleksiyon başına tek text index olabilir; proje prefix'i
+        # konmaz çünkü projeler arası arama project_id $in ile yapılır.
+        # İsim eşleşmesi açıklama eşleşmesinin önünde sıralanır.
+        await database.tasks.create_index(
+            [("name", "text"), ("description", "text")],
+            name="task_text_search",
+            weights={"name": 10, "description": 2},
+            default_language=os.getenv("TASK_SEARCH_LANGUAGE", "none")
+        )
         
         logger.info("Database indexes created successfully")
+
+        # Change stream'de silinen task'ın projesini bilmek için ön görüntü
+        # (MongoDB 6.0+, replica set); desteklenmiyorsa olaylar yerel yayınlanır
+        try:
+            await database.command(
+                "collMod", "tasks", changeStreamPreAndPostImages={"enabled": True}
+            )
+        except Exception as e:
+            logger.info(f"Task change stream pre-images not enabled: {e}")
         
     except Exception as e:
         logger.error(f"Error creating indexes: {e}")
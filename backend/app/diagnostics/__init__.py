@@ -0,0 +1 @@
+# Diagnostics package initialization
\ No newline at end of file
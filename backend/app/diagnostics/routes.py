@@ -0,0 +1,66 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Dict
+import logging
+import os
+
+from app.database import get_pool_stats
+from app.auth.routes import get_current_active_user, principal_cache
+from app.auth.models import User
+from app.projects.deletion import project_deletion_worker
+from app.projects.events import event_broker
+from app.projects.services import project_access_cache
+from app.shared.response_cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+# Pool adresleri, cache ve iş istatistikleri sadece bu kullanıcılara açıktır (virgülle ayrılmış);
+# boşsa diagnostics endpoint'leri kapalıdır (404)
+DIAGNOSTICS_ADMIN_EMAILS = {
+    email.strip().lower()
+    for email in os.getenv("DIAGNOSTICS_ADMIN_EMAILS", "").split(",")
+    if email.strip()
+}
+
+async def require_diagnostics_admin(
+    current_user: User = Depends(get_current_active_user)
+) -> User:
+    """Diagnostics erişimini DIAGNOSTICS_ADMIN_EMAILS'teki kullanıcılarla sınırla"""
+    if not DIAGNOSTICS_ADMIN_EMAILS:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if current_user.email.lower() not in DIAGNOSTICS_ADMIN_EMAILS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Bu işlem için yetkiniz yok")
+    return current_user
+
+diagnostics_router = APIRouter()
+
+@diagnostics_router.get("/caches")
+async def get_cache_stats(
+    current_user: User = Depends(require_diagnostics_admin)
+) -> Dict[str, Any]:
+    """In-process cache hit/miss istatistiklerini getir"""
+    return {
+        "principal_cache": principal_cache.stats(),
+        "project_access_cache": project_access_cache.stats(),
+        "response_cache": response_cache.stats(),
+    }
+
+@diagnostics_router.get("/pool")
+async def get_connection_pool_stats(
+    current_user: User = Depends(require_diagnostics_admin)
+) -> Dict[str, Any]:
+    """MongoDB connection pool ayarlarını ve anlık kullanımını getir"""
+    return get_pool_stats()
+
+@diagnostics_router.get("/events")
+async def get_event_broker_stats(
+    current_user: User = Depends(require_diagnostics_admin)
+) -> Dict[str, Any]:
+    """Proje olay akışı kaynağını ve abone sayılarını getir"""
+    return event_broker.stats()
+
+@diagnostics_router.get("/deletions")
+async def get_project_deletion_stats(
+    current_user: User = Depends(require_diagnostics_admin)
+) -> Dict[str, Any]:
+    """Bu worker'daki arka plan proje silme işlerini getir"""
+    return project_deletion_worker.stats()
@@ -2,28 +2,43 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
-import uvicorn
 import os
 
 from app.database import connect_to_mongo, close_mongo_connection
+from app.auth.utils import password_pool
 from app.auth.routes import auth_router
 from app.projects.routes import projects_router
+from app.projects.deletion import project_deletion_worker
+from app.projects.events import event_broker
+from app.diagnostics.routes import diagnostics_router
+from app.shared.responses import FastJSONResponse
+from app.shared.metrics import MetricsMiddleware, mark_worker_exit, render_metrics
+from app.shared.profiling import ProfilingMiddleware
+from app.shared.response_cache import response_cache
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await connect_to_mongo()
+    # Yarıda kalmış proje silmelerini devam ettir
+    project_deletion_worker.start()
     yield
     # Shutdown
+    await project_deletion_worker.close()
+    await event_broker.close()
     await close_mongo_connection()
+    await response_cache.close()
+    password_pool.shutdown()
+    mark_worker_exit()
 
 app = FastAPI(
     title="Project Management API",
     description="Microsoft Project benzeri web tabanlı proje yönetimi uygulaması",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware - Updated for better development support
@@ -50,14 +65,26 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Opt-in faz dökümü ve cProfile (PROFILING_* / X-Profile başlığı)
+app.add_middleware(ProfilingMiddleware)
+# En dışta: CORS dahil tüm isteklerin süresini ölçer
+app.add_middleware(MetricsMiddleware)
+
 # Routes
 app.include_router(auth_router, prefix="/api/auth", tags=["authentication"])
 app.include_router(projects_router, prefix="/api/projects", tags=["projects"])
+app.include_router(diagnostics_router, prefix="/api/diagnostics", tags=["diagnostics"])
 
 @app.get("/")
 async def root():
     return {"message": "Project Management API", "version": "1.0.0", "status": "running"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrikleri (istek/servis/Mongo komut süreleri)"""
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "message": "API is running"}
@@ -78,5 +105,6 @@ async def internal_error_handler(request, exc):
     )
 
 if __name__ == "__main__":
-    port = int(os.getenv("PORT", 8000))
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
+    # Worker sayısı, reload ve graceful shutdown ayarları app.serve'de
+    from app.serve import main
+    main()
\ No newline at end of file
@@ -0,0 +1,261 @@
+# backend/app/projects/deletion.py
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+import asyncio
+import logging
+import os
+import socket
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from app.database import get_database
+
+logger = logging.getLogger(__name__)
+
+# Silinmek üzere işaretlenmiş projeler bu alanı taşır; okuma ve erişim sorguları bunları dışlar
+DELETION_FIELD = "deletion"
+ACTIVE_PROJECT = {DELETION_FIELD: {"$exists": False}}
+
+# Bu kadar batch'te bir ilerleme loglanır
+PROGRESS_LOG_EVERY = 10
+
+class ProjectDeletionWorker:
+    """Silinen projelerin tasklarını arka planda sınırlı batch'lerle temizler
+
+    Proje önce "deletion" alt dokümanıyla işaretlenir (istek hemen döner),
+    ardından tasklar batch_size'lık _id listeleriyle silinir ve her batch
+    arasında pause_seconds beklenir; tek bir büyük delete_many'nin Mongo'da
+    yazma yükü sıçraması yapmasının önüne geçilir. İlerleme proje
+    dokümanına yazılır.
+
+    Her iş bir lease ile sahiplenilir: birden çok worker aynı projeyi
+    silmez, yarıda kalan işler (kapanma, çökme) lease süresi dolunca
+    periyodik taramayla başka bir worker ya da yeniden başlatma sonrası
+    devam ettirilir.
+
+    Tasklar silinince proje dokümanı hemen silinmez, "completed" durumunda
+    bir tombstone olarak grace_seconds kadar kalır. Diğer worker'ların
+    erişim cache'inden (PROJECT_ACCESS_CACHE_TTL_SECONDS) ya da işaretlemeden
+    önce başlamış isteklerden gelen geç task yazımları bu sürede de
+    yapılabilir; süre dolunca tarama tasklara son bir kez bakar ve
+    tombstone'u siler. Sonrasında erişim kontrolü hiçbir yerde geçemez.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        pause_seconds: float = 0.05,
+        lease_seconds: float = 60,
+        sweep_seconds: float = 60,
+        grace_seconds: float = 120,
+    ):
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.lease_seconds = lease_seconds
+        self.sweep_seconds = sweep_seconds
+        self.grace_seconds = grace_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._jobs: Dict[str, asyncio.Task] = {}
+        self._sweep_task: Optional[asyncio.Task] = None
+        self.completed = 0
+        self.deleted_tasks = 0
+
+    def start(self) -> None:
+        """Yarıda kalan silmeleri devam ettiren periyodik taramayı başlat"""
+        if self._sweep_task is None:
+            self._sweep_task = asyncio.create_task(self._sweep())
+
+    def schedule(self, project_id: str) -> None:
+        """Projenin silme işini bu worker'da başlat (zaten çalışıyorsa bir şey yapmaz)"""
+        if project_id in self._jobs:
+            return
+        job = asyncio.create_task(self._run(project_id))
+        self._jobs[project_id] = job
+        job.add_done_callback(lambda _: self._jobs.pop(project_id, None))
+
+    async def close(self) -> None:
+        """Çalışan işleri durdur; lease dolunca kaldıkları yerden devam edilir"""
+        tasks = list(self._jobs.values())
+        if self._sweep_task is not None:
+            tasks.append(self._sweep_task)
+            self._sweep_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._jobs.clear()
+
+    def _lease_until(self) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+
+    async def _claim(self, project_oid: ObjectId) -> Optional[Dict[str, Any]]:
+        """Lease boşsa ya da süresi dolmuşsa işi bu worker'a al"""
+        database = get_database()
+        return await database.projects.find_one_and_update(
+            {
+                "_id": project_oid,
+                DELETION_FIELD: {"$exists": True},
+                "$or": [
+                    {f"{DELETION_FIELD}.lease_owner": self.worker_id},
+                    {f"{DELETION_FIELD}.lease_until": {"$lte": datetime.utcnow()}},
+                ],
+            },
+            {"$set": {
+                f"{DELETION_FIELD}.lease_owner": self.worker_id,
+                f"{DELETION_FIELD}.lease_until": self._lease_until(),
+            }},
+            projection={DELETION_FIELD: 1},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def _run(self, project_id: str) -> None:
+        project_oid = ObjectId(project_id)
+        database = get_database()
+        try:
+            project_data = await self._claim(project_oid)
+            if project_data is None:
+                return
+            deletion = project_data[DELETION_FIELD]
+            if deletion.get("completed_at") is not None:
+                await self._finalize(project_oid)
+                return
+
+            if deletion.get("total_tasks") is None:
+                total = await database.tasks.count_documents({"project_id": project_oid})
+                await database.projects.update_one(
+                    {"_id": project_oid}, {"$set": {f"{DELETION_FIELD}.total_tasks": total}}
+                )
+                logger.info(f"Project deletion started: {project_id} ({total} tasks)")
+            else:
+                logger.info(
+                    f"Project deletion resumed: {project_id} "
+                    f"({deletion.get('deleted_tasks', 0)}/{deletion['total_tasks']} tasks deleted)"
+                )
+
+            if not await self._purge_tasks(project_oid, track_progress=True):
+                logger.warning(f"Project deletion lease lost: {project_id}")
+                return
+
+            # Tombstone: lease grace süresi sonunda dolar ve tarama _finalize'ı çalıştırır
+            now = datetime.utcnow()
+            result = await database.projects.update_one(
+                {"_id": project_oid, f"{DELETION_FIELD}.lease_owner": self.worker_id},
+                {"$set": {
+                    f"{DELETION_FIELD}.status": "completed",
+                    f"{DELETION_FIELD}.completed_at": now,
+                    f"{DELETION_FIELD}.updated_at": now,
+                    f"{DELETION_FIELD}.lease_owner": None,
+                    f"{DELETION_FIELD}.lease_until": now + timedelta(seconds=self.grace_seconds),
+                }}
+            )
+            if not result.modified_count:
+                logger.warning(f"Project deletion lease lost: {project_id}")
+                return
+            await database.project_stats.delete_one({"_id": project_oid})
+            self.completed += 1
+            logger.info(
+                f"Project deletion completed: {project_id} "
+                f"(final purge in {self.grace_seconds:g}s)"
+            )
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Lease dolunca tarama işi tekrar dener
+            logger.error(f"Error deleting project {project_id}: {e}")
+
+    async def _finalize(self, project_oid: ObjectId) -> None:
+        """Grace süresi dolan tombstone'un geç yazılmış tasklarını temizle ve projeyi sil"""
+        database = get_database()
+        if not await self._purge_tasks(project_oid, track_progress=False):
+            return
+        await database.project_stats.delete_one({"_id": project_oid})
+        result = await database.projects.delete_one(
+            {"_id": project_oid, f"{DELETION_FIELD}.lease_owner": self.worker_id}
+        )
+        if not result.deleted_count:
+            logger.warning(f"Project deletion lease lost: {project_oid}")
+            return
+        logger.info(f"Project deletion finalized: {project_oid}")
+
+    async def _purge_tasks(self, project_oid: ObjectId, track_progress: bool) -> bool:
+        """Projenin tasklarını batch'ler halinde sil; lease kaybedilirse False"""
+        database = get_database()
+        batches = 0
+        while True:
+            task_ids = [
+                task_data["_id"]
+                async for task_data in database.tasks.find(
+                    {"project_id": project_oid}, {"_id": 1}
+                ).limit(self.batch_size)
+            ]
+            if not task_ids:
+                return True
+
+            result = await database.tasks.delete_many(
+                {"_id": {"$in": task_ids}, "project_id": project_oid}
+            )
+            self.deleted_tasks += result.deleted_count
+            batches += 1
+
+            if track_progress:
+                # İlerleme yazımı lease'i de uzatır
+                progress = await database.projects.find_one_and_update(
+                    {"_id": project_oid, f"{DELETION_FIELD}.lease_owner": self.worker_id},
+                    {
+                        "$inc": {f"{DELETION_FIELD}.deleted_tasks": result.deleted_count},
+                        "$set": {
+                            f"{DELETION_FIELD}.lease_until": self._lease_until(),
+                            f"{DELETION_FIELD}.updated_at": datetime.utcnow(),
+                        },
+                    },
+                    projection={DELETION_FIELD: 1},
+                    return_document=ReturnDocument.AFTER,
+                )
+                if progress is None:
+                    return False
+                if batches % PROGRESS_LOG_EVERY == 0:
+                    deletion = progress[DELETION_FIELD]
+                    logger.info(
+                        f"Project deletion progress: {project_oid} "
+                        f"{deletion.get('deleted_tasks', 0)}/{deletion.get('total_tasks')} tasks"
+                    )
+
+            if self.pause_seconds > 0:
+                await asyncio.sleep(self.pause_seconds)
+
+    async def _sweep(self) -> None:
+        """Lease'i boşta kalmış silme işlerini periyodik olarak üstlen"""
+        database = get_database()
+        while True:
+            try:
+                async for project_data in database.projects.find(
+                    {f"{DELETION_FIELD}.lease_until": {"$lte": datetime.utcnow()}},
+                    {"_id": 1}
+                ):
+                    self.schedule(str(project_data["_id"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Project deletion sweep failed: {e}")
+            await asyncio.sleep(self.sweep_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "running": sorted(self._jobs),
+            "completed": self.completed,
+            "deleted_tasks": self.deleted_tasks,
+            "batch_size": self.batch_size,
+            "pause_seconds": self.pause_seconds,
+            "grace_seconds": self.grace_seconds,
+        }
+
+project_deletion_worker = ProjectDeletionWorker(
+    batch_size=int(os.getenv("PROJECT_DELETION_BATCH_SIZE", "1000")),
+    pause_seconds=float(os.getenv("PROJECT_DELETION_BATCH_PAUSE_SECONDS", "0.05")),
+    lease_seconds=float(os.getenv("PROJECT_DELETION_LEASE_SECONDS", "60")),
+    sweep_seconds=float(os.getenv("PROJECT_DELETION_SWEEP_SECONDS", "60")),
+    grace_seconds=float(os.getenv("PROJECT_DELETION_GRACE_SECONDS", "120")),
+)
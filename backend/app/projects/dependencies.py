@@ -0,0 +1,96 @@
+# backend/app/projects/dependencies.py
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+from bson import ObjectId
+
+from app.projects.scheduling import ScheduleCycleError
+
+# Successor/etki analizi için yüklenen task alanları
+DEPENDENT_FIELDS = {
+    "name": 1, "task_type": 1, "status": 1, "start_date": 1, "end_date": 1,
+    "assigned_to": 1, "dependencies": 1
+}
+
+def normalize_dependencies(task_id: Optional[str], dependencies: Iterable[str]) -> List[str]:
+    """Bağımlılık listesini sırayı koruyarak tekilleştir ve biçimini doğrula
+
+    Geçersiz id ya da task'ın kendisine bağımlılığı ValueError fırlatır.
+    """
+    normalized = list(dict.fromkeys(dependencies))
+    invalid = [dep_id for dep_id in normalized if not ObjectId.is_valid(dep_id)]
+    if invalid:
+        raise ValueError(f"Geçersiz bağımlılık id'si: {', '.join(invalid)}")
+    if task_id is not None and task_id in normalized:
+        raise ValueError("Task kendisine bağımlı olamaz")
+    return normalized
+
+def ensure_dependencies_exist(dependencies: Sequence[str], existing_ids: Iterable[str]) -> None:
+    """Projede bulunmayan bağımlılık varsa ValueError fırlat"""
+    existing = set(existing_ids)
+    missing = [dep_id for dep_id in dependencies if dep_id not in existing]
+    if missing:
+        raise ValueError(f"Bağımlılık bulunamadı: {', '.join(missing)}")
+
+def find_dependency_cycle(
+    graph: Mapping[str, Sequence[str]],
+    task_id: str,
+    dependencies: Sequence[str],
+) -> Optional[List[str]]:
+    """task_id'nin bağımlılıkları dependencies olursa oluşacak döngüyü bul
+
+    graph: task id -> bağımlılıkları (en azından task_id'nin downstream
+    alt grafı). Yeni bağımlılıklardan geriye (predecessor yönünde) yürünür;
+    task_id'ye ulaşılırsa döngü vardır. Döngü, ScheduleCycleError ile aynı
+    yönde (önce yapılması gerekenden sonrakine) döndürülür.
+    """
+    parent: Dict[str, str] = {}
+    stack = []
+    for dep_id in dependencies:
+        if dep_id not in parent:
+            parent[dep_id] = task_id
+            stack.append(dep_id)
+
+    while stack:
+        node = stack.pop()
+        if node == task_id:
+            # parent zinciri task_id'den geriye doğru: task -> ... -> node
+            path = [node]
+            current = parent[node]
+            while current != task_id:
+                path.append(current)
+                current = parent[current]
+            path.append(task_id)
+            return path
+        for dep_id in graph.get(node) or ():
+            if dep_id not in parent:
+                parent[dep_id] = node
+                stack.append(dep_id)
+    return None
+
+def check_dependency_cycle(
+    graph: Mapping[str, Sequence[str]],
+    task_id: str,
+    dependencies: Sequence[str],
+) -> None:
+    """Döngü varsa ScheduleCycleError (ValueError) fırlat"""
+    cycle = find_dependency_cycle(graph, task_id, dependencies)
+    if cycle:
+        raise ScheduleCycleError(cycle)
+
+def validate_dependencies_in_graph(
+    graph: Dict[str, List[str]],
+    task_id: Optional[str],
+    dependencies: Sequence[str],
+) -> List[str]:
+    """Projenin tüm bağımlılık grafı bellekteyken (bulk yazım) doğrula ve grafı güncelle
+
+    task_id None ise yeni task'tır; döngü kontrolü gerekmez ve graf
+    çağıran tarafından güncellenir.
+    """
+    dependencies = normalize_dependencies(task_id, dependencies)
+    ensure_dependencies_exist(dependencies, graph)
+    if task_id is not None:
+        check_dependency_cycle(graph, task_id, dependencies)
+        graph[task_id] = dependencies
+    return dependencies
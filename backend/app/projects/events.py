@@ -0,0 +1,285 @@
+# backend/app/projects/events.py
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+import asyncio
+import itertools
+import logging
+import os
+
+import orjson
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.database import get_database
+from app.shared.utils import json_default
+
+logger = logging.getLogger(__name__)
+
+# Kuyruğu taşan bağlantıya gönderilen olay: istemci veriyi yeniden yüklemeli
+RESYNC_EVENT = "resync"
+# Bu alanlardan başka bir şey değişmediyse proje güncellemesi yayınlanmaz
+PROJECT_INTERNAL_FIELDS = {"task_revision", "stats_revision", "stats_pending_writes", "dependency_lock"}
+# Projenin silinmek üzere işaretlendiğini gösteren alan (app.projects.deletion)
+PROJECT_DELETION_FIELD = "deletion"
+# tasks koleksiyonunda ön görüntü kapalıysa change stream bu olayların
+# projesini bilemez; bunlar change stream aktifken de yerel olarak yayınlanır
+LOCAL_DELETE_EVENTS = {"task.deleted", RESYNC_EVENT}
+
+_CLOSED = object()
+
+class Subscriber:
+    """Tek bir SSE bağlantısının sınırlı olay kuyruğu
+
+    Kuyruk dolarsa bekleyen olaylar atılır ve yerine tek bir resync olayı
+    konur; yavaş bir istemci yayıncıyı bekletmez ve belleği büyütmez.
+    """
+
+    def __init__(self, project_id: str, maxsize: int):
+        self.project_id = project_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def push(self, event: Any) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += self.queue.qsize()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": RESYNC_EVENT, "project_id": self.project_id})
+
+    async def next(self, timeout: float) -> Optional[Any]:
+        """Sıradaki olay; timeout dolarsa None"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+class EventBroker:
+    """Proje olaylarını abonelere dağıtan worker içi yayıncı
+
+    Kaynak replica set'te tek bir Mongo change stream'idir (tüm worker'lar
+    diğerlerinin yazımlarını görür); change stream desteklenmiyorsa
+    TaskService/ProjectService yazımları publish_local ile beslenir. Her
+    worker'da tek kaynak vardır; abonelikler proje id'sine göre
+    çoklanır, boştaki bağlantı sadece bir kuyruk ve bir bekleyen
+    coroutine'dir.
+
+    Yerel modda olaylar sadece yazımı yapan worker'ın abonelerine ulaşır;
+    birden çok worker'da tüm abonelerin olayları görmesi için replica set
+    gerekir. Silinen task'ın projesi change stream'de ancak tasks
+    koleksiyonunda changeStreamPreAndPostImages açıksa (create_indexes
+    açmayı dener) bilinir; kapalıysa silmeler yine yerel yayınlanır ve
+    diğer worker'lara ulaşmaz.
+    """
+
+    def __init__(self, source: str = "auto", queue_size: int = 100):
+        self.source = source  # auto | change_stream | local
+        self.queue_size = queue_size
+        self._topics: Dict[str, Set[Subscriber]] = {}
+        self._watch_task: Optional[asyncio.Task] = None
+        self._change_stream_active = False
+        self._delete_pre_images = False
+        self._event_ids = itertools.count(1)
+        self.published = 0
+
+    @property
+    def mode(self) -> str:
+        return "change_stream" if self._change_stream_active else "local"
+
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._topics.values())
+
+    def subscribe(self, project_id: str) -> Subscriber:
+        subscriber = Subscriber(project_id, self.queue_size)
+        self._topics.setdefault(project_id, set()).add(subscriber)
+        if self.source != "local" and self._watch_task is None:
+            self._watch_task = asyncio.create_task(self._watch())
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        subscribers = self._topics.get(subscriber.project_id)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._topics[subscriber.project_id]
+        if not self._topics and self._watch_task is not None:
+            # Abone kalmadıysa change stream kapatılır; ilk abonede tekrar açılır
+            self._watch_task.cancel()
+            self._watch_task = None
+            self._change_stream_active = False
+
+    def next_event_id(self) -> int:
+        return next(self._event_ids)
+
+    def _dispatch(self, project_id: str, event: Dict[str, Any]) -> None:
+        subscribers = self._topics.get(project_id)
+        if not subscribers:
+            return
+        event.setdefault("project_id", project_id)
+        self.published += 1
+        for subscriber in list(subscribers):
+            subscriber.push(event)
+
+    def publish_local(self, project_id: str, event_type: str, **payload: Any) -> None:
+        """Servis yazımından olay yayınla (change stream aktifse onun tarafından yayınlanır)"""
+        if self._change_stream_active and (
+            self._delete_pre_images or event_type not in LOCAL_DELETE_EVENTS
+        ):
+            return
+        self._dispatch(project_id, {"type": event_type, **payload})
+
+    async def close(self) -> None:
+        """Change stream'i durdur ve açık bağlantıları sonlandır"""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            self._watch_task = None
+        self._change_stream_active = False
+        for subscribers in self._topics.values():
+            for subscriber in subscribers:
+                while not subscriber.queue.empty():
+                    subscriber.queue.get_nowait()
+                subscriber.queue.put_nowait(_CLOSED)
+        self._topics.clear()
+
+    async def _watch(self) -> None:
+        """tasks/projects change stream'ini okuyup olayları dağıt"""
+        database = get_database()
+        pipeline = [{"$match": {
+            "ns.coll": {"$in": ["tasks", "projects"]},
+            "operationType": {"$in": ["insert", "update", "replace", "delete"]},
+        }}]
+        try:
+            async with database.watch(
+                pipeline,
+                full_document="updateLookup",
+                full_document_before_change="whenAvailable"
+            ) as stream:
+                self._delete_pre_images = await self._tasks_have_pre_images(database)
+                self._change_stream_active = True
+                if self._delete_pre_images:
+                    logger.info("Project events: change stream active")
+                else:
+                    logger.warning(
+                        "Project events: change stream active without task pre-images; "
+                        "task.deleted events only reach subscribers on the deleting worker"
+                    )
+                async for change in stream:
+                    try:
+                        self._handle_change(change)
+                    except Exception as e:
+                        logger.warning(f"Error handling change event: {e}")
+        except asyncio.CancelledError:
+            raise
+        except (OperationFailure, PyMongoError, NotImplementedError, AttributeError) as e:
+            if self.source == "change_stream":
+                logger.error(f"Project events: change stream failed: {e}")
+            else:
+                logger.info(f"Project events: change streams unavailable, using local pub/sub ({e})")
+        finally:
+            self._change_stream_active = False
+
+    async def _tasks_have_pre_images(self, database) -> bool:
+        """tasks koleksiyonunda changeStreamPreAndPostImages açık mı"""
+        try:
+            async for collection in database.list_collections(filter={"name": "tasks"}):
+                options = collection.get("options", {}).get("changeStreamPreAndPostImages") or {}
+                return bool(options.get("enabled"))
+        except PyMongoError as e:
+            logger.warning(f"Could not read tasks collection options: {e}")
+        return False
+
+    def _handle_change(self, change: Dict[str, Any]) -> None:
+        collection = change["ns"]["coll"]
+        operation = change["operationType"]
+        document = change.get("fullDocument") or change.get("fullDocumentBeforeChange") or {}
+        document_id = str(change["documentKey"]["_id"])
+
+        if collection == "projects":
+            if operation == "delete":
+                self._dispatch(document_id, {"type": "project.deleted"})
+                return
+            fields = (change.get("updateDescription") or {}).get("updatedFields")
+            if fields is not None:
+                if PROJECT_DELETION_FIELD in fields:
+                    self._dispatch(document_id, {"type": "project.deleted"})
+                    return
+                # Silme ilerlemesi (deletion.*) ve iç sayaçlar yayınlanmaz
+                fields = {
+                    k: v for k, v in fields.items()
+                    if k not in PROJECT_INTERNAL_FIELDS and not k.startswith(f"{PROJECT_DELETION_FIELD}.")
+                }
+                if not fields:
+                    return
+            self._dispatch(document_id, {"type": "project.updated", "fields": fields})
+            return
+
+        project_id = document.get("project_id")
+        if project_id is None:
+            # Ön görüntüsü olmayan silmelerde projeyi bilemeyiz; publish_local yayınlar
+            logger.debug(f"Task change without project_id skipped: {document_id}")
+            return
+        project_id = str(project_id)
+
+        if operation == "insert":
+            self._dispatch(project_id, {"type": "task.created", "task_id": document_id, "task": document})
+        elif operation == "delete":
+            self._dispatch(project_id, {"type": "task.deleted", "task_id": document_id})
+        else:
+            fields = (change.get("updateDescription") or {}).get("updatedFields")
+            self._dispatch(project_id, {
+                "type": "task.updated", "task_id": document_id, "fields": fields, "task": document
+            })
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "source": self.source,
+            "delete_pre_images": self._delete_pre_images,
+            "topics": len(self._topics),
+            "subscribers": self.subscriber_count(),
+            "published": self.published,
+            "queue_size": self.queue_size,
+            "dropped": sum(s.dropped for subs in self._topics.values() for s in subs),
+        }
+
+def format_sse(event: Dict[str, Any], event_id: int) -> bytes:
+    """Olayı text/event-stream formatına çevir"""
+    data = orjson.dumps(event, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event_id, event["type"].encode(), data)
+
+async def stream_events(
+    broker: "EventBroker",
+    project_id: str,
+    still_allowed: Callable[[], Awaitable[bool]],
+    heartbeat_seconds: float,
+    resync: bool = False,
+) -> AsyncIterator[bytes]:
+    """Projeye abone olup olayları SSE olarak üret
+
+    Abonelik akış başladığında açılır ve istemci bağlantıyı kapattığında
+    silinir. Olay yokken heartbeat_seconds'ta bir yorum satırı gönderilir
+    ve erişim yeniden kontrol edilir; erişimi kalkan bağlantı kapatılır.
+    """
+    subscriber = broker.subscribe(project_id)
+    try:
+        yield b"retry: 3000\n\n"
+        if resync:
+            # Yeniden bağlanan istemci aradaki olayları kaçırmış olabilir
+            yield format_sse({"type": RESYNC_EVENT, "project_id": subscriber.project_id}, broker.next_event_id())
+        while True:
+            event = await subscriber.next(heartbeat_seconds)
+            if event is _CLOSED:
+                return
+            if event is None:
+                if not await still_allowed():
+                    return
+                yield b": ping\n\n"
+                continue
+            yield format_sse(event, broker.next_event_id())
+    finally:
+        broker.unsubscribe(subscriber)
+
+event_broker = EventBroker(
+    source=os.getenv("PROJECT_EVENTS_SOURCE", "auto").lower(),
+    queue_size=int(os.getenv("PROJECT_EVENTS_QUEUE_SIZE", "100")),
+)
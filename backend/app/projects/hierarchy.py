@@ -0,0 +1,149 @@
+# backend/app/projects/hierarchy.py
+
+from typing import Any, Dict, List, Optional, Sequence
+from datetime import date, datetime
+from enum import Enum
+
+# Epic ağacı için gereken task alanları
+HIERARCHY_FIELDS = {
+    "name": 1, "task_type": 1, "status": 1, "priority": 1, "assigned_to": 1,
+    "parent_epic": 1, "start_date": 1, "end_date": 1,
+    "effort_hours": 1, "completion_percentage": 1, "created_at": 1
+}
+
+def _value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+def _as_date(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+def _isoformat(value: Optional[date]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+def build_epic_tree(tasks: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """parent_epic ilişkisinden epic -> task ağacını kur ve alt ağaç toplamlarını hesapla
+
+    Tek geçişte adjacency index'i kurulur, alt ağaç toplamları iteratif
+    post-order ile O(n) hesaplanır. Üst epic'i bulunamayan (silinmiş ya da
+    döngü içindeki) task'lar köke alınır. Tamamlanma oranı efora göre
+    ağırlıklıdır; alt ağaçta efor yoksa basit ortalamaya düşer.
+    """
+    n = len(tasks)
+    ids = [str(task["_id"]) for task in tasks]
+    index = {task_id: i for i, task_id in enumerate(ids)}
+
+    parent = [-1] * n
+    orphaned = 0
+    for i, task in enumerate(tasks):
+        parent_id = task.get("parent_epic")
+        if not parent_id:
+            continue
+        j = index.get(str(parent_id))
+        if j is None or j == i:
+            orphaned += 1
+        else:
+            parent[i] = j
+
+    # parent_epic döngülerini kır: döngüdeki her düğüm köke alınır
+    state = [0] * n  # 0: ziyaret edilmedi, 1: yolda, 2: tamam
+    for start in range(n):
+        path = []
+        node = start
+        while node != -1 and state[node] == 0:
+            state[node] = 1
+            path.append(node)
+            node = parent[node]
+        if node != -1 and state[node] == 1:
+            cycle_node = node
+            while True:
+                next_node = parent[cycle_node]
+                parent[cycle_node] = -1
+                orphaned += 1
+                if next_node == node:
+                    break
+                cycle_node = next_node
+        for visited in path:
+            state[visited] = 2
+
+    children: List[List[int]] = [[] for _ in range(n)]
+    for i in range(n):
+        if parent[i] != -1:
+            children[parent[i]].append(i)
+    roots = [i for i in range(n) if parent[i] == -1]
+
+    # Post-order: çocuklar ebeveynden önce işlenir
+    order: List[int] = []
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(children[node])
+    order.reverse()
+
+    nodes: List[Dict[str, Any]] = [None] * n  # type: ignore[list-item]
+    for i in order:
+        task = tasks[i]
+        effort = float(task.get("effort_hours") or 0)
+        completion = float(task.get("completion_percentage") or 0)
+        count = 1
+        effort_sum = effort
+        completed_effort = effort * completion / 100
+        completion_sum = completion
+        start = _as_date(task.get("start_date"))
+        end = _as_date(task.get("end_date"))
+
+        child_nodes = [nodes[c] for c in children[i]]
+        for child in child_nodes:
+            rollup = child["_rollup"]
+            count += rollup["count"]
+            effort_sum += rollup["effort"]
+            completed_effort += rollup["completed_effort"]
+            completion_sum += rollup["completion_sum"]
+            if rollup["start"] and (start is None or rollup["start"] < start):
+                start = rollup["start"]
+            if rollup["end"] and (end is None or rollup["end"] > end):
+                end = rollup["end"]
+
+        nodes[i] = {
+            "id": ids[i],
+            "name": task.get("name"),
+            "type": _value(task.get("task_type")),
+            "status": _value(task.get("status")),
+            "priority": _value(task.get("priority")),
+            "assigned_to": task.get("assigned_to"),
+            "start_date": _isoformat(_as_date(task.get("start_date"))),
+            "end_date": _isoformat(_as_date(task.get("end_date"))),
+            "effort_hours": task.get("effort_hours"),
+            "completion_percentage": completion,
+            "subtree": {
+                "task_count": count,
+                "effort_hours": round(effort_sum, 2),
+                "completion_percentage": round(
+                    completed_effort / effort_sum * 100 if effort_sum else completion_sum / count, 2
+                ),
+                "start_date": _isoformat(start),
+                "end_date": _isoformat(end),
+            },
+            "children": child_nodes,
+            "_rollup": {
+                "count": count, "effort": effort_sum, "completed_effort": completed_effort,
+                "completion_sum": completion_sum, "start": start, "end": end,
+            },
+        }
+
+    for node in nodes:
+        node.pop("_rollup")
+
+    # Epic'ler önce, ardından bağımsız task'lar (her grup kendi sırasında)
+    root_nodes = [nodes[i] for i in roots]
+    root_nodes.sort(key=lambda node: node["type"] != "epic")
+    return {
+        "task_count": n,
+        "epic_count": sum(1 for task in tasks if _value(task.get("task_type")) == "epic"),
+        "orphaned_tasks": orphaned,
+        "roots": root_nodes,
+    }
@@ -132,6 +132,116 @@ class Task(TaskBase):
             return str(v)
         return str(v)
 
+class TaskShift(BaseModel):
+    id: str
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    previous_start_date: Optional[date] = None
+    previous_end_date: Optional[date] = None
+
+class TaskUpdateResult(Task):
+    shifted_tasks: List[TaskShift] = []
+
+class DependentTask(BaseModel):
+    """Bir task'a doğrudan ya da dolaylı bağımlı task (depth 1: doğrudan successor)"""
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="_id")
+    name: str
+    task_type: TaskType = TaskType.TASK
+    status: TaskStatus = TaskStatus.NOT_STARTED
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    assigned_to: Optional[str] = None
+    dependencies: List[str] = []
+    depth: int = 1
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def validate_object_id(cls, v):
+        return str(v)
+
+class TaskImpact(BaseModel):
+    """Task'taki bir gecikmeden etkilenecek downstream task'lar"""
+    task_id: str
+    direct_dependents: int = 0
+    total_dependents: int = 0
+    max_depth: int = 0
+    latest_end_date: Optional[date] = None
+    tasks: List[DependentTask] = []
+
+class TaskPage(BaseModel):
+    items: List[Dict[str, Any]] = []
+    next_cursor: Optional[str] = None
+    limit: int
+
+class FacetCount(BaseModel):
+    value: Optional[str] = None
+    count: int
+
+class TaskSearchResult(BaseModel):
+    items: List[Dict[str, Any]] = []  # Task çıktısı + metin sorgusunda "score"
+    total: int = 0
+    skip: int = 0
+    limit: int
+    facets: Dict[str, List[FacetCount]] = {}
+
+class BulkOperationType(str, Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+class TaskBulkOperation(BaseModel):
+    op: BulkOperationType
+    task_id: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+
+class TaskBulkRequest(BaseModel):
+    operations: List[TaskBulkOperation]
+    ordered: bool = False
+
+    @field_validator('operations')
+    @classmethod
+    def operations_must_be_in_range(cls, v):
+        if not v:
+            raise ValueError('En az bir işlem gönderilmelidir')
+        if len(v) > 10000:
+            raise ValueError('Tek istekte en fazla 10000 işlem gönderilebilir')
+        return v
+
+class TaskBulkItemResult(BaseModel):
+    index: int
+    op: BulkOperationType
+    status: str  # ok | not_found | error | skipped
+    task_id: Optional[str] = None
+    error: Optional[str] = None
+
+class TaskBulkResult(BaseModel):
+    inserted_count: int = 0
+    modified_count: int = 0
+    deleted_count: int = 0
+    error_count: int = 0
+    results: List[TaskBulkItemResult] = []
+
+class ProjectCalendar(BaseModel):
+    weekmask: str = "1111100"  # Pazartesi..Pazar, 1 = çalışma günü
+    holidays: List[date] = []
+    working_days: List[date] = []  # Hafta sonuna denk gelen çalışma günleri
+
+    @field_validator('weekmask')
+    @classmethod
+    def weekmask_must_be_valid(cls, v):
+        if not re.fullmatch(r'[01]{7}', v) or '1' not in v:
+            raise ValueError('weekmask 7 karakterlik 0/1 dizisi olmalı ve en az bir çalışma günü içermelidir')
+        return v
+
+def validate_project_settings(settings: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """settings["calendar"] varsa doğrula ve JSON uyumlu hale getir"""
+    if settings and settings.get("calendar") is not None:
+        calendar = ProjectCalendar(**settings["calendar"])
+        settings = {**settings, "calendar": calendar.model_dump(mode="json")}
+    return settings
+
 class ProjectBase(BaseModel):
     name: str
     description: Optional[str] = None
@@ -157,6 +267,11 @@ class ProjectBase(BaseModel):
                 raise ValueError(f'Geçersiz email adresi: {email}')
         return v
 
+    @field_validator('settings')
+    @classmethod
+    def validate_settings(cls, v):
+        return validate_project_settings(v)
+
     model_config = ConfigDict(
         str_strip_whitespace=True,
         validate_default=True,
@@ -181,6 +296,11 @@ class ProjectUpdate(BaseModel):
             raise ValueError('Proje adı boş olamaz')
         return v.strip() if v else v
 
+    @field_validator('settings')
+    @classmethod
+    def validate_settings(cls, v):
+        return validate_project_settings(v)
+
     model_config = ConfigDict(
         str_strip_whitespace=True,
     )
@@ -202,4 +322,45 @@ class Project(ProjectBase):
     def validate_id(cls, v):
         if isinstance(v, ObjectId):
             return str(v)
-        return str(v)
\ No newline at end of file
+        return str(v)
+
+class TaskCounts(BaseModel):
+    total_tasks: int = 0
+    by_status: Dict[str, int] = {}
+    by_type: Dict[str, int] = {}
+    by_priority: Dict[str, int] = {}
+    overdue_tasks: int = 0
+
+class ProjectTaskSummary(TaskCounts):
+    project_id: str
+    name: str
+    status: TaskStatus
+
+class DashboardSummary(BaseModel):
+    projects: List[ProjectTaskSummary] = []
+    totals: TaskCounts = TaskCounts()
+    recent_tasks: List[Task] = []
+
+class ProjectStats(BaseModel):
+    project_id: str
+    total_tasks: int = 0
+    completion_percentage: float = 0.0  # Efora göre ağırlıklı
+    average_completion_percentage: float = 0.0
+    effort_hours: float = 0.0
+    completed_effort_hours: float = 0.0
+    remaining_effort_hours: float = 0.0
+    by_status: Dict[str, int] = {}
+    by_priority: Dict[str, int] = {}
+    by_assignee: Dict[str, int] = {}
+    overdue_tasks: int = 0
+    updated_at: Optional[datetime] = None
+
+class ProjectDeletionStatus(BaseModel):
+    """Arka planda silinen projenin ilerlemesi"""
+    project_id: str
+    status: str = "deleting"
+    requested_at: datetime
+    total_tasks: Optional[int] = None  # Worker işi üstlenince sayılır
+    deleted_tasks: int = 0
+    updated_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None  # status "completed": tasklar silindi, son temizlik bekleniyor
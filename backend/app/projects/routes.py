@@ -1,23 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, List, Optional
 from bson import ObjectId
 from datetime import datetime
 import logging
+import os
 
 from app.database import get_database
-from app.auth.routes import get_current_active_user
+from app.auth.routes import get_current_active_user, get_current_stream_user
 from app.auth.models import User
 from app.projects.models import (
     Project, ProjectCreate, ProjectUpdate,
     Task, TaskCreate, TaskUpdate,
-    TaskStatus, TaskType
+    TaskStatus, TaskType, Priority,
+    DashboardSummary, TaskPage, TaskSearchResult,
+    TaskBulkRequest, TaskBulkResult, TaskUpdateResult,
+    DependentTask, TaskImpact, ProjectCalendar, ProjectDeletionStatus, ProjectStats
+)
+from app.projects.events import event_broker, stream_events
+from app.projects.services import (
+    DependencyLockBusyError, ProjectService, TaskService, build_project_etag
+)
+from app.shared.responses import (
+    FastJSONResponse, REVALIDATE_CACHE_CONTROL, etag_matches, not_modified_response
 )
-from app.projects.services import ProjectService, TaskService
 
 logger = logging.getLogger(__name__)
 
 projects_router = APIRouter()
 
+# Olay akışında boşta geçen bu süreden sonra heartbeat gönderilir ve erişim yeniden kontrol edilir
+EVENTS_HEARTBEAT_SECONDS = float(os.getenv("PROJECT_EVENTS_HEARTBEAT_SECONDS", "15"))
+
 # Project endpoints
 @projects_router.post("/", response_model=Project)
 async def create_project(
@@ -57,20 +71,87 @@ async def get_user_projects(
             detail="Projeler getirilirken bir hata oluştu"
         )
 
+@projects_router.get("/dashboard", response_model=DashboardSummary)
+async def get_dashboard_summary(
+    current_user: User = Depends(get_current_active_user)
+):
+    """Kullanıcının tüm projeleri için task özetini getir"""
+    try:
+        service = ProjectService()
+        return await service.get_dashboard_summary(current_user.email)
+    except Exception as e:
+        logger.error(f"Error getting dashboard summary: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Dashboard özeti getirilirken bir hata oluştu"
+        )
+
+def dependency_lock_busy(e: DependencyLockBusyError) -> HTTPException:
+    """Bağımlılık kilidi çakışmasını tekrar denenebilir 409'a çevir"""
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=str(e),
+        headers={"Retry-After": "1"},
+    )
+
+def task_search_filters(
+    task_type: Optional[TaskType] = Query(None, description="Filter by task type"),
+    task_status: Optional[List[TaskStatus]] = Query(None, alias="status", description="Filter by status"),
+    priority: Optional[List[Priority]] = Query(None, description="Filter by priority"),
+    assigned_to: Optional[List[str]] = Query(None, description="Filter by assignee"),
+    tags: Optional[List[str]] = Query(None, description="Task bu etiketlerin hepsine sahip olmalı")
+) -> Dict[str, Any]:
+    """Arama endpoint'lerinin ortak facet filtreleri"""
+    return {
+        "task_type": task_type,
+        "status": task_status,
+        "priority": priority,
+        "assigned_to": assigned_to,
+        "tags": tags,
+    }
+
+@projects_router.get("/tasks/search", response_model=TaskSearchResult)
+async def search_all_tasks(
+    current_user: User = Depends(get_current_active_user),
+    q: Optional[str] = Query(None, min_length=1, max_length=200, description="Aranacak metin (isim/açıklama)"),
+    filters: Dict[str, Any] = Depends(task_search_filters),
+    skip: int = Query(0, ge=0, le=10000),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Kullanıcının erişebildiği tüm projelerde task ara"""
+    try:
+        service = TaskService()
+        return await service.search_tasks(current_user.email, q, None, filters, skip, limit)
+    except Exception as e:
+        logger.error(f"Error searching tasks: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Task araması yapılırken bir hata oluştu"
+        )
+
 @projects_router.get("/{project_id}", response_model=Project)
 async def get_project(
     project_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_active_user)
 ):
     """Proje detayını getir"""
     try:
         service = ProjectService()
+        etag = await service.get_project_etag(project_id, current_user.email, "project")
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
         project = await service.get_project_by_id(project_id, current_user.email)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Proje bulunamadı"
             )
+        # ETag dönen veriden üretilir; cache henüz yenilenmediyse sonraki istek tekrar yükler
+        response.headers["ETag"] = build_project_etag("project", project_id, project.updated_at)
+        response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
         return project
     except HTTPException:
         raise
@@ -111,21 +192,23 @@ async def update_project(
             detail="Proje güncellenirken bir hata oluştu"
         )
 
-@projects_router.delete("/{project_id}")
+@projects_router.delete(
+    "/{project_id}", response_model=ProjectDeletionStatus, status_code=status.HTTP_202_ACCEPTED
+)
 async def delete_project(
     project_id: str,
     current_user: User = Depends(get_current_active_user)
 ):
-    """Proje sil"""
+    """Proje sil (tasklar arka planda temizlenir; ilerleme: GET /{project_id}/deletion)"""
     try:
         service = ProjectService()
-        success = await service.delete_project(project_id, current_user.email)
-        if not success:
+        deletion = await service.delete_project(project_id, current_user.email)
+        if not deletion:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Proje bulunamadı veya silme yetkiniz yok"
             )
-        return {"message": "Proje başarıyla silindi"}
+        return deletion
     except HTTPException:
         raise
     except Exception as e:
@@ -135,6 +218,79 @@ async def delete_project(
             detail="Proje silinirken bir hata oluştu"
         )
 
+@projects_router.get("/{project_id}/deletion", response_model=ProjectDeletionStatus)
+async def get_project_deletion_status(
+    project_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Arka planda silinen projenin ilerlemesi (silme tamamlandıysa 404)"""
+    try:
+        service = ProjectService()
+        deletion = await service.get_project_deletion_status(project_id, current_user.email)
+        if not deletion:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Silinmekte olan proje bulunamadı"
+            )
+        return deletion
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting project deletion status: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Silme durumu getirilirken bir hata oluştu"
+        )
+
+@projects_router.get("/{project_id}/calendar", response_model=ProjectCalendar)
+async def get_project_calendar(
+    project_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Projenin çalışma takvimini getir"""
+    try:
+        service = ProjectService()
+        calendar = await service.get_project_calendar(project_id, current_user.email)
+        if calendar is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Proje bulunamadı"
+            )
+        return calendar
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting project calendar: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Takvim getirilirken bir hata oluştu"
+        )
+
+@projects_router.put("/{project_id}/calendar", response_model=ProjectCalendar)
+async def update_project_calendar(
+    project_id: str,
+    calendar: ProjectCalendar,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Projenin çalışma takvimini güncelle"""
+    try:
+        service = ProjectService()
+        updated = await service.update_project_calendar(project_id, calendar, current_user.email)
+        if updated is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Proje bulunamadı veya güncelleme yetkiniz yok"
+            )
+        return updated
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error updating project calendar: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Takvim güncellenirken bir hata oluştu"
+        )
+
 # Task endpoints
 @projects_router.post("/{project_id}/tasks", response_model=Task)
 async def create_task(
@@ -158,17 +314,58 @@ async def create_task(
             detail="Task oluşturulurken bir hata oluştu"
         )
 
+@projects_router.post("/{project_id}/tasks/bulk", response_model=TaskBulkResult)
+async def bulk_write_tasks(
+    project_id: str,
+    bulk_request: TaskBulkRequest,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Toplu task oluştur/güncelle/sil"""
+    try:
+        service = TaskService()
+        result = await service.bulk_write_tasks(project_id, bulk_request, current_user.email)
+        if result is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Proje bulunamadı"
+            )
+        return result
+    except DependencyLockBusyError as e:
+        raise dependency_lock_busy(e)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in bulk task write: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Toplu task işlemi sırasında bir hata oluştu"
+        )
+
 @projects_router.get("/{project_id}/tasks", response_model=List[Task])
 async def get_project_tasks(
     project_id: str,
     current_user: User = Depends(get_current_active_user),
     task_type: Optional[TaskType] = Query(None, description="Filter by task type"),
-    status: Optional[TaskStatus] = Query(None, description="Filter by status")
+    task_status: Optional[TaskStatus] = Query(None, alias="status", description="Filter by status"),
+    if_none_match: Optional[str] = Header(None)
 ):
     """Projenin tasklarını getir"""
     try:
+        # Filtrelenmiş her liste ayrı bir gösterimdir; ETag filtreleri de içerir
+        resource = "tasks:{}:{}".format(
+            task_type.value if task_type else "", task_status.value if task_status else ""
+        )
+        etag = await ProjectService().get_project_etag(project_id, current_user.email, resource)
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
         service = TaskService()
-        return await service.get_project_tasks(project_id, current_user.email, task_type, status)
+        # Ham dokümanlar response_model doğrulaması atlanarak doğrudan serileştirilir
+        documents = await service.get_project_task_documents(
+            project_id, current_user.email, task_type, task_status
+        )
+        headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL} if etag else None
+        return FastJSONResponse(content=documents, headers=headers)
     except Exception as e:
         logger.error(f"Error getting project tasks: {e}")
         raise HTTPException(
@@ -176,6 +373,103 @@ async def get_project_tasks(
             detail="Tasklar getirilirken bir hata oluştu"
         )
 
+@projects_router.get("/{project_id}/tasks/search", response_model=TaskSearchResult)
+async def search_project_tasks(
+    project_id: str,
+    current_user: User = Depends(get_current_active_user),
+    q: Optional[str] = Query(None, min_length=1, max_length=200, description="Aranacak metin (isim/açıklama)"),
+    filters: Dict[str, Any] = Depends(task_search_filters),
+    skip: int = Query(0, ge=0, le=10000),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Projenin tasklarında ara; sonuçlar sayfalı ve alaka sırasına göre"""
+    try:
+        service = TaskService()
+        result = await service.search_tasks(current_user.email, q, project_id, filters, skip, limit)
+        if result is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Proje bulunamadı"
+            )
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error searching project tasks: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Task araması yapılırken bir hata oluştu"
+        )
+
+@projects_router.get("/{project_id}/tasks/page", response_model=TaskPage)
+async def get_project_tasks_page(
+    project_id: str,
+    current_user: User = Depends(get_current_active_user),
+    cursor: Optional[str] = Query(None, description="Önceki sayfanın next_cursor değeri"),
+    limit: int = Query(50, ge=1, le=500, description="Limit items"),
+    fields: Optional[str] = Query(None, description="Virgülle ayrılmış alan listesi"),
+    task_type: Optional[TaskType] = Query(None, description="Filter by task type"),
+    task_status: Optional[TaskStatus] = Query(None, alias="status", description="Filter by status")
+):
+    """Projenin tasklarını cursor tabanlı sayfalama ile getir"""
+    try:
+        service = TaskService()
+        field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        page = await service.get_project_tasks_page(
+            project_id, current_user.email, limit, cursor, field_list, task_type, task_status
+        )
+        if page is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Proje bulunamadı"
+            )
+        return page
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting project tasks page: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Tasklar getirilirken bir hata oluştu"
+        )
+
+@projects_router.get("/{project_id}/tasks/export")
+async def export_project_tasks(
+    project_id: str,
+    current_user: User = Depends(get_current_active_user),
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|json)$", description="ndjson veya json")
+):
+    """Projenin tasklarını akış (streaming) olarak dışa aktar"""
+    try:
+        if not await ProjectService().has_project_access(project_id, current_user.email):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Proje bulunamadı"
+            )
+
+        service = TaskService()
+        media_type = "application/json" if export_format == "json" else "application/x-ndjson"
+        return StreamingResponse(
+            service.export_project_tasks(project_id, export_format),
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="tasks-{project_id}.{export_format}"'
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error exporting project tasks: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Tasklar dışa aktarılırken bir hata oluştu"
+        )
+
 @projects_router.get("/{project_id}/tasks/{task_id}", response_model=Task)
 async def get_task(
     project_id: str,
@@ -201,7 +495,58 @@ async def get_task(
             detail="Task getirilirken bir hata oluştu"
         )
 
-@projects_router.put("/{project_id}/tasks/{task_id}", response_model=Task)
+@projects_router.get("/{project_id}/tasks/{task_id}/dependents", response_model=List[DependentTask])
+async def get_task_dependents(
+    project_id: str,
+    task_id: str,
+    transitive: bool = Query(False, description="Dolaylı bağımlıları da getir"),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Task'a bağımlı (successor) task'ları getir"""
+    try:
+        service = TaskService()
+        dependents = await service.get_task_dependents(project_id, task_id, current_user.email, transitive)
+        if dependents is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task bulunamadı"
+            )
+        return dependents
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting task dependents: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Bağımlı tasklar getirilirken bir hata oluştu"
+        )
+
+@projects_router.get("/{project_id}/tasks/{task_id}/impact", response_model=TaskImpact)
+async def get_task_impact(
+    project_id: str,
+    task_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Task gecikirse etkilenecek downstream task'ların analizi"""
+    try:
+        service = TaskService()
+        impact = await service.get_task_impact(project_id, task_id, current_user.email)
+        if impact is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task bulunamadı"
+            )
+        return impact
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting task impact: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Etki analizi yapılırken bir hata oluştu"
+        )
+
+@projects_router.put("/{project_id}/tasks/{task_id}", response_model=TaskUpdateResult)
 async def update_task(
     project_id: str,
     task_id: str,
@@ -218,6 +563,8 @@ async def update_task(
                 detail="Task bulunamadı"
             )
         return task
+    except DependencyLockBusyError as e:
+        raise dependency_lock_busy(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -260,16 +607,133 @@ async def delete_task(
 @projects_router.get("/{project_id}/timeline")
 async def get_project_timeline(
     project_id: str,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_active_user)
 ):
     """Proje timeline'ını getir"""
     try:
+        etag = await ProjectService().get_project_etag(project_id, current_user.email, "timeline")
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
         service = TaskService()
         timeline = await service.get_project_timeline(project_id, current_user.email)
-        return timeline
+        headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL} if etag else None
+        return FastJSONResponse(content=timeline, headers=headers)
     except Exception as e:
         logger.error(f"Error getting project timeline: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Timeline getirilirken bir hata oluştu"
-        )
\ No newline at end of file
+        )
+
+@projects_router.get("/{project_id}/schedule")
+async def get_project_schedule(
+    project_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Projenin kritik yol ve çizelge hesabını getir"""
+    try:
+        service = TaskService()
+        schedule = await service.get_project_schedule(project_id, current_user.email)
+        if schedule is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Proje bulunamadı"
+            )
+        return schedule
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting project schedule: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Çizelge hesaplanırken bir hata oluştu"
+        )
+
+@projects_router.get("/{project_id}/stats", response_model=ProjectStats)
+async def get_project_stats(
+    project_id: str,
+    refresh: bool = Query(False, description="Rollup'ı task'lardan yeniden hesapla"),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Projenin ilerleme istatistiklerini getir"""
+    try:
+        service = TaskService()
+        stats = await service.get_project_stats(project_id, current_user.email, refresh)
+        if stats is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Proje bulunamadı"
+            )
+        return stats
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting project stats: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="İstatistikler getirilirken bir hata oluştu"
+        )
+
+@projects_router.get("/{project_id}/epics/tree")
+async def get_epic_tree(
+    project_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Projenin epic -> task hiyerarşisini alt ağaç toplamlarıyla getir"""
+    try:
+        service = TaskService()
+        tree = await service.get_epic_tree(project_id, current_user.email)
+        if tree is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Proje bulunamadı"
+            )
+        return tree
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting epic tree: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Epic ağacı getirilirken bir hata oluştu"
+        )
+
+@projects_router.get("/{project_id}/events")
+async def stream_project_events(
+    project_id: str,
+    current_user: User = Depends(get_current_stream_user),
+    last_event_id: Optional[str] = Header(None)
+):
+    """Projenin task/proje değişikliklerini Server-Sent Events olarak akıt
+
+    Olaylar: task.created, task.updated, task.deleted, project.updated,
+    project.deleted ve resync (istemci veriyi yeniden yüklemeli).
+    """
+    service = ProjectService()
+    if not await service.has_project_access(project_id, current_user.email):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Proje bulunamadı"
+        )
+
+    async def still_allowed() -> bool:
+        return await service.has_project_access(project_id, current_user.email)
+
+    return StreamingResponse(
+        stream_events(
+            event_broker, project_id, still_allowed, EVENTS_HEARTBEAT_SECONDS,
+            resync=last_event_id is not None
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx'in akışı tamponlamasını engelle
+        }
+    )
@@ -0,0 +1,287 @@
+# backend/app/projects/scheduling.py
+
+from typing import Any, Dict, List, Optional, Sequence
+from datetime import date, datetime, timedelta
+
+from app.shared.calendar import DEFAULT_CALENDAR, WorkCalendar
+
+class ScheduleCycleError(ValueError):
+    """Bağımlılık grafiğinde döngü bulunduğunda fırlatılır"""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Bağımlılıklarda döngü var: {' -> '.join(cycle)}")
+
+def _as_date(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+def task_durations(tasks: Sequence[Dict[str, Any]], calendar: WorkCalendar = DEFAULT_CALENDAR) -> List[int]:
+    """Task sürelerini çalışma günü olarak toplu hesapla (milestone = 0)
+
+    duration_days yoksa start_date/end_date aralığındaki çalışma günleri
+    tek bir vektörel takvim çağrısıyla sayılır.
+    """
+    durations = [1] * len(tasks)
+    span_index, span_starts, span_ends = [], [], []
+    for i, task in enumerate(tasks):
+        if task.get("task_type") == "milestone":
+            durations[i] = 0
+        elif task.get("duration_days") is not None:
+            durations[i] = max(int(task["duration_days"]), 0)
+        else:
+            start, end = _as_date(task.get("start_date")), _as_date(task.get("end_date"))
+            if start and end and end >= start:
+                span_index.append(i)
+                span_starts.append(start)
+                span_ends.append(end)
+
+    if span_index:
+        counts = calendar.count_work_days_batch(span_starts, span_ends)
+        for i, count in zip(span_index, counts.tolist()):
+            durations[i] = count
+    return durations
+
+def _find_cycle(remaining: Sequence[int], preds: List[List[int]], in_cycle: List[bool]) -> List[int]:
+    """Topolojik sıralamada kalan düğümlerden birinin döngüsünü bul"""
+    # Kalan her düğümün kalan bir predecessor'ı vardır; geriye yürüyünce döngüye gireriz
+    node = remaining[0]
+    seen: Dict[int, int] = {}
+    path: List[int] = []
+    while node not in seen:
+        seen[node] = len(path)
+        path.append(node)
+        node = next(j for j in preds[node] if in_cycle[j])
+    cycle = path[seen[node]:]
+    cycle.reverse()
+    return cycle + [cycle[0]]
+
+def compute_schedule(
+    tasks: Sequence[Dict[str, Any]],
+    project_start: Optional[date] = None,
+    calendar: WorkCalendar = DEFAULT_CALENDAR
+) -> Dict[str, Any]:
+    """Bağımlılık grafiği üzerinde CPM (critical path method) hesapla
+
+    Bağımlılıklar finish-to-start kabul edilir. Task'ın kendi start_date'i
+    "bundan önce başlayamaz" kısıtı olarak uygulanır. Offset'ler proje
+    takviminin çalışma günleridir. Tüm hesaplama düğüm index'leri
+    üzerinden dizilerle O(V+E) yapılır.
+    """
+    n = len(tasks)
+    ids = [str(task["_id"]) for task in tasks]
+    index = {task_id: i for i, task_id in enumerate(ids)}
+    durations = task_durations(tasks, calendar)
+    start_dates = [_as_date(task.get("start_date")) for task in tasks]
+
+    if project_start is None:
+        known_starts = [d for d in start_dates if d is not None]
+        project_start = min(known_starts) if known_starts else date.today()
+    project_start = calendar.add_work_days(project_start, 0)
+
+    # Kenar listeleri: preds[i] -> i'nin predecessor index'leri, succs[j] -> successor'lar
+    preds: List[List[int]] = [[] for _ in range(n)]
+    succs: List[List[int]] = [[] for _ in range(n)]
+    indegree = [0] * n
+    unresolved = 0
+    for i, task in enumerate(tasks):
+        for dep_id in set(task.get("dependencies") or ()):
+            j = index.get(str(dep_id))
+            if j is None or j == i:
+                unresolved += 1
+                continue
+            preds[i].append(j)
+            succs[j].append(i)
+            indegree[i] += 1
+
+    # Kahn topolojik sıralama
+    order = [i for i in range(n) if indegree[i] == 0]
+    head = 0
+    while head < len(order):
+        j = order[head]
+        head += 1
+        for i in succs[j]:
+            indegree[i] -= 1
+            if indegree[i] == 0:
+                order.append(i)
+
+    if len(order) < n:
+        in_cycle = [d > 0 for d in indegree]
+        remaining = [i for i in range(n) if in_cycle[i]]
+        raise ScheduleCycleError([ids[i] for i in _find_cycle(remaining, preds, in_cycle)])
+
+    # Forward pass: early start / early finish (çalışma günü offset'i, finish hariç)
+    # start_date kısıtının offset'i = [project_start, start_date) aralığındaki çalışma günleri
+    early_start = [0] * n
+    constrained = [i for i in range(n) if start_dates[i] is not None and start_dates[i] > project_start]
+    if constrained:
+        offsets = calendar.count_work_days_batch(
+            [project_start] * len(constrained),
+            [start_dates[i] - timedelta(days=1) for i in constrained]
+        )
+        for i, offset in zip(constrained, offsets.tolist()):
+            early_start[i] = offset
+    early_finish = [0] * n
+    for j in order:
+        early_finish[j] = early_start[j] + durations[j]
+        for i in succs[j]:
+            if early_finish[j] > early_start[i]:
+                early_start[i] = early_finish[j]
+
+    project_finish = max(early_finish) if n else 0
+
+    # Backward pass: late finish / late start
+    late_finish = [project_finish] * n
+    late_start = [0] * n
+    for j in reversed(order):
+        for i in succs[j]:
+            if late_start[i] < late_finish[j]:
+                late_finish[j] = late_start[i]
+        late_start[j] = late_finish[j] - durations[j]
+
+    slack = [late_start[i] - early_start[i] for i in range(n)]
+    critical = [s <= 0 for s in slack]
+
+    # Kritik yol: en erken başlayan kritik task'tan, ona bitişik kritik successor'ları izle
+    critical_path: List[str] = []
+    start_candidates = [
+        i for i in order
+        if critical[i] and not any(critical[j] and early_finish[j] == early_start[i] for j in preds[i])
+    ]
+    if start_candidates:
+        node: Optional[int] = min(start_candidates, key=lambda i: early_start[i])
+        while node is not None:
+            critical_path.append(ids[node])
+            node = next((
+                i for i in succs[node]
+                if critical[i] and early_start[i] == early_finish[node]
+            ), None)
+
+    # Tüm offset'ler [0, project_finish] aralığında; tarihleri takvimden bir kez üret
+    day_labels = [
+        str(day) for day in calendar.add_work_days_batch(
+            [project_start] * (project_finish + 1), range(project_finish + 1)
+        )
+    ]
+
+    scheduled = []
+    for i in range(n):
+        # Finish offset'i hariç tutulur; son çalışma günü bir gün öncesidir
+        finish_shift = 1 if durations[i] > 0 else 0
+        scheduled.append({
+            "id": ids[i],
+            "name": tasks[i].get("name"),
+            "type": tasks[i].get("task_type"),
+            "duration_days": durations[i],
+            "early_start": day_labels[early_start[i]],
+            "early_finish": day_labels[early_finish[i] - finish_shift],
+            "late_start": day_labels[late_start[i]],
+            "late_finish": day_labels[late_finish[i] - finish_shift],
+            "slack_days": slack[i],
+            "is_critical": critical[i],
+        })
+
+    return {
+        "project_start": project_start.isoformat(),
+        "project_finish": day_labels[max(project_finish - 1, 0)],
+        "duration_days": project_finish,
+        "critical_path": critical_path,
+        "unresolved_dependencies": unresolved,
+        "tasks": scheduled,
+    }
+
+def _effective_finish(task: Dict[str, Any], calendar: WorkCalendar) -> Optional[date]:
+    """Task'ın son çalışma günü: end_date, yoksa start_date + süre"""
+    end = _as_date(task.get("end_date"))
+    if end is not None:
+        return end
+    start = _as_date(task.get("start_date"))
+    if start is None:
+        return None
+    duration = task_durations([task], calendar)[0]
+    return calendar.add_work_days(start, max(duration - 1, 0))
+
+def propagate_dates(
+    root_id: str,
+    tasks: Dict[str, Dict[str, Any]],
+    calendar: WorkCalendar = DEFAULT_CALENDAR
+) -> List[Dict[str, Any]]:
+    """Değişen task'ın downstream successor'larının tarihlerini ileri it
+
+    tasks: root, root'un tüm downstream successor'ları ve bu successor'ların
+    diğer predecessor'larını içeren id -> doküman sözlüğü. Bağımlılıklar
+    finish-to-start kabul edilir; bir successor predecessor'ları bitmeden
+    başlıyorsa çalışma günü cinsinden süresi korunarak sonraki çalışma
+    gününe kaydırılır, erken kaydırılmaz.
+    Dokümanlar yerinde güncellenir ve kayan task'lar döndürülür.
+    """
+    # Root'tan erişilebilen alt graf (root'a dönen kenarlar yok sayılır)
+    successors: Dict[str, List[str]] = {}
+    for task_id, task in tasks.items():
+        for dep_id in set(task.get("dependencies") or ()):
+            if dep_id in tasks and dep_id != task_id and task_id != root_id:
+                successors.setdefault(dep_id, []).append(task_id)
+
+    reachable = {root_id}
+    stack = [root_id]
+    while stack:
+        for succ_id in successors.get(stack.pop(), ()):
+            if succ_id not in reachable:
+                reachable.add(succ_id)
+                stack.append(succ_id)
+
+    indegree = {task_id: 0 for task_id in reachable}
+    for task_id in reachable:
+        for succ_id in successors.get(task_id, ()):
+            indegree[succ_id] += 1
+
+    order = [root_id]
+    head = 0
+    while head < len(order):
+        task_id = order[head]
+        head += 1
+        for succ_id in successors.get(task_id, ()):
+            indegree[succ_id] -= 1
+            if indegree[succ_id] == 0:
+                order.append(succ_id)
+
+    shifted = []
+    for task_id in order[1:]:
+        task = tasks[task_id]
+        start = _as_date(task.get("start_date"))
+        if start is None:
+            continue  # Planlanmamış task'lar kaydırılmaz
+
+        finishes = [
+            _effective_finish(tasks[dep_id], calendar)
+            for dep_id in set(task.get("dependencies") or ())
+            if dep_id in tasks
+        ]
+        finishes = [f for f in finishes if f is not None]
+        if not finishes:
+            continue
+
+        required_start = calendar.next_work_day_after(max(finishes))
+        if required_start <= start:
+            continue
+
+        finish = _effective_finish(task, calendar)
+        new_finish = None
+        if finish is not None:
+            work_days = calendar.count_work_days(start, finish)
+            new_finish = calendar.add_work_days(required_start, max(work_days - 1, 0))
+        shifted.append({
+            "id": task_id,
+            "previous_start_date": start,
+            "previous_end_date": _as_date(task.get("end_date")),
+            "start_date": required_start,
+            "end_date": new_finish if task.get("end_date") is not None else None,
+        })
+        task["start_date"] = required_start
+        if task.get("end_date") is not None:
+            task["end_date"] = new_finish
+
+    return shifted
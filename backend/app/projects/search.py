@@ -0,0 +1,151 @@
+# backend/app/projects/search.py
+
+from typing import Any, Dict, List, Optional, Sequence
+from enum import Enum
+import os
+import re
+
+from bson import ObjectId
+
+# Facet alanı -> task alanı; çok değerli alanlar (tags) açılarak sayılır
+SEARCH_FACETS = {
+    "status": "status",
+    "priority": "priority",
+    "assigned_to": "assigned_to",
+    "tags": "tags",
+}
+MULTI_VALUE_FACETS = {"tags"}
+# Değer sayısı sınırsız olabilen facet'lerde en sık görülen bu kadar değer döner
+FACET_VALUE_LIMIT = 20
+BOUNDED_FACETS = {"status", "priority"}
+
+# text index ile aynı dil (app.database.create_indexes); kök bulma varken
+# regex taraması text index'in eşleşmelerini veremez
+SEARCH_LANGUAGE = os.getenv("TASK_SEARCH_LANGUAGE", "none")
+# Tek projede bundan az task varsa metin araması text index yerine projenin
+# tasklarını (project_id index'i) tarar; 0 kapatır
+SEARCH_PROJECT_SCAN_MAX_TASKS = int(os.getenv("SEARCH_PROJECT_SCAN_MAX_TASKS", "20000"))
+# text index ağırlıklarıyla aynı (app.database.create_indexes)
+SEARCH_FIELD_WEIGHTS = {"name": 10, "description": 2}
+# Kelime sınırı olarak sayılan karakterler; \b Mongo'da ASCII dışı harflerde
+# (ö, ş, ...) çalışmadığı için açıkça yazılır
+_TERM_DELIMITERS = r"""[\s\-_.,;:!?()\[\]/"'#]"""
+
+def _value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+def build_search_match(
+    project_ids: Sequence[ObjectId],
+    query: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Arama sorgusunun $match dokümanı
+
+    $text her zaman ilk aşamada olmalıdır; proje ve alan filtreleri text
+    index'inden dönen adaylara uygulanır.
+    """
+    match: Dict[str, Any] = {}
+    if query:
+        match["$text"] = {"$search": query}
+    match["project_id"] = project_ids[0] if len(project_ids) == 1 else {"$in": list(project_ids)}
+    for field, value in (filters or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            values = [_value(v) for v in value]
+            if not values:
+                continue
+            # tags: istenen etiketlerin hepsi bulunmalı
+            match[field] = {"$all": values} if field in MULTI_VALUE_FACETS else {"$in": values}
+        else:
+            match[field] = _value(value)
+    return match
+
+def project_scan_terms(query: str) -> Optional[List[str]]:
+    """Sorgu proje taramasıyla karşılanabiliyorsa arama terimleri, değilse None
+
+    Tırnaklı ifade ve -hariç tutma gibi $text sözdizimi ile kök bulma
+    (TASK_SEARCH_LANGUAGE) sadece text index'te desteklenir.
+    """
+    if SEARCH_LANGUAGE != "none" or '"' in query:
+        return None
+    terms = query.split()
+    if not terms or any(term.startswith("-") for term in terms):
+        return None
+    return list(dict.fromkeys(term.lower() for term in terms))
+
+def _term_pattern(term: str) -> str:
+    return f"(?:^|{_TERM_DELIMITERS}){re.escape(term)}(?=$|{_TERM_DELIMITERS})"
+
+def build_search_pipeline(
+    project_ids: Sequence[ObjectId],
+    query: Optional[str],
+    filters: Optional[Dict[str, Any]],
+    projection: Dict[str, Any],
+    skip: int,
+    limit: int,
+    scan_terms: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Sayfalı sonuçları, toplam sayıyı ve facet sayımlarını tek $facet ile döndüren pipeline
+
+    Metin sorgusu varsa sonuçlar textScore'a, yoksa son güncellemeye göre
+    sıralanır. Facet'ler filtrelenmiş küme üzerinden sayılır.
+
+    scan_terms verilirse (project_scan_terms) text index kullanılmaz: yaygın
+    bir kelime text index'te tüm projelerdeki eşleşmeleri taratırken, küçük
+    bir projede projenin taskları project_id index'iyle taranıp terimler
+    kelime sınırında aranır. Skor, terimin geçtiği alanların ağırlık
+    toplamıdır.
+    """
+    if scan_terms:
+        patterns = [_term_pattern(term) for term in scan_terms]
+        match = build_search_match(project_ids, None, filters)
+        match["$or"] = [
+            {field: {"$regex": pattern, "$options": "i"}}
+            for pattern in patterns for field in SEARCH_FIELD_WEIGHTS
+        ]
+        score = {"$add": [
+            {"$cond": [
+                {"$regexMatch": {"input": {"$ifNull": [f"${field}", ""]}, "regex": pattern, "options": "i"}},
+                weight, 0
+            ]}
+            for pattern in patterns for field, weight in SEARCH_FIELD_WEIGHTS.items()
+        ]}
+        pipeline: List[Dict[str, Any]] = [{"$match": match}, {"$addFields": {"score": score}}]
+        sort = {"score": -1, "_id": 1}
+        projection = {**projection, "score": 1}
+    else:
+        pipeline = [{"$match": build_search_match(project_ids, query, filters)}]
+        if query:
+            sort = {"score": {"$meta": "textScore"}, "_id": 1}
+            projection = {**projection, "score": {"$meta": "textScore"}}
+        else:
+            sort = {"updated_at": -1, "_id": 1}
+
+    facets: Dict[str, List[Dict[str, Any]]] = {
+        "results": [{"$sort": sort}, {"$skip": skip}, {"$limit": limit}, {"$project": projection}],
+        "total": [{"$count": "count"}],
+    }
+    for name, field in SEARCH_FACETS.items():
+        stages: List[Dict[str, Any]] = []
+        if name in MULTI_VALUE_FACETS:
+            stages.append({"$unwind": f"${field}"})
+        stages.append({"$group": {"_id": f"${field}", "count": {"$sum": 1}}})
+        stages.append({"$sort": {"count": -1, "_id": 1}})
+        if name not in BOUNDED_FACETS:
+            stages.append({"$limit": FACET_VALUE_LIMIT})
+        facets[name] = stages
+
+    pipeline.append({"$facet": facets})
+    return pipeline
+
+def parse_search_facets(raw: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """$facet çıktısındaki grupları {facet: [{"value", "count"}]} haline getir"""
+    return {
+        name: [{"value": bucket["_id"], "count": bucket["count"]} for bucket in raw.get(name) or []]
+        for name in SEARCH_FACETS
+    }
+
+def parse_search_total(raw: Dict[str, Any]) -> int:
+    total = raw.get("total") or []
+    return total[0]["count"] if total else 0
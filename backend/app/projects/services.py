@@ -1,34 +1,109 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple
 from bson import ObjectId
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import datetime, date, time, timedelta
+from enum import Enum
+import asyncio
+import copy
+import hashlib
 import logging
+import os
 
-from app.database import get_database
+from app.database import get_database, get_analytics_database
 from app.projects.models import (
     Project, ProjectCreate, ProjectUpdate,
     Task, TaskCreate, TaskUpdate,
-    TaskStatus, TaskType
+    TaskStatus, TaskType, Priority,
+    TaskCounts, ProjectTaskSummary, DashboardSummary,
+    TaskPage, TaskSearchResult, TaskShift, DependentTask, TaskImpact, TaskUpdateResult,
+    ProjectCalendar, ProjectDeletionStatus, ProjectStats,
+    BulkOperationType, TaskBulkRequest, TaskBulkItemResult, TaskBulkResult
 )
+from app.projects.scheduling import compute_schedule, propagate_dates
+from app.projects.deletion import ACTIVE_PROJECT, DELETION_FIELD, project_deletion_worker
+from app.projects.dependencies import (
+    DEPENDENT_FIELDS, check_dependency_cycle, ensure_dependencies_exist, normalize_dependencies,
+    validate_dependencies_in_graph
+)
+from app.projects.events import RESYNC_EVENT, event_broker
+from app.projects.hierarchy import HIERARCHY_FIELDS, build_epic_tree
+from app.projects.search import (
+    SEARCH_PROJECT_SCAN_MAX_TASKS, build_search_pipeline, parse_search_facets, parse_search_total,
+    project_scan_terms
+)
+from app.projects.stats import (
+    STATS_FIELDS, stats_delta, merge_deltas, build_rollup, rollup_pipeline, summarize_rollup
+)
+from app.shared.metrics import instrument_service
+from app.shared.profiling import phase
+from app.shared.response_cache import LOCAL_CACHE_FALLBACK_TTL_SECONDS, ScopedLocalCache, response_cache
+from app.shared.responses import dump_json
+from app.shared.calendar import WorkCalendar
+from app.shared.utils import encode_cursor, decode_cursor, prepare_for_mongo
+from pydantic import ValidationError
+from pymongo import InsertOne, UpdateOne, DeleteOne, ReturnDocument
+from pymongo.errors import BulkWriteError
 
 logger = logging.getLogger(__name__)
 
+# (project_id, user_email) -> erişim var mı; TaskService'in her çağrıda projects sorgusu yapmasını önler.
+# Kayıtlar access:<project_id> versiyonuna bağlıdır; invalidate tüm worker'lara ulaşır.
+project_access_cache = ScopedLocalCache(
+    response_cache,
+    maxsize=int(os.getenv("PROJECT_ACCESS_CACHE_SIZE", "4096")),
+    ttl=float(os.getenv("PROJECT_ACCESS_CACHE_TTL_SECONDS", "30")),
+    fallback_ttl=LOCAL_CACHE_FALLBACK_TTL_SECONDS,
+)
+
+async def invalidate_project_access(project_id: str) -> None:
+    """Projeye ait tüm erişim kayıtlarını geçersiz kıl"""
+    await project_access_cache.invalidate(f"access:{project_id}")
+
+def project_member_scopes(*projects: Optional[Dict[str, Any]]) -> List[str]:
+    """Proje listeleri etkilenen kullanıcıların (owner + team) cache scope'ları"""
+    scopes = []
+    for project in projects:
+        if project:
+            scopes.append(f"user:{project.get('owner')}")
+            scopes.extend(f"user:{email}" for email in project.get("team_members") or [])
+    return scopes
+
+def build_project_etag(
+    resource: str, project_id: str, updated_at: Optional[datetime], task_revision: int = 0
+) -> str:
+    """Proje gösterimleri için güçlü ETag
+
+    Proje dokümanı sadece updated_at'e, task listesi ve timeline ayrıca
+    task yazımlarında artan task_revision sayacına bağlıdır.
+    """
+    version = f"{resource}:{project_id}:"
+    version += updated_at.isoformat(timespec="milliseconds") if updated_at else ""
+    if resource != "project":
+        version += f":{task_revision}"
+    return f'"{hashlib.blake2b(version.encode(), digest_size=12).hexdigest()}"'
+
+@instrument_service
 class ProjectService:
     def __init__(self):
         self.db = get_database()
+        self.analytics_db = get_analytics_database()
 
     async def create_project(self, project_data: ProjectCreate, owner_email: str) -> Project:
         """Yeni proje oluştur"""
         try:
-            project_dict = project_data.dict()
+            now = datetime.utcnow()
+            project_dict = prepare_for_mongo(project_data.dict())
             project_dict["owner"] = owner_email
-            project_dict["created_at"] = datetime.utcnow()
-            project_dict["updated_at"] = datetime.utcnow()
+            project_dict["created_at"] = now
+            project_dict["updated_at"] = now
             
+            # insert_one yazılan dokümana _id ekler; tekrar okumaya gerek yok
             result = await self.db.projects.insert_one(project_dict)
-            created_project = await self.db.projects.find_one({"_id": result.inserted_id})
+            project_dict["_id"] = result.inserted_id
+            await response_cache.invalidate(*project_member_scopes(project_dict))
             
-            logger.info(f"Project created: {created_project['name']} by {owner_email}")
-            return Project(**created_project)
+            logger.info(f"Project created: {project_dict['name']} by {owner_email}")
+            return Project(**project_dict)
             
         except Exception as e:
             logger.error(f"Error creating project: {e}")
@@ -37,39 +112,191 @@ class ProjectService:
     async def get_user_projects(self, user_email: str, skip: int, limit: int) -> List[Project]:
         """Kullanıcının projelerini getir"""
         try:
-            cursor = self.db.projects.find({
-                "$or": [
-                    {"owner": user_email},
-                    {"team_members": user_email}
+            async def load() -> List[Dict[str, Any]]:
+                cursor = self.db.projects.find({
+                    "$or": [
+                        {"owner": user_email},
+                        {"team_members": user_email}
+                    ],
+                    **ACTIVE_PROJECT
+                }).sort("updated_at", -1).skip(skip).limit(limit)
+                
+                return [
+                    Project(**project_data).model_dump(by_alias=True)
+                    async for project_data in cursor
                 ]
-            }).sort("updated_at", -1).skip(skip).limit(limit)
-            
-            projects = []
-            async for project_data in cursor:
-                projects.append(Project(**project_data))
             
-            return projects
+            projects = await response_cache.get_or_load(
+                "projects", [f"user:{user_email}"], [skip, limit], load
+            )
+            return [Project(**project_data) for project_data in projects]
             
         except Exception as e:
             logger.error(f"Error getting user projects: {e}")
             raise
 
+    async def get_dashboard_summary(self, user_email: str, recent_limit: int = 5) -> DashboardSummary:
+        """Kullanıcının tüm projeleri için task özetini tek aggregation ile getir"""
+        try:
+            projects_cursor = self.db.projects.find(
+                {
+                    "$or": [
+                        {"owner": user_email},
+                        {"team_members": user_email}
+                    ],
+                    **ACTIVE_PROJECT
+                },
+                {"name": 1, "status": 1}
+            ).sort("updated_at", -1)
+
+            summaries: Dict[ObjectId, ProjectTaskSummary] = {}
+            async for project_data in projects_cursor:
+                summaries[project_data["_id"]] = ProjectTaskSummary(
+                    project_id=str(project_data["_id"]),
+                    name=project_data["name"],
+                    status=project_data.get("status", TaskStatus.NOT_STARTED),
+                )
+
+            if not summaries:
+                return DashboardSummary()
+
+            today = datetime.combine(date.today(), time.min)
+            pipeline = [
+                {"$match": {"project_id": {"$in": list(summaries.keys())}}},
+                {"$facet": {
+                    "by_status": [
+                        {"$group": {"_id": {"project_id": "$project_id", "key": "$status"}, "count": {"$sum": 1}}}
+                    ],
+                    "by_type": [
+                        {"$group": {"_id": {"project_id": "$project_id", "key": "$task_type"}, "count": {"$sum": 1}}}
+                    ],
+                    "by_priority": [
+                        {"$group": {"_id": {"project_id": "$project_id", "key": "$priority"}, "count": {"$sum": 1}}}
+                    ],
+                    "overdue": [
+                        {"$match": {
+                            "end_date": {"$lt": today},
+                            "status": {"$nin": [TaskStatus.COMPLETED.value, TaskStatus.CANCELLED.value]}
+                        }},
+                        {"$group": {"_id": "$project_id", "count": {"$sum": 1}}}
+                    ],
+                    "recent": [
+                        {"$sort": {"created_at": -1}},
+                        {"$limit": recent_limit}
+                    ],
+                }},
+            ]
+
+            facets = {}
+            async for result in self.analytics_db.tasks.aggregate(pipeline):
+                facets = result
+
+            totals = TaskCounts()
+            for facet_name in ("by_status", "by_type", "by_priority"):
+                for row in facets.get(facet_name, []):
+                    summary = summaries.get(row["_id"]["project_id"])
+                    if summary is None:
+                        continue
+                    key = row["_id"]["key"]
+                    key = key.value if isinstance(key, Enum) else str(key)
+                    getattr(summary, facet_name)[key] = row["count"]
+                    total_counts = getattr(totals, facet_name)
+                    total_counts[key] = total_counts.get(key, 0) + row["count"]
+                    if facet_name == "by_status":
+                        summary.total_tasks += row["count"]
+                        totals.total_tasks += row["count"]
+
+            for row in facets.get("overdue", []):
+                summary = summaries.get(row["_id"])
+                if summary is not None:
+                    summary.overdue_tasks = row["count"]
+                    totals.overdue_tasks += row["count"]
+
+            return DashboardSummary(
+                projects=list(summaries.values()),
+                totals=totals,
+                recent_tasks=[Task(**task_data) for task_data in facets.get("recent", [])],
+            )
+
+        except Exception as e:
+            logger.error(f"Error getting dashboard summary: {e}")
+            raise
+
+    async def has_project_access(self, project_id: str, user_email: str) -> bool:
+        """Kullanıcının projeye erişimi var mı (owner veya team member)"""
+        if not ObjectId.is_valid(project_id):
+            return False
+
+        async def load() -> Optional[bool]:
+            try:
+                with phase("access_check"):
+                    project_data = await self.db.projects.find_one(
+                        {
+                            "_id": ObjectId(project_id),
+                            "$or": [
+                                {"owner": user_email},
+                                {"team_members": user_email}
+                            ],
+                            **ACTIVE_PROJECT
+                        },
+                        {"_id": 1}
+                    )
+            except Exception as e:
+                logger.error(f"Error checking project access: {e}")
+                return None  # Hata sonucu cache'lenmez
+            return project_data is not None
+
+        return bool(await project_access_cache.get_or_load(
+            f"access:{project_id}", (project_id, user_email), load
+        ))
+
+    async def get_project_etag(self, project_id: str, user_email: str, resource: str) -> Optional[str]:
+        """Projenin güncel ETag'ini erişim kontrolüyle birlikte tek projeksiyonlu okumayla üret
+
+        Erişim yoksa None döner. resource: "project", "tasks" veya "timeline".
+        """
+        if not ObjectId.is_valid(project_id):
+            return None
+        try:
+            with phase("access_check"):
+                project_data = await self.db.projects.find_one(
+                    {
+                        "_id": ObjectId(project_id),
+                        "$or": [
+                            {"owner": user_email},
+                            {"team_members": user_email}
+                        ],
+                        **ACTIVE_PROJECT
+                    },
+                    {"updated_at": 1, "task_revision": 1}
+                )
+        except Exception as e:
+            logger.error(f"Error reading project etag: {e}")
+            return None
+        if not project_data:
+            return None
+        return build_project_etag(
+            resource, project_id, project_data.get("updated_at"), project_data.get("task_revision", 0)
+        )
+
     async def get_project_by_id(self, project_id: str, user_email: str) -> Optional[Project]:
         """ID ile proje getir"""
         try:
-            if not ObjectId.is_valid(project_id):
+            if not await self.has_project_access(project_id, user_email):
                 return None
                 
-            project_data = await self.db.projects.find_one({
-                "_id": ObjectId(project_id),
-                "$or": [
-                    {"owner": user_email},
-                    {"team_members": user_email}
-                ]
-            })
+            async def load() -> Optional[Dict[str, Any]]:
+                with phase("query"):
+                    project_data = await self.db.projects.find_one({"_id": ObjectId(project_id)})
+                with phase("model_build"):
+                    return Project(**project_data).model_dump(by_alias=True) if project_data else None
             
+            project_data = await response_cache.get_or_load(
+                "project", [f"project:{project_id}"], [], load
+            )
             if project_data:
-                return Project(**project_data)
+                with phase("model_build"):
+                    return Project(**project_data)
             return None
             
         except Exception as e:
@@ -82,76 +309,268 @@ class ProjectService:
             if not ObjectId.is_valid(project_id):
                 return None
                 
-            update_data = {k: v for k, v in project_data.dict().items() if v is not None}
+            update_data = prepare_for_mongo({k: v for k, v in project_data.dict().items() if v is not None})
             if not update_data:
                 return await self.get_project_by_id(project_id, user_email)
                 
             update_data["updated_at"] = datetime.utcnow()
             
-            result = await self.db.projects.update_one(
+            # Önceki hal, çıkarılan üyelerin proje listesi cache'ini de geçersiz kılmak için alınır
+            previous_project = await self.db.projects.find_one_and_update(
                 {
                     "_id": ObjectId(project_id),
-                    "owner": user_email  # Sadece sahip güncelleyebilir
+                    "owner": user_email,  # Sadece sahip güncelleyebilir
+                    **ACTIVE_PROJECT
                 },
-                {"$set": update_data}
+                {"$set": update_data},
+                return_document=ReturnDocument.BEFORE
             )
             
-            if result.modified_count:
+            if previous_project:
+                updated_project = {**previous_project, **update_data}
+                if "team_members" in update_data:
+                    await invalidate_project_access(project_id)
+                await response_cache.invalidate(
+                    f"project:{project_id}",
+                    *project_member_scopes(previous_project, updated_project)
+                )
+                event_broker.publish_local(project_id, "project.updated", fields=update_data)
                 logger.info(f"Project updated: {project_id} by {user_email}")
-                return await self.get_project_by_id(project_id, user_email)
+                return Project(**updated_project)
             return None
             
         except Exception as e:
             logger.error(f"Error updating project: {e}")
             return None
 
-    async def delete_project(self, project_id: str, user_email: str) -> bool:
-        """Proje sil"""
+    async def get_project_calendar(self, project_id: str, user_email: str) -> Optional[ProjectCalendar]:
+        """Projenin çalışma takvimini getir (tanımlı değilse varsayılan)"""
+        project = await self.get_project_by_id(project_id, user_email)
+        if not project:
+            return None
+        return ProjectCalendar(**(project.settings.get("calendar") or {}))
+
+    async def update_project_calendar(
+        self, project_id: str, calendar: ProjectCalendar, user_email: str
+    ) -> Optional[ProjectCalendar]:
+        """Projenin çalışma takvimini güncelle (sadece sahip)"""
         try:
             if not ObjectId.is_valid(project_id):
-                return False
-                
-            # Önce proje ile ilişkili taskları sil
-            await self.db.tasks.delete_many({"project_id": ObjectId(project_id)})
-            
-            result = await self.db.projects.delete_one({
-                "_id": ObjectId(project_id),
-                "owner": user_email
-            })
-            
-            if result.deleted_count > 0:
-                logger.info(f"Project deleted: {project_id} by {user_email}")
-                return True
-            return False
-            
+                return None
+
+            project_data = await self.db.projects.find_one_and_update(
+                {"_id": ObjectId(project_id), "owner": user_email, **ACTIVE_PROJECT},
+                {"$set": {
+                    "settings.calendar": calendar.model_dump(mode="json"),
+                    "updated_at": datetime.utcnow()
+                }},
+                projection={"owner": 1, "team_members": 1}
+            )
+            if not project_data:
+                return None
+            # Proje listeleri de settings'i içerir
+            await response_cache.invalidate(f"project:{project_id}", *project_member_scopes(project_data))
+            event_broker.publish_local(
+                project_id, "project.updated", fields={"settings.calendar": calendar.model_dump(mode="json")}
+            )
+
+            logger.info(f"Project calendar updated: {project_id} by {user_email}")
+            return calendar
+
+        except Exception as e:
+            logger.error(f"Error updating project calendar: {e}")
+            raise
+
+    async def delete_project(self, project_id: str, user_email: str) -> Optional[ProjectDeletionStatus]:
+        """Projeyi silinmek üzere işaretle; tasklar arka planda temizlenir
+
+        Sadece sahip silebilir. Proje işaretlendiği anda listelerden ve
+        erişim kontrollerinden düşer. Zaten silinmekte olan proje için
+        mevcut ilerleme döner.
+        """
+        try:
+            if not ObjectId.is_valid(project_id):
+                return None
+
+            now = datetime.utcnow()
+            marked_project = await self.db.projects.find_one_and_update(
+                {"_id": ObjectId(project_id), "owner": user_email, **ACTIVE_PROJECT},
+                {"$set": {DELETION_FIELD: {
+                    "requested_by": user_email,
+                    "requested_at": now,
+                    "deleted_tasks": 0,
+                    "updated_at": now,
+                    "lease_until": now,  # İlk boştaki worker üstlenir
+                }}},
+                projection={"owner": 1, "team_members": 1, DELETION_FIELD: 1},
+                return_document=ReturnDocument.AFTER
+            )
+
+            if marked_project:
+                await invalidate_project_access(project_id)
+                await response_cache.invalidate(
+                    f"project:{project_id}", f"tasks:{project_id}",
+                    *project_member_scopes(marked_project)
+                )
+                event_broker.publish_local(project_id, "project.deleted")
+                logger.info(f"Project marked for deletion: {project_id} by {user_email}")
+                project_deletion_worker.schedule(project_id)
+                return ProjectDeletionStatus(project_id=project_id, **marked_project[DELETION_FIELD])
+
+            # Tekrarlanan istek: devam eden silmenin durumu
+            return await self.get_project_deletion_status(project_id, user_email)
+
         except Exception as e:
             logger.error(f"Error deleting project: {e}")
-            return False
+            raise
+
+    async def get_project_deletion_status(
+        self, project_id: str, user_email: str
+    ) -> Optional[ProjectDeletionStatus]:
+        """Silinmekte olan projenin ilerlemesi (sadece sahip)
+
+        Tasklar silindikten sonra grace süresince "completed" döner; proje
+        dokümanı da silinince None.
+        """
+        if not ObjectId.is_valid(project_id):
+            return None
+        project_data = await self.db.projects.find_one(
+            {"_id": ObjectId(project_id), "owner": user_email, DELETION_FIELD: {"$exists": True}},
+            {DELETION_FIELD: 1}
+        )
+        if not project_data:
+            return None
+        return ProjectDeletionStatus(project_id=project_id, **project_data[DELETION_FIELD])
+
+# Rollup yeniden hesaplanırken araya task yazımı girerse en fazla bu kadar denenir
+STATS_REBUILD_ATTEMPTS = 3
+# Devam eden task yazımı varken rollup yeniden hesaplanmadan önce beklenecek süre
+STATS_REBUILD_RETRY_SECONDS = 0.05
+
+# Bağımlılık güncellemeleri proje başına bu kilitle sıraya girer (projects.dependency_lock);
+# kilit sahibi çökerse lease süresi dolunca serbest kalır
+DEPENDENCY_LOCK_FIELD = "dependency_lock"
+DEPENDENCY_LOCK_SECONDS = 10
+DEPENDENCY_LOCK_ATTEMPTS = 40
+DEPENDENCY_LOCK_RETRY_SECONDS = 0.05
+
+class DependencyLockBusyError(Exception):
+    """Projenin bağımlılık kilidi alınamadığında ya da lease kaybedildiğinde fırlatılır
+
+    İstek geçersiz değildir; aynı istek biraz sonra tekrar denenebilir.
+    """
+
+# fields= ile seçilebilecek task alanları (_id her zaman döner)
+TASK_PROJECTION_FIELDS = set(Task.model_fields) - {"id"}
+TASK_DATE_FIELDS = ("start_date", "end_date")
+
+# Çizelgeleme için gereken task alanları
+SCHEDULE_FIELDS = {
+    "name": 1, "task_type": 1, "status": 1, "start_date": 1, "end_date": 1,
+    "duration_days": 1, "dependencies": 1
+}
+
+# Bu alanlardan biri değişince successor tarihleri yeniden yayılır
+RESCHEDULE_TRIGGER_FIELDS = {"start_date", "end_date", "duration_days", "dependencies"}
+
+# Tek yazımda bundan fazla task değişirse abonelere tek tek olay yerine resync gönderilir
+EVENT_BATCH_LIMIT = int(os.getenv("PROJECT_EVENTS_BATCH_LIMIT", "100"))
 
+# Export sırasında Mongo'dan tek seferde çekilecek doküman sayısı
+EXPORT_BATCH_SIZE = 1000
+# Export çıktısı bu boyuta ulaşınca istemciye gönderilir
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+def normalize_task_document(task_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Ham task dokümanını Task çıktısıyla aynı şekle getir"""
+    if "_id" in task_data:
+        task_data["_id"] = str(task_data["_id"])
+    if "project_id" in task_data:
+        task_data["project_id"] = str(task_data["project_id"])
+    for field in TASK_DATE_FIELDS:
+        value = task_data.get(field)
+        if isinstance(value, datetime):
+            task_data[field] = value.date()
+    return task_data
+
+# Ham dokümanda eksik alanlar için Task modelinin varsayılanları
+TASK_OUTPUT_DEFAULTS = {
+    (field.alias or name): field.get_default(call_default_factory=True)
+    for name, field in Task.model_fields.items()
+    if not field.is_required()
+}
+TASK_OUTPUT_PROJECTION = {(field.alias or name): 1 for name, field in Task.model_fields.items()}
+
+# Timeline için gereken task alanları
+TIMELINE_FIELDS = {
+    "name": 1, "start_date": 1, "end_date": 1, "duration_days": 1, "status": 1,
+    "completion_percentage": 1, "task_type": 1, "dependencies": 1,
+    "assigned_to": 1, "priority": 1
+}
+
+def task_output_document(task_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Ham task dokümanını Pydantic'e uğramadan Task çıktısının dict haline getir
+
+    Task(**doc).model_dump(by_alias=True) ile aynı anahtarları üretir;
+    ObjectId/date dönüşümü tek geçişte yapılır.
+    """
+    output = normalize_task_document(task_data)
+    for key, default in TASK_OUTPUT_DEFAULTS.items():
+        if key not in output:
+            output[key] = copy.copy(default)
+    return output
+
+def build_task_document(project_id: str, task_data: TaskCreate, user_email: str) -> Dict[str, Any]:
+    """TaskCreate'ten Mongo'ya yazılacak task dokümanını oluştur"""
+    now = datetime.utcnow()
+    task_dict = prepare_for_mongo(task_data.dict())
+    task_dict["project_id"] = ObjectId(project_id)
+    task_dict["created_by"] = user_email
+    task_dict["created_at"] = now
+    task_dict["updated_at"] = now
+    return task_dict
+
+def build_task_update(task_data: TaskUpdate) -> Dict[str, Any]:
+    """TaskUpdate'ten $set dokümanını oluştur (boşsa {} döner)"""
+    update_data = prepare_for_mongo({k: v for k, v in task_data.dict().items() if v is not None})
+    if update_data:
+        update_data["updated_at"] = datetime.utcnow()
+    return update_data
+
+def format_validation_error(error: ValidationError) -> str:
+    """Pydantic hatasını tek satırlık mesaja çevir"""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in error.errors()
+    )
+
+@instrument_service
 class TaskService:
     def __init__(self):
         self.db = get_database()
+        self.analytics_db = get_analytics_database()
 
     async def create_task(self, project_id: str, task_data: TaskCreate, user_email: str) -> Task:
         """Yeni task oluştur"""
         try:
             # Proje erişim kontrolü
             project_service = ProjectService()
-            project = await project_service.get_project_by_id(project_id, user_email)
-            if not project:
+            if not await project_service.has_project_access(project_id, user_email):
                 raise ValueError("Proje bulunamadı veya erişim yetkiniz yok")
             
-            task_dict = task_data.dict()
-            task_dict["project_id"] = ObjectId(project_id)
-            task_dict["created_by"] = user_email
-            task_dict["created_at"] = datetime.utcnow()
-            task_dict["updated_at"] = datetime.utcnow()
+            task_dict = build_task_document(project_id, task_data, user_email)
+            if task_dict.get("dependencies"):
+                task_dict["dependencies"] = await self._validate_dependencies(
+                    task_dict["project_id"], None, task_dict["dependencies"]
+                )
             
-            result = await self.db.tasks.insert_one(task_dict)
-            created_task = await self.db.tasks.find_one({"_id": result.inserted_id})
+            async with self._task_write(task_dict["project_id"]) as delta:
+                result = await self.db.tasks.insert_one(task_dict)
+                task_dict["_id"] = result.inserted_id
+                merge_deltas(delta, stats_delta(None, task_dict))
+            self._publish_task_events(project_id, [("task.created", task_dict, None)])
             
-            logger.info(f"Task created: {created_task['name']} in project {project_id} by {user_email}")
-            return Task(**created_task)
+            logger.info(f"Task created: {task_dict['name']} in project {project_id} by {user_email}")
+            return Task(**task_dict)
             
         except ValueError:
             raise
@@ -167,30 +586,237 @@ class TaskService:
         status: Optional[TaskStatus] = None
     ) -> List[Task]:
         """Proje tasklarını getir"""
+        documents = await self.get_project_task_documents(project_id, user_email, task_type, status)
+        with phase("model_build"):
+            return [Task(**task_data) for task_data in documents]
+
+    async def get_project_task_documents(
+        self,
+        project_id: str,
+        user_email: str,
+        task_type: Optional[TaskType] = None,
+        status: Optional[TaskStatus] = None
+    ) -> List[Dict[str, Any]]:
+        """Proje tasklarını model doğrulaması olmadan çıktı dict'leri olarak getir"""
         try:
-            # Proje erişim kontrolü
             project_service = ProjectService()
-            project = await project_service.get_project_by_id(project_id, user_email)
-            if not project:
+            if not await project_service.has_project_access(project_id, user_email):
                 return []
-            
-            filter_dict = {"project_id": ObjectId(project_id)}
+
+            async def load() -> List[Dict[str, Any]]:
+                filter_dict = {"project_id": ObjectId(project_id)}
+                if task_type:
+                    filter_dict["task_type"] = task_type
+                if status:
+                    filter_dict["status"] = status
+
+                with phase("query"):
+                    documents = await self.db.tasks.find(
+                        filter_dict, TASK_OUTPUT_PROJECTION
+                    ).sort("created_at", 1).to_list(length=None)
+                with phase("model_build"):
+                    return [task_output_document(task_data) for task_data in documents]
+
+            return await response_cache.get_or_load(
+                "tasks", [f"tasks:{project_id}"],
+                [getattr(task_type, "value", task_type), getattr(status, "value", status)],
+                load
+            )
+
+        except Exception as e:
+            logger.error(f"Error getting project task documents: {e}")
+            return []
+
+    async def get_project_tasks_page(
+        self,
+        project_id: str,
+        user_email: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        task_type: Optional[TaskType] = None,
+        status: Optional[TaskStatus] = None
+    ) -> Optional[TaskPage]:
+        """Proje tasklarını (created_at, _id) keyset pagination ile getir"""
+        projection = None
+        fields = [field for field in fields or [] if field not in ("id", "_id")]
+        if fields:
+            unknown_fields = set(fields) - TASK_PROJECTION_FIELDS
+            if unknown_fields:
+                raise ValueError(f"Geçersiz alan: {', '.join(sorted(unknown_fields))}")
+            projection = {field: 1 for field in fields}
+            projection["created_at"] = 1  # Cursor için gerekli
+
+        filter_dict: Dict[str, Any] = {}
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            filter_dict["$or"] = [
+                {"created_at": {"$gt": cursor_created_at}},
+                {"created_at": cursor_created_at, "_id": {"$gt": cursor_id}}
+            ]
+
+        try:
+            project_service = ProjectService()
+            if not await project_service.has_project_access(project_id, user_email):
+                return None
+
+            filter_dict["project_id"] = ObjectId(project_id)
             if task_type:
                 filter_dict["task_type"] = task_type
             if status:
                 filter_dict["status"] = status
-            
-            cursor = self.db.tasks.find(filter_dict).sort("created_at", 1)
-            
-            tasks = []
+
+            cursor_query = self.db.tasks.find(filter_dict, projection).sort(
+                [("created_at", 1), ("_id", 1)]
+            ).limit(limit + 1)
+
+            documents = await cursor_query.to_list(length=limit + 1)
+            has_next = len(documents) > limit
+            documents = documents[:limit]
+
+            next_cursor = None
+            if has_next:
+                last = documents[-1]
+                next_cursor = encode_cursor(last["created_at"], last["_id"])
+
+            if projection is None:
+                items = [Task(**task_data).model_dump(by_alias=True) for task_data in documents]
+            else:
+                items = []
+                for task_data in documents:
+                    if "created_at" not in fields:
+                        task_data.pop("created_at", None)
+                    items.append(normalize_task_document(task_data))
+
+            return TaskPage(items=items, next_cursor=next_cursor, limit=limit)
+
+        except Exception as e:
+            logger.error(f"Error getting project tasks page: {e}")
+            raise
+
+    async def search_tasks(
+        self,
+        user_email: str,
+        query: Optional[str] = None,
+        project_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Optional[TaskSearchResult]:
+        """Task'larda metin araması; sonuçlar, toplam ve facet sayımları tek aggregate ile
+
+        project_id verilmezse kullanıcının erişebildiği tüm projelerde aranır.
+        Erişim yoksa (tek proje) None döner. Küçük bir projede metin sorgusu
+        text index yerine projenin taranmasıyla karşılanır (_project_scan_terms).
+        """
+        try:
+            scan_terms = None
+            if project_id is not None:
+                if not await ProjectService().has_project_access(project_id, user_email):
+                    return None
+                project_ids = [ObjectId(project_id)]
+                if query:
+                    scan_terms = await self._project_scan_terms(project_ids[0], query)
+            else:
+                project_ids = [
+                    project_data["_id"]
+                    async for project_data in self.db.projects.find(
+                        {"$or": [{"owner": user_email}, {"team_members": user_email}], **ACTIVE_PROJECT},
+                        {"_id": 1}
+                    )
+                ]
+                if not project_ids:
+                    return TaskSearchResult(skip=skip, limit=limit, facets=parse_search_facets({}))
+
+            pipeline = build_search_pipeline(
+                project_ids, query, filters, TASK_OUTPUT_PROJECTION, skip, limit, scan_terms
+            )
+            raw = (await self.db.tasks.aggregate(pipeline).to_list(length=1) or [{}])[0]
+
+            items = []
+            for task_data in raw.get("results") or []:
+                score = task_data.pop("score", None)
+                item = task_output_document(task_data)
+                if score is not None:
+                    item["score"] = round(score, 4)
+                items.append(item)
+
+            return TaskSearchResult(
+                items=items,
+                total=parse_search_total(raw),
+                skip=skip,
+                limit=limit,
+                facets=parse_search_facets(raw)
+            )
+
+        except Exception as e:
+            logger.error(f"Error searching tasks: {e}")
+            raise
+
+    async def _project_scan_terms(self, project_oid: ObjectId, query: str) -> Optional[List[str]]:
+        """Proje taraması text index'ten ucuzsa sorgunun terimleri, değilse None
+
+        text index yaygın bir kelimede tüm projelerdeki eşleşmeleri inceler;
+        proje boyutu rollup'taki total_tasks'tan okunur, rollup yoksa
+        project_id index'inde sınırlı bir sayımla bulunur.
+        """
+        if SEARCH_PROJECT_SCAN_MAX_TASKS <= 0:
+            return None
+        terms = project_scan_terms(query)
+        if terms is None:
+            return None
+        rollup = await self.db.project_stats.find_one({"_id": project_oid}, {"total_tasks": 1})
+        if rollup is not None:
+            task_count = rollup.get("total_tasks", 0)
+        else:
+            task_count = await self.db.tasks.count_documents(
+                {"project_id": project_oid}, limit=SEARCH_PROJECT_SCAN_MAX_TASKS + 1
+            )
+        return terms if task_count <= SEARCH_PROJECT_SCAN_MAX_TASKS else None
+
+    async def export_project_tasks(self, project_id: str, export_format: str = "ndjson") -> AsyncIterator[bytes]:
+        """Proje tasklarını NDJSON veya JSON dizi olarak parça parça üret
+
+        Erişim kontrolü çağıran tarafından yapılmalıdır.
+        """
+        if export_format == "json":
+            prefix, separator, suffix = b"[", b",", b"]"
+        else:
+            prefix, separator, suffix = b"", b"", b""
+
+        cursor = self.analytics_db.tasks.find(
+            {"project_id": ObjectId(project_id)},
+            batch_size=EXPORT_BATCH_SIZE
+        ).sort([("created_at", 1), ("_id", 1)])
+
+        buffer = bytearray(prefix)
+        first = True
+        count = 0
+        try:
             async for task_data in cursor:
-                tasks.append(Task(**task_data))
-            
-            return tasks
-            
+                if not first:
+                    buffer += separator
+                first = False
+                # Liste endpoint'leriyle aynı encoder (FastJSONResponse)
+                buffer += dump_json(normalize_task_document(task_data))
+                if export_format != "json":
+                    buffer += b"\n"
+                count += 1
+
+                if len(buffer) >= EXPORT_CHUNK_BYTES:
+                    yield bytes(buffer)
+                    buffer.clear()
+
+            buffer += suffix
+            if buffer:
+                yield bytes(buffer)
+            logger.info(f"Exported {count} tasks from project {project_id}")
+
         except Exception as e:
-            logger.error(f"Error getting project tasks: {e}")
-            return []
+            logger.error(f"Error exporting project tasks: {e}")
+            raise
+        finally:
+            await cursor.close()
 
     async def get_task_by_id(self, project_id: str, task_id: str, user_email: str) -> Optional[Task]:
         """ID ile task getir"""
@@ -200,8 +826,7 @@ class TaskService:
                 
             # Proje erişim kontrolü
             project_service = ProjectService()
-            project = await project_service.get_project_by_id(project_id, user_email)
-            if not project:
+            if not await project_service.has_project_access(project_id, user_email):
                 return None
             
             task_data = await self.db.tasks.find_one({
@@ -223,40 +848,270 @@ class TaskService:
         task_id: str, 
         task_data: TaskUpdate, 
         user_email: str
-    ) -> Optional[Task]:
-        """Task güncelle"""
+    ) -> Optional[TaskUpdateResult]:
+        """Task güncelle
+
+        None sadece task bulunamadığında ya da erişim yoksa döner; doğrulama
+        hataları ValueError fırlatır. Yazım commit edildikten sonraki
+        adımların hataları bu ikisine dönüşmez: successor kaydırma hatası
+        loglanıp boş shifted_tasks döner.
+        """
+        if not ObjectId.is_valid(task_id) or not ObjectId.is_valid(project_id):
+            return None
+
+        # Proje erişim kontrolü
+        project_service = ProjectService()
+        if not await project_service.has_project_access(project_id, user_email):
+            return None
+
+        task_filter = {
+            "_id": ObjectId(task_id),
+            "project_id": ObjectId(project_id)
+        }
+        update_data = build_task_update(task_data)
+        if not update_data:
+            task_doc = await self.db.tasks.find_one(task_filter)
+            return TaskUpdateResult(**task_doc) if task_doc else None
+
+        lock_token = None
+        if "dependencies" in update_data:
+            lock_token = await self._acquire_dependency_lock(task_filter["project_id"])
         try:
-            if not ObjectId.is_valid(task_id) or not ObjectId.is_valid(project_id):
-                return None
-                
-            # Proje erişim kontrolü
-            project_service = ProjectService()
-            project = await project_service.get_project_by_id(project_id, user_email)
-            if not project:
-                return None
-            
-            update_data = {k: v for k, v in task_data.dict().items() if v is not None}
-            if not update_data:
-                return await self.get_task_by_id(project_id, task_id, user_email)
-                
-            update_data["updated_at"] = datetime.utcnow()
-            
-            result = await self.db.tasks.update_one(
+            if lock_token is not None:
+                update_data["dependencies"] = await self._validate_dependencies(
+                    task_filter["project_id"], task_id, update_data["dependencies"]
+                )
+                await self._renew_dependency_lock(task_filter["project_id"], lock_token)
+
+            # Rollup farkı için önceki hali döndürülür; sonraki hal $set'ten türetilir
+            async with self._task_write(task_filter["project_id"]) as delta:
+                previous_task = await self.db.tasks.find_one_and_update(
+                    task_filter,
+                    {"$set": update_data},
+                    return_document=ReturnDocument.BEFORE
+                )
+                if previous_task:
+                    updated_task = {**previous_task, **update_data}
+                    merge_deltas(delta, stats_delta(previous_task, updated_task))
+        finally:
+            if lock_token is not None:
+                await self._release_dependency_lock(task_filter["project_id"], lock_token)
+        if not previous_task:
+            return None
+
+        # Buradan sonrası commit edilmiş bir yazımın devamı
+        self._publish_task_events(project_id, [("task.updated", updated_task, update_data)])
+        logger.info(f"Task updated: {task_id} in project {project_id} by {user_email}")
+
+        shifted_tasks: List[TaskShift] = []
+        if RESCHEDULE_TRIGGER_FIELDS & update_data.keys():
+            try:
+                shifted_tasks = await self._reschedule_successors(updated_task)
+            except Exception as e:
+                logger.error(f"Error rescheduling successors of task {task_id}: {e}")
+
+        try:
+            return TaskUpdateResult(**updated_task, shifted_tasks=shifted_tasks)
+        except ValidationError as e:
+            # ValidationError bir ValueError'dır; başarılı yazım 400 olarak dönmemeli
+            raise RuntimeError(f"Updated task {task_id} could not be serialized: {e}") from e
+
+    async def _load_downstream(
+        self, project_oid: ObjectId, root_id: str, projection: Dict[str, int]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+        """root_id'ye doğrudan ya da dolaylı bağımlı task'ları seviye seviye yükle
+
+        Her seviye (project_id, dependencies) multikey index'i üzerinden tek
+        sorgudur. (id -> doküman, id -> derinlik) döner; derinlik 1 doğrudan
+        successor'dır. Verideki eski döngüler ziyaret kontrolüyle kesilir.
+        """
+        tasks: Dict[str, Dict[str, Any]] = {}
+        depths: Dict[str, int] = {}
+        frontier = [root_id]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            async for task_data in self.db.tasks.find(
+                {"project_id": project_oid, "dependencies": {"$in": frontier}},
+                projection
+            ):
+                task_key = str(task_data["_id"])
+                if task_key != root_id and task_key not in tasks:
+                    tasks[task_key] = task_data
+                    depths[task_key] = depth
+                    next_frontier.append(task_key)
+            frontier = next_frontier
+        return tasks, depths
+
+    async def _validate_dependencies(
+        self, project_oid: ObjectId, task_id: Optional[str], dependencies: List[str]
+    ) -> List[str]:
+        """Bağımlılıkların projede var olduğunu ve döngü oluşturmadığını doğrula
+
+        Normalize edilmiş listeyi döndürür; hata durumunda ValueError fırlatır.
+        Yeni task'ın successor'ı olamayacağı için döngü kontrolü sadece
+        güncellemede, task'ın downstream alt grafı üzerinde yapılır.
+
+        Kontrol ile yazım atomik değildir: aynı anda A'yı B'ye ve B'yi A'ya
+        bağlayan iki güncelleme ayrı ayrı geçerli görünür. Güncellemelerde
+        doğrulama ve yazım bu yüzden _acquire_dependency_lock altında
+        yapılmalıdır.
+        """
+        dependencies = normalize_dependencies(task_id, dependencies)
+        if not dependencies:
+            return dependencies
+
+        existing = [
+            str(task_data["_id"])
+            async for task_data in self.db.tasks.find(
+                {"project_id": project_oid, "_id": {"$in": [ObjectId(d) for d in dependencies]}},
+                {"_id": 1}
+            )
+        ]
+        ensure_dependencies_exist(dependencies, existing)
+
+        if task_id is not None:
+            downstream, _ = await self._load_downstream(project_oid, task_id, {"dependencies": 1})
+            graph = {key: task_data.get("dependencies") or [] for key, task_data in downstream.items()}
+            check_dependency_cycle(graph, task_id, dependencies)
+        return dependencies
+
+    async def _acquire_dependency_lock(self, project_oid: ObjectId) -> ObjectId:
+        """Projenin bağımlılık kilidini al; alınamazsa DependencyLockBusyError
+
+        Döngü kontrolü ile yazım arasında başka bir bağımlılık güncellemesi
+        araya girmesin diye aynı projedeki bağımlılık güncellemeleri sıraya
+        sokulur. Kilit lease'lidir: sahibi bırakamadan düşerse
+        DEPENDENCY_LOCK_SECONDS sonra başkası alabilir; uzun süren sahipler
+        her aşamadan sonra _renew_dependency_lock ile lease'i uzatır.
+        """
+        token = ObjectId()
+        for _ in range(DEPENDENCY_LOCK_ATTEMPTS):
+            now = datetime.utcnow()
+            result = await self.db.projects.update_one(
                 {
-                    "_id": ObjectId(task_id),
-                    "project_id": ObjectId(project_id)
+                    "_id": project_oid,
+                    "$or": [
+                        {DEPENDENCY_LOCK_FIELD: {"$exists": False}},
+                        {f"{DEPENDENCY_LOCK_FIELD}.until": {"$lte": now}},
+                    ],
                 },
-                {"$set": update_data}
+                {"$set": {DEPENDENCY_LOCK_FIELD: {
+                    "token": token, "until": now + timedelta(seconds=DEPENDENCY_LOCK_SECONDS)
+                }}}
             )
-            
             if result.modified_count:
-                logger.info(f"Task updated: {task_id} in project {project_id} by {user_email}")
-                return await self.get_task_by_id(project_id, task_id, user_email)
-            return None
-            
+                return token
+            await asyncio.sleep(DEPENDENCY_LOCK_RETRY_SECONDS)
+        raise DependencyLockBusyError("Proje bağımlılıkları başka bir işlemle güncelleniyor, tekrar deneyin")
+
+    async def _renew_dependency_lock(self, project_oid: ObjectId, token: ObjectId) -> None:
+        """Kilidin lease'ini DEPENDENCY_LOCK_SECONDS uzat; kilit elden gittiyse DependencyLockBusyError
+
+        Lease dolup kilidi başka bir işlem aldıysa o işlemin doğrulaması bu
+        işlemin yazımını görmez; yazıma geçilmeden iptal edilir.
+        """
+        result = await self.db.projects.update_one(
+            {"_id": project_oid, f"{DEPENDENCY_LOCK_FIELD}.token": token},
+            {"$set": {
+                f"{DEPENDENCY_LOCK_FIELD}.until": datetime.utcnow() + timedelta(seconds=DEPENDENCY_LOCK_SECONDS)
+            }}
+        )
+        if not result.matched_count:
+            logger.warning(f"Dependency lock lease of project {project_oid} expired before the write")
+            raise DependencyLockBusyError("Proje bağımlılık kilidinin süresi doldu, tekrar deneyin")
+
+    async def _release_dependency_lock(self, project_oid: ObjectId, token: ObjectId) -> None:
+        try:
+            await self.db.projects.update_one(
+                {"_id": project_oid, f"{DEPENDENCY_LOCK_FIELD}.token": token},
+                {"$unset": {DEPENDENCY_LOCK_FIELD: ""}}
+            )
         except Exception as e:
-            logger.error(f"Error updating task: {e}")
-            return None
+            # Lease dolunca kilit kendiliğinden serbest kalır
+            logger.warning(f"Error releasing dependency lock of project {project_oid}: {e}")
+
+    async def _remove_dependency_references(self, project_oid: ObjectId, task_ids: List[str]) -> None:
+        """Silinen task'ları diğer task'ların bağımlılık listelerinden çıkar"""
+        if not task_ids:
+            return
+        dependent_ids = [
+            task_data["_id"]
+            async for task_data in self.db.tasks.find(
+                {"project_id": project_oid, "dependencies": {"$in": task_ids}}, {"_id": 1}
+            )
+        ]
+        if not dependent_ids:
+            return
+        await self.db.tasks.update_many(
+            {"_id": {"$in": dependent_ids}, "project_id": project_oid},
+            {"$pull": {"dependencies": {"$in": task_ids}}, "$set": {"updated_at": datetime.utcnow()}}
+        )
+        self._publish_task_events(str(project_oid), [
+            ("task.updated", {"_id": task_oid}, {"removed_dependencies": task_ids}) for task_oid in dependent_ids
+        ])
+
+    async def _reschedule_successors(self, root_task: Dict[str, Any]) -> List[TaskShift]:
+        """Değişen task'ın downstream successor'larını ileri kaydır ve tek bulk_write ile kaydet
+
+        Sadece etkilenen alt graf yüklenir: her seviye dependencies
+        multikey index'i üzerinden tek sorgudur.
+        """
+        project_oid = root_task["project_id"]
+        root_id = str(root_task["_id"])
+        successors, _ = await self._load_downstream(project_oid, root_id, SCHEDULE_FIELDS)
+        if not successors:
+            return []
+        tasks: Dict[str, Dict[str, Any]] = {root_id: root_task, **successors}
+
+        # Successor'ların alt graf dışındaki predecessor'larının bitiş tarihleri
+        missing = {
+            dep_id
+            for task_data in tasks.values()
+            for dep_id in task_data.get("dependencies") or ()
+            if dep_id not in tasks and ObjectId.is_valid(dep_id)
+        }
+        if missing:
+            async for task_data in self.db.tasks.find(
+                {"project_id": project_oid, "_id": {"$in": [ObjectId(d) for d in missing]}},
+                SCHEDULE_FIELDS
+            ):
+                tasks[str(task_data["_id"])] = task_data
+
+        project_data = await self.db.projects.find_one({"_id": project_oid}, {"settings.calendar": 1})
+        calendar = WorkCalendar.from_settings((project_data or {}).get("settings"))
+
+        shifts = propagate_dates(root_id, tasks, calendar)
+        if not shifts:
+            return []
+
+        now = datetime.utcnow()
+        async with self._task_write(project_oid) as rollup_delta:
+            await self.db.tasks.bulk_write([
+                UpdateOne(
+                    {"_id": ObjectId(shift["id"]), "project_id": project_oid},
+                    {"$set": prepare_for_mongo({
+                        "start_date": shift["start_date"],
+                        "end_date": shift["end_date"],
+                        "updated_at": now,
+                    })}
+                )
+                for shift in shifts
+            ], ordered=False)
+            for shift in shifts:
+                status = tasks[shift["id"]].get("status")
+                merge_deltas(rollup_delta, stats_delta(
+                    {"status": status, "end_date": shift["previous_end_date"]},
+                    {"status": status, "end_date": shift["end_date"]}
+                ))
+        self._publish_task_events(str(project_oid), [
+            ("task.updated", {"_id": shift["id"]}, {"start_date": shift["start_date"], "end_date": shift["end_date"]})
+            for shift in shifts
+        ])
+
+        logger.info(f"Rescheduled {len(shifts)} successors of task {root_id}")
+        return [TaskShift(**shift) for shift in shifts]
 
     async def delete_task(self, project_id: str, task_id: str, user_email: str) -> bool:
         """Task sil"""
@@ -266,16 +1121,23 @@ class TaskService:
                 
             # Proje erişim kontrolü
             project_service = ProjectService()
-            project = await project_service.get_project_by_id(project_id, user_email)
-            if not project:
+            if not await project_service.has_project_access(project_id, user_email):
                 return False
             
-            result = await self.db.tasks.delete_one({
-                "_id": ObjectId(task_id),
-                "project_id": ObjectId(project_id)
-            })
+            async with self._task_write(ObjectId(project_id)) as delta:
+                deleted_task = await self.db.tasks.find_one_and_delete(
+                    {
+                        "_id": ObjectId(task_id),
+                        "project_id": ObjectId(project_id)
+                    },
+                    projection=STATS_FIELDS
+                )
+                if deleted_task:
+                    merge_deltas(delta, stats_delta(deleted_task, None))
             
-            if result.deleted_count > 0:
+            if deleted_task:
+                await self._remove_dependency_references(ObjectId(project_id), [task_id])
+                self._publish_task_events(project_id, [("task.deleted", deleted_task, None)])
                 logger.info(f"Task deleted: {task_id} in project {project_id} by {user_email}")
                 return True
             return False
@@ -284,52 +1146,531 @@ class TaskService:
             logger.error(f"Error deleting task: {e}")
             return False
 
+    async def bulk_write_tasks(
+        self,
+        project_id: str,
+        bulk_request: TaskBulkRequest,
+        user_email: str
+    ) -> Optional[TaskBulkResult]:
+        """Task create/update/delete işlemlerini tek bulk_write ile uygula"""
+        lock_token = None
+        try:
+            if not ObjectId.is_valid(project_id):
+                return None
+
+            # Proje erişim kontrolü (tüm batch için tek sefer)
+            project_service = ProjectService()
+            if not await project_service.has_project_access(project_id, user_email):
+                return None
+
+            project_oid = ObjectId(project_id)
+            operations = bulk_request.operations
+            results: List[TaskBulkItemResult] = [
+                TaskBulkItemResult(index=i, op=operation.op, status="skipped")
+                for i, operation in enumerate(operations)
+            ]
+
+            # Bağımlılık güncelleyen batch'ler graf yüklenmeden yazım bitene kadar
+            # projenin bağımlılık kilidini tutar (_validate_dependencies)
+            if any(
+                "dependencies" in (operation.data or {})
+                for operation in operations if operation.op == BulkOperationType.UPDATE
+            ):
+                lock_token = await self._acquire_dependency_lock(project_oid)
+
+            # Bağımlılık içeren batch'lerde projenin bağımlılık grafı tek sorguyla yüklenir;
+            # varlık ve döngü kontrolleri işlemler sırayla uygulanmış gibi bellekte yapılır
+            dependency_graph: Optional[Dict[str, List[str]]] = None
+            if any(
+                (operation.data or {}).get("dependencies")
+                for operation in operations if operation.op != BulkOperationType.DELETE
+            ):
+                dependency_graph = {
+                    str(task_data["_id"]): task_data.get("dependencies") or []
+                    async for task_data in self.db.tasks.find({"project_id": project_oid}, {"dependencies": 1})
+                }
+                if lock_token is not None:
+                    await self._renew_dependency_lock(project_oid, lock_token)
+
+            # 1) Update/delete hedeflerini tek sorguyla bul; rollup için önceki hallerini al
+            target_ids = [
+                ObjectId(operation.task_id) for operation in operations
+                if operation.op != BulkOperationType.CREATE
+                and operation.task_id and ObjectId.is_valid(operation.task_id)
+            ]
+            current: Dict[ObjectId, Dict[str, Any]] = {}
+            if target_ids:
+                async for task_data in self.db.tasks.find(
+                    {"_id": {"$in": target_ids}, "project_id": project_oid}, STATS_FIELDS
+                ):
+                    current[task_data["_id"]] = task_data
+            # İşlemler sırayla uygulanmış gibi: batch içinde silinen task sonraki işlemlerde yoktur
+            existing_ids = set(current)
+
+            # 2) Doğrulama ve Mongo işlemlerinin hazırlanması
+            prepared = []  # (orijinal index, task ObjectId, pymongo işlemi)
+            created: Dict[int, Dict[str, Any]] = {}  # index -> yeni task dokümanı
+            updates: Dict[int, Dict[str, Any]] = {}  # index -> $set dokümanı
+            for i, operation in enumerate(operations):
+                item = results[i]
+                try:
+                    if operation.op == BulkOperationType.CREATE:
+                        task_dict = build_task_document(
+                            project_id, TaskCreate(**(operation.data or {})), user_email
+                        )
+                        task_dict["_id"] = ObjectId()
+                        if dependency_graph is not None:
+                            task_dict["dependencies"] = validate_dependencies_in_graph(
+                                dependency_graph, None, task_dict.get("dependencies") or []
+                            )
+                            dependency_graph[str(task_dict["_id"])] = task_dict["dependencies"]
+                        created[i] = task_dict
+                        prepared.append((i, task_dict["_id"], InsertOne(task_dict)))
+                        continue
+
+                    if not operation.task_id or not ObjectId.is_valid(operation.task_id):
+                        raise ValueError("Geçersiz task_id")
+                    task_oid = ObjectId(operation.task_id)
+                    task_filter = {"_id": task_oid, "project_id": project_oid}
+                    if task_oid not in existing_ids:
+                        # Bağımlılık grafına dokunmadan önce; sıralı modda ilk hata sayılır
+                        item.status = "not_found"
+                        item.task_id = operation.task_id
+                        if bulk_request.ordered:
+                            break
+                        continue
+
+                    if operation.op == BulkOperationType.UPDATE:
+                        update_data = build_task_update(TaskUpdate(**(operation.data or {})))
+                        if not update_data:
+                            raise ValueError("Güncellenecek alan bulunamadı")
+                        if "dependencies" in update_data and dependency_graph is not None:
+                            update_data["dependencies"] = validate_dependencies_in_graph(
+                                dependency_graph, operation.task_id, update_data["dependencies"]
+                            )
+                        elif "dependencies" in update_data:
+                            update_data["dependencies"] = normalize_dependencies(
+                                operation.task_id, update_data["dependencies"]
+                            )
+                        updates[i] = update_data
+                        prepared.append((i, task_oid, UpdateOne(task_filter, {"$set": update_data})))
+                    else:
+                        if dependency_graph is not None:
+                            dependency_graph.pop(operation.task_id, None)
+                        existing_ids.discard(task_oid)
+                        prepared.append((i, task_oid, DeleteOne(task_filter)))
+
+                except (ValidationError, ValueError) as e:
+                    item.status = "error"
+                    item.task_id = operation.task_id
+                    item.error = format_validation_error(e) if isinstance(e, ValidationError) else str(e)
+                    if bulk_request.ordered:
+                        # Sıralı modda ilk hatadan sonraki işlemler uygulanmaz
+                        break
+
+            write_ops = []  # (orijinal index, pymongo işlemi)
+            for i, task_oid, request in prepared:
+                results[i].task_id = str(task_oid)
+                write_ops.append((i, request))
+
+            # 3) Tek bulk_write
+            summary = TaskBulkResult()
+            if write_ops and lock_token is not None:
+                # Büyük batch'lerde doğrulama lease süresini aşabilir
+                await self._renew_dependency_lock(project_oid, lock_token)
+            if write_ops:
+                # Başarılı işlemlerin rollup farkı tek $inc ile yazılır (_task_write)
+                async with self._task_write(project_oid) as rollup_delta:
+                    failed: Dict[int, str] = {}
+                    try:
+                        write_result = await self.db.tasks.bulk_write(
+                            [request for _, request in write_ops],
+                            ordered=bulk_request.ordered
+                        )
+                        details = write_result.bulk_api_result
+                    except BulkWriteError as e:
+                        details = e.details
+                        for write_error in details.get("writeErrors", []):
+                            failed[write_error["index"]] = write_error.get("errmsg", "Yazma hatası")
+
+                    first_failed = min(failed) if failed else None
+                    for position, (i, _) in enumerate(write_ops):
+                        if position in failed:
+                            results[i].status = "error"
+                            results[i].error = failed[position]
+                        elif bulk_request.ordered and first_failed is not None and position > first_failed:
+                            results[i].status = "skipped"
+                        else:
+                            results[i].status = "ok"
+
+                    # Başarılı işlemleri sırayla uygula
+                    events = []
+                    for i, _ in write_ops:
+                        if results[i].status != "ok":
+                            continue
+                        task_oid = ObjectId(results[i].task_id)
+                        before = current.get(task_oid)
+                        if operations[i].op == BulkOperationType.CREATE:
+                            after = created[i]
+                            events.append(("task.created", after, None))
+                        elif operations[i].op == BulkOperationType.UPDATE:
+                            after = {**before, **updates[i]} if before else None
+                            events.append(("task.updated", {"_id": task_oid}, updates[i]))
+                        else:
+                            after = None
+                            events.append(("task.deleted", {"_id": task_oid}, None))
+                        merge_deltas(rollup_delta, stats_delta(before, after))
+                        current[task_oid] = after
+                await self._remove_dependency_references(project_oid, [
+                    results[i].task_id for i, _ in write_ops
+                    if results[i].status == "ok" and operations[i].op == BulkOperationType.DELETE
+                ])
+                self._publish_task_events(project_id, events)
+
+                summary.inserted_count = details.get("nInserted", 0)
+                summary.modified_count = details.get("nModified", 0)
+                summary.deleted_count = details.get("nRemoved", 0)
+
+            summary.results = results
+            summary.error_count = sum(1 for r in results if r.status == "error")
+
+            logger.info(
+                f"Bulk task write in project {project_id} by {user_email}: "
+                f"{summary.inserted_count} inserted, {summary.modified_count} modified, "
+                f"{summary.deleted_count} deleted, {summary.error_count} errors"
+            )
+            return summary
+
+        except DependencyLockBusyError:
+            raise
+        except Exception as e:
+            logger.error(f"Error in bulk task write: {e}")
+            raise
+        finally:
+            if lock_token is not None:
+                await self._release_dependency_lock(ObjectId(project_id), lock_token)
+
+    @asynccontextmanager
+    async def _task_write(self, project_oid: ObjectId) -> AsyncIterator[Dict[str, float]]:
+        """Task yazımını rollup revizyonlarıyla çevrele
+
+        Yazımdan önce projenin stats_revision ve stats_pending_writes
+        sayaçları artırılır; blok rollup farkını verilen dict'e toplar, çıkışta
+        (hata olsa da) _after_task_write çalışır. refresh_project_stats devam
+        eden yazım varken rollup kaydetmez; yazımın farkı sadece kendi
+        revizyonundan önce hesaplanmış bir rollup'a uygulanır. Böylece
+        aggregation'a girmiş bir yazım ikinci kez sayılmaz.
+        """
+        write_revision = await self._begin_task_write(project_oid)
+        delta: Dict[str, float] = {}
+        try:
+            yield delta
+        finally:
+            await self._after_task_write(project_oid, delta, write_revision)
+
+    async def _begin_task_write(self, project_oid: ObjectId) -> Optional[int]:
+        try:
+            project_data = await self.db.projects.find_one_and_update(
+                {"_id": project_oid},
+                {"$inc": {"stats_revision": 1, "stats_pending_writes": 1}},
+                projection={"stats_revision": 1},
+                return_document=ReturnDocument.AFTER
+            )
+        except Exception as e:
+            logger.warning(f"Error starting task write for project {project_oid}: {e}")
+            return None
+        return project_data["stats_revision"] if project_data else None
+
+    async def _after_task_write(
+        self, project_oid: ObjectId, delta: Dict[str, float], write_revision: Optional[int]
+    ) -> None:
+        """Task yazımı sonrası projenin türetilmiş verilerini güncelle
+
+        Response cache'i (epic ağacı dahil) geçersiz kılınır; ardından projenin
+        task_revision sayacı (task ETag'leri bundan türetilir) artırılıp yazım
+        tamamlandı olarak işaretlenir ve fark, write_revision'dan önce
+        hesaplanmış bir project_stats rollup'ına $inc ile uygulanır. Rollup
+        yoksa oluşturulmaz (sadece farkı içeren doküman tam rollup sanılırdı);
+        ilk okumada baştan hesaplanır. Hata task yazımını bozmaz.
+        """
+        # Cache revizyon artışından önce geçersiz kılınır: yeni ETag'i gören
+        # bir okuma eski cache kaydını alamaz
+        await response_cache.invalidate(f"tasks:{project_oid}")
+        try:
+            increments = {"task_revision": 1}
+            if write_revision is not None:
+                increments["stats_pending_writes"] = -1
+            await self.db.projects.update_one({"_id": project_oid}, {"$inc": increments})
+            if not delta:
+                return
+            if write_revision is None:
+                logger.warning(f"Project stats for {project_oid} may drift until refreshed")
+                return
+            await self.db.project_stats.update_one(
+                {"_id": project_oid, "stats_revision": {"$not": {"$gte": write_revision}}},
+                {"$inc": delta, "$set": {"updated_at": datetime.utcnow()}}
+            )
+        except Exception as e:
+            logger.warning(f"Error updating derived data for project {project_oid}: {e}")
+
+    def _publish_task_events(self, project_id: str, events: List[tuple]) -> None:
+        """Task yazımlarını proje abonelerine yayınla (change stream yoksa)
+
+        events: (olay tipi, task dokümanı, değişen alanlar) listesi. Oluşturulan
+        task'lar tam çıktı dokümanıyla, güncellemeler sadece değişen alanlarla
+        gönderilir; EVENT_BATCH_LIMIT'i aşan yazımlar tek resync olayına dönüşür.
+        """
+        if not events:
+            return
+        if len(events) > EVENT_BATCH_LIMIT:
+            event_broker.publish_local(project_id, RESYNC_EVENT)
+            return
+        for event_type, task_data, fields in events:
+            payload: Dict[str, Any] = {"task_id": str(task_data["_id"])}
+            if event_type == "task.created":
+                payload["task"] = task_output_document(dict(task_data))
+            elif event_type == "task.updated":
+                payload["fields"] = fields
+            event_broker.publish_local(project_id, event_type, **payload)
+
+    async def refresh_project_stats(self, project_oid: ObjectId) -> Dict[str, Any]:
+        """Rollup'ı tasks koleksiyonundan aggregation ile yeniden hesapla ve kaydet
+
+        Kalıcı rollup sonraki $inc farklarının tabanıdır; replikasyon
+        gecikmesi içermemesi için primary'den (self.db) okunur.
+
+        Rollup üretildiği stats_revision'ı saklar (_task_write). Sayaçlar
+        aggregation öncesi, sonrası ve yazımdan sonra okunur; devam eden
+        (başlamış ama farkını uygulamamış) bir yazım varsa ya da araya yazım
+        girdiyse hesaplama tekrarlanır. Son denemede devam eden yazım
+        beklenmez: yarıda düşmüş bir yazımın sayacı rollup'ı kalıcı olarak
+        engellemesin.
+        """
+        for attempt in range(STATS_REBUILD_ATTEMPTS):
+            last_attempt = attempt == STATS_REBUILD_ATTEMPTS - 1
+            revision, pending = await self._stats_revision(project_oid)
+            if pending and not last_attempt:
+                await asyncio.sleep(STATS_REBUILD_RETRY_SECONDS)
+                continue
+            rows: Dict[str, Any] = {}
+            async for result in self.db.tasks.aggregate(rollup_pipeline(project_oid)):
+                rows = result
+
+            rollup = build_rollup(rows)
+            rollup["updated_at"] = datetime.utcnow()
+            rollup["stats_revision"] = revision
+            if await self._stats_revision(project_oid) != (revision, pending):
+                continue
+            await self.db.project_stats.replace_one({"_id": project_oid}, rollup, upsert=True)
+            if (await self._stats_revision(project_oid))[0] == revision and not pending:
+                return rollup
+
+        logger.warning(f"Project stats for {project_oid} rebuilt under concurrent writes; may drift until refreshed")
+        return rollup
+
+    async def _stats_revision(self, project_oid: ObjectId) -> Tuple[int, int]:
+        """(stats_revision, devam eden task yazımı sayısı)"""
+        project_data = await self.db.projects.find_one(
+            {"_id": project_oid}, {"stats_revision": 1, "stats_pending_writes": 1}
+        ) or {}
+        return project_data.get("stats_revision", 0), project_data.get("stats_pending_writes", 0)
+
+    async def get_project_stats(
+        self, project_id: str, user_email: str, refresh: bool = False
+    ) -> Optional[ProjectStats]:
+        """Proje ilerleme istatistiklerini rollup dokümanından tek okumayla getir"""
+        try:
+            project_service = ProjectService()
+            if not await project_service.has_project_access(project_id, user_email):
+                return None
+
+            project_oid = ObjectId(project_id)
+            rollup = None
+            if not refresh:
+                rollup = await self.db.project_stats.find_one({"_id": project_oid})
+            if rollup is None:
+                # İlk istekte (veya istenirse) rollup baştan oluşturulur
+                rollup = await self.refresh_project_stats(project_oid)
+
+            return ProjectStats(project_id=project_id, **summarize_rollup(rollup))
+
+        except Exception as e:
+            logger.error(f"Error getting project stats: {e}")
+            raise
+
+    async def get_task_dependents(
+        self, project_id: str, task_id: str, user_email: str, transitive: bool = False
+    ) -> Optional[List[DependentTask]]:
+        """Task'a bağımlı task'lar (dependencies multikey index'i üzerinden)
+
+        transitive=False sadece doğrudan successor'ları döndürür.
+        """
+        try:
+            if not ObjectId.is_valid(task_id) or not ObjectId.is_valid(project_id):
+                return None
+
+            project_service = ProjectService()
+            if not await project_service.has_project_access(project_id, user_email):
+                return None
+
+            project_oid = ObjectId(project_id)
+            if not await self.db.tasks.find_one({"_id": ObjectId(task_id), "project_id": project_oid}, {"_id": 1}):
+                return None
+
+            if transitive:
+                tasks, depths = await self._load_downstream(project_oid, task_id, DEPENDENT_FIELDS)
+            else:
+                tasks = {
+                    str(task_data["_id"]): task_data
+                    async for task_data in self.db.tasks.find(
+                        {"project_id": project_oid, "dependencies": task_id}, DEPENDENT_FIELDS
+                    )
+                }
+                depths = dict.fromkeys(tasks, 1)
+
+            return sorted(
+                (DependentTask(**task_data, depth=depths[key]) for key, task_data in tasks.items()),
+                key=lambda dependent: (dependent.depth, dependent.start_date or date.max, dependent.id)
+            )
+
+        except Exception as e:
+            logger.error(f"Error getting task dependents: {e}")
+            raise
+
+    async def get_task_impact(self, project_id: str, task_id: str, user_email: str) -> Optional[TaskImpact]:
+        """Task gecikirse etkilenecek tüm downstream task'ların özeti"""
+        dependents = await self.get_task_dependents(project_id, task_id, user_email, transitive=True)
+        if dependents is None:
+            return None
+        end_dates = [dependent.end_date for dependent in dependents if dependent.end_date]
+        return TaskImpact(
+            task_id=task_id,
+            direct_dependents=sum(1 for dependent in dependents if dependent.depth == 1),
+            total_dependents=len(dependents),
+            max_depth=max((dependent.depth for dependent in dependents), default=0),
+            latest_end_date=max(end_dates, default=None),
+            tasks=dependents
+        )
+
+    async def get_epic_tree(self, project_id: str, user_email: str) -> Optional[Dict[str, Any]]:
+        """Epic -> task hiyerarşisini alt ağaç toplamlarıyla getir
+
+        Sonuç response cache'te tasks:<project_id> scope'una bağlıdır; her
+        task yazımında tüm worker'lar için geçersiz olur.
+        """
+        try:
+            project_service = ProjectService()
+            if not await project_service.has_project_access(project_id, user_email):
+                return None
+
+            async def load() -> Dict[str, Any]:
+                tasks = await self.db.tasks.find(
+                    {"project_id": ObjectId(project_id)}, HIERARCHY_FIELDS
+                ).sort([("created_at", 1), ("_id", 1)]).to_list(length=None)
+
+                tree = build_epic_tree(tasks)
+                tree["project_id"] = project_id
+                return tree
+
+            return await response_cache.get_or_load("epic_tree", [f"tasks:{project_id}"], [], load)
+
+        except Exception as e:
+            logger.error(f"Error building epic tree: {e}")
+            raise
+
+    async def get_project_schedule(self, project_id: str, user_email: str) -> Optional[Dict[str, Any]]:
+        """Bağımlılık grafiğinden kritik yol ve erken/geç tarihleri hesapla"""
+        try:
+            project_service = ProjectService()
+            project = await project_service.get_project_by_id(project_id, user_email)
+            if not project:
+                return None
+
+            tasks = await self.db.tasks.find(
+                {"project_id": ObjectId(project_id)}, SCHEDULE_FIELDS
+            ).to_list(length=None)
+
+            calendar = WorkCalendar.from_settings(project.settings)
+            schedule = compute_schedule(tasks, project.start_date, calendar)
+            schedule["project_id"] = project_id
+            return schedule
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error computing project schedule: {e}")
+            raise
+
     async def get_project_timeline(self, project_id: str, user_email: str) -> Dict[str, Any]:
         """Proje timeline'ını oluştur"""
         try:
-            tasks = await self.get_project_tasks(project_id, user_email)
+            project_service = ProjectService()
+            if not await project_service.has_project_access(project_id, user_email):
+                return {
+                    "project_id": project_id,
+                    "tasks": [],
+                    "dependencies": [],
+                    "milestones": []
+                }
+
+            return await response_cache.get_or_load(
+                "timeline", [f"tasks:{project_id}"], [],
+                lambda: self._build_project_timeline(project_id)
+            )
             
-            timeline_data = {
+        except Exception as e:
+            logger.error(f"Error generating project timeline: {e}")
+            return {
                 "project_id": project_id,
                 "tasks": [],
                 "dependencies": [],
                 "milestones": []
             }
-            
-            for task in tasks:
+
+    async def _build_project_timeline(self, project_id: str) -> Dict[str, Any]:
+        """Timeline'ı projeksiyonlu tek sorgudan oluştur"""
+        timeline_data = {
+            "project_id": project_id,
+            "tasks": [],
+            "dependencies": [],
+            "milestones": []
+        }
+        with phase("query"):
+            documents = await self.db.tasks.find(
+                {"project_id": ObjectId(project_id)}, TIMELINE_FIELDS
+            ).sort("created_at", 1).to_list(length=None)
+
+        with phase("model_build"):
+            for task_data in documents:
+                task_id = str(task_data["_id"])
+                start_date = task_data.get("start_date")
+                end_date = task_data.get("end_date")
+                task_type = task_data.get("task_type", TaskType.TASK)
+                dependencies = task_data.get("dependencies") or []
                 task_item = {
-                    "id": str(task.id),
-                    "name": task.name,
-                    "start_date": task.start_date.isoformat() if task.start_date else None,
-                    "end_date": task.end_date.isoformat() if task.end_date else None,
-                    "duration_days": task.duration_days,
-                    "status": task.status,
-                    "completion_percentage": task.completion_percentage,
-                    "type": task.task_type,
-                    "dependencies": task.dependencies,
-                    "assigned_to": task.assigned_to,
-                    "priority": task.priority
+                    "id": task_id,
+                    "name": task_data.get("name"),
+                    "start_date": start_date.date().isoformat() if start_date else None,
+                    "end_date": end_date.date().isoformat() if end_date else None,
+                    "duration_days": task_data.get("duration_days"),
+                    "status": task_data.get("status", TaskStatus.NOT_STARTED),
+                    "completion_percentage": task_data.get("completion_percentage", 0.0),
+                    "type": task_type,
+                    "dependencies": dependencies,
+                    "assigned_to": task_data.get("assigned_to"),
+                    "priority": task_data.get("priority", Priority.MEDIUM)
                 }
-                
-                if task.task_type == TaskType.MILESTONE:
+            
+                if task_type == TaskType.MILESTONE:
                     timeline_data["milestones"].append(task_item)
                 else:
                     timeline_data["tasks"].append(task_item)
-                
+            
                 # Bağımlılıkları ekle
-                for dep_id in task.dependencies:
+                for dep_id in dependencies:
                     timeline_data["dependencies"].append({
                         "from": dep_id,
-                        "to": str(task.id)
+                        "to": task_id
                     })
-            
-            return timeline_data
-            
-        except Exception as e:
-            logger.error(f"Error generating project timeline: {e}")
-            return {
-                "project_id": project_id,
-                "tasks": [],
-                "dependencies": [],
-                "milestones": []
-            }
\ No newline at end of file
+
+        return timeline_data
@@ -0,0 +1,165 @@
+# backend/app/projects/stats.py
+
+from typing import Any, Dict, Optional
+from datetime import date, datetime
+from enum import Enum
+
+# Rollup'ta tutulan task alanları (before-image okumaları bu projeksiyonla yapılır)
+STATS_FIELDS = {
+    "status": 1, "priority": 1, "assigned_to": 1, "end_date": 1,
+    "effort_hours": 1, "completion_percentage": 1
+}
+
+CLOSED_STATUSES = ("completed", "cancelled")
+UNASSIGNED_KEY = "_unassigned"
+
+def _value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+def escape_key(key: str) -> str:
+    """Mongo alan adında kullanılamayan '.' ve '$' karakterlerini kaçır"""
+    return key.replace("%", "%25").replace(".", "%2E").replace("$", "%24")
+
+def unescape_key(key: str) -> str:
+    return key.replace("%24", "$").replace("%2E", ".").replace("%25", "%")
+
+def task_contribution(task: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """Tek task'ın rollup dokümanına katkısı ($inc yolları -> değer)
+
+    İptal edilen task'lar sayımlara girer ama efor/tamamlanma
+    toplamlarına girmez. Açık task'ların bitiş tarihleri gecikme
+    sayımı için gün bazlı histogramda tutulur.
+    """
+    if not task:
+        return {}
+
+    status = _value(task.get("status")) or "not_started"
+    priority = _value(task.get("priority")) or "medium"
+    assignee = task.get("assigned_to") or UNASSIGNED_KEY
+
+    contribution: Dict[str, float] = {
+        "total_tasks": 1,
+        f"by_status.{status}": 1,
+        f"by_priority.{priority}": 1,
+        f"by_assignee.{escape_key(assignee)}": 1,
+    }
+
+    if status != "cancelled":
+        effort = float(task.get("effort_hours") or 0)
+        completion = float(task.get("completion_percentage") or 0)
+        contribution["active_tasks"] = 1
+        contribution["completion_sum"] = completion
+        contribution["effort_hours"] = effort
+        contribution["completed_effort_hours"] = effort * completion / 100
+
+    end_date = task.get("end_date")
+    if end_date is not None and status not in CLOSED_STATUSES:
+        if isinstance(end_date, datetime):
+            end_date = end_date.date()
+        contribution[f"open_end_dates.{end_date.isoformat()}"] = 1
+
+    return contribution
+
+def stats_delta(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """İki task görüntüsü arasındaki rollup farkı (create: before=None, delete: after=None)"""
+    delta = dict(task_contribution(after))
+    for path, value in task_contribution(before).items():
+        delta[path] = delta.get(path, 0) - value
+    return {path: value for path, value in delta.items() if value}
+
+def merge_deltas(target: Dict[str, float], delta: Dict[str, float]) -> Dict[str, float]:
+    """delta'yı target'a ekle (bulk işlemlerde tek $inc için)"""
+    for path, value in delta.items():
+        target[path] = target.get(path, 0) + value
+    return target
+
+def build_rollup(rows: Dict[str, Any]) -> Dict[str, Any]:
+    """Aggregation facet sonuçlarından rollup dokümanını oluştur"""
+    totals = (rows.get("totals") or [{}])[0]
+    rollup: Dict[str, Any] = {
+        "total_tasks": totals.get("total_tasks", 0),
+        "active_tasks": totals.get("active_tasks", 0),
+        "completion_sum": totals.get("completion_sum", 0),
+        "effort_hours": totals.get("effort_hours", 0),
+        "completed_effort_hours": totals.get("completed_effort_hours", 0),
+        "by_status": {},
+        "by_priority": {},
+        "by_assignee": {},
+        "open_end_dates": {},
+    }
+    for facet in ("by_status", "by_priority"):
+        for row in rows.get(facet, []):
+            rollup[facet][str(_value(row["_id"]))] = row["count"]
+    for row in rows.get("by_assignee", []):
+        rollup["by_assignee"][escape_key(row["_id"] or UNASSIGNED_KEY)] = row["count"]
+    for row in rows.get("open_end_dates", []):
+        end_date = row["_id"]
+        if isinstance(end_date, datetime):
+            end_date = end_date.date()
+        rollup["open_end_dates"][end_date.isoformat()] = row["count"]
+    return rollup
+
+def rollup_pipeline(project_oid: Any) -> list:
+    """Rollup'ı tasks koleksiyonundan baştan hesaplayan aggregation"""
+    active = {"$ne": ["$status", "cancelled"]}
+    effort = {"$ifNull": ["$effort_hours", 0]}
+    completion = {"$ifNull": ["$completion_percentage", 0]}
+    return [
+        {"$match": {"project_id": project_oid}},
+        {"$facet": {
+            "totals": [{"$group": {
+                "_id": None,
+                "total_tasks": {"$sum": 1},
+                "active_tasks": {"$sum": {"$cond": [active, 1, 0]}},
+                "completion_sum": {"$sum": {"$cond": [active, completion, 0]}},
+                "effort_hours": {"$sum": {"$cond": [active, effort, 0]}},
+                "completed_effort_hours": {"$sum": {"$cond": [
+                    active, {"$divide": [{"$multiply": [effort, completion]}, 100]}, 0
+                ]}},
+            }}],
+            "by_status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+            "by_priority": [{"$group": {"_id": "$priority", "count": {"$sum": 1}}}],
+            "by_assignee": [{"$group": {"_id": "$assigned_to", "count": {"$sum": 1}}}],
+            "open_end_dates": [
+                {"$match": {"end_date": {"$ne": None}, "status": {"$nin": list(CLOSED_STATUSES)}}},
+                {"$group": {"_id": "$end_date", "count": {"$sum": 1}}}
+            ],
+        }},
+    ]
+
+def summarize_rollup(rollup: Dict[str, Any], today: Optional[date] = None) -> Dict[str, Any]:
+    """Rollup dokümanını API çıktısına çevir (sıfıra inmiş sayaçlar atılır)"""
+    today = (today or date.today()).isoformat()
+
+    def counts(field: str, unescape: bool = False) -> Dict[str, int]:
+        return {
+            unescape_key(key) if unescape else key: int(value)
+            for key, value in (rollup.get(field) or {}).items()
+            if value
+        }
+
+    active_tasks = rollup.get("active_tasks", 0)
+    effort_hours = max(rollup.get("effort_hours", 0), 0.0)
+    completed_effort_hours = min(max(rollup.get("completed_effort_hours", 0), 0.0), effort_hours)
+    average_completion = rollup.get("completion_sum", 0) / active_tasks if active_tasks else 0.0
+    # Efor girilmemişse ağırlıklı oran basit ortalamaya düşer
+    weighted_completion = (
+        completed_effort_hours / effort_hours * 100 if effort_hours else average_completion
+    )
+
+    return {
+        "total_tasks": int(rollup.get("total_tasks", 0)),
+        "completion_percentage": round(weighted_completion, 2),
+        "average_completion_percentage": round(average_completion, 2),
+        "effort_hours": round(effort_hours, 2),
+        "completed_effort_hours": round(completed_effort_hours, 2),
+        "remaining_effort_hours": round(effort_hours - completed_effort_hours, 2),
+        "by_status": counts("by_status"),
+        "by_priority": counts("by_priority"),
+        "by_assignee": counts("by_assignee", unescape=True),
+        "overdue_tasks": sum(
+            int(value) for key, value in (rollup.get("open_end_dates") or {}).items()
+            if key < today and value
+        ),
+        "updated_at": rollup.get("updated_at"),
+    }
@@ -0,0 +1,135 @@
+# backend/app/serve.py
+# Production sunucu başlatıcısı.
+#
+# Kullanım (backend dizininden):
+#   python -m app.serve                      # CPU sayısı kadar worker
+#   python -m app.serve --workers 4 --port 8080
+#   RELOAD=true python -m app.serve          # Geliştirme: tek worker + dosya izleme
+#
+# Her worker uygulamayı ayrı süreçte import eder; Motor client'ı ve
+# in-process cache'ler lifespan içinde worker başına oluşturulur.
+# SIGTERM'de worker'lar yeni bağlantı almayı bırakır, devam eden
+# istekleri GRACEFUL_TIMEOUT saniyeye kadar bitirir ve lifespan
+# shutdown'ını (Mongo bağlantısı, bcrypt pool) çalıştırır.
+# Bellek içi response cache worker'lar arası invalidate edemediği için
+# birden fazla worker'da REDIS_URL verilmezse kapatılır.
+# Birden fazla worker varken /metrics tüm worker'ların toplamını
+# döndürsün diye PROMETHEUS_MULTIPROC_DIR ayarlanır (verilmezse geçici dizin).
+
+import argparse
+import glob
+import importlib.util
+import logging
+import os
+import tempfile
+from typing import List, Optional
+
+import uvicorn
+
+APP_IMPORT_PATH = "app.main:app"
+
+logger = logging.getLogger(__name__)
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def _env_optional_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+def default_workers() -> int:
+    """Sürecin kullanabileceği CPU sayısı (cgroup/affinity kısıtları dahil)"""
+    try:
+        return max(len(os.sched_getaffinity(0)), 1)
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Project Management API sunucusu")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument(
+        "--workers", type=int, default=_env_optional_int("WEB_CONCURRENCY"),
+        help="Worker süreç sayısı (varsayılan: CPU sayısı)"
+    )
+    parser.add_argument(
+        "--reload", action="store_true", default=_env_bool("RELOAD"),
+        help="Geliştirme modu: tek worker ve dosya değişikliklerinde yeniden başlatma"
+    )
+    parser.add_argument("--log-level", default=os.getenv("LOG_LEVEL", "info").lower())
+    parser.add_argument(
+        "--graceful-timeout", type=int, default=int(os.getenv("GRACEFUL_TIMEOUT", "30")),
+        help="SIGTERM sonrası devam eden isteklerin bitmesi için beklenecek süre (saniye)"
+    )
+    parser.add_argument(
+        "--keep-alive", type=int, default=int(os.getenv("KEEP_ALIVE_TIMEOUT", "5")),
+        help="Boştaki keep-alive bağlantılarının açık tutulacağı süre (saniye)"
+    )
+    parser.add_argument(
+        "--backlog", type=int, default=int(os.getenv("BACKLOG", "2048")),
+        help="Kabul bekleyen bağlantı kuyruğu uzunluğu"
+    )
+    parser.add_argument(
+        "--limit-concurrency", type=int, default=_env_optional_int("LIMIT_CONCURRENCY"),
+        help="Worker başına eşzamanlı bağlantı sınırı; aşılırsa 503 döner"
+    )
+    return parser.parse_args(argv)
+
+def build_config(args: argparse.Namespace) -> dict:
+    """uvicorn.run argümanlarını oluştur"""
+    workers = 1 if args.reload else (args.workers or default_workers())
+    return {
+        "host": args.host,
+        "port": args.port,
+        "workers": workers,
+        "reload": args.reload,
+        "loop": "uvloop" if _has_module("uvloop") else "asyncio",
+        "http": "httptools" if _has_module("httptools") else "h11",
+        "log_level": args.log_level,
+        "proxy_headers": True,
+        "timeout_graceful_shutdown": args.graceful_timeout,
+        "timeout_keep_alive": args.keep_alive,
+        "backlog": args.backlog,
+        "limit_concurrency": args.limit_concurrency,
+    }
+
+def prepare_metrics_dir(workers: int) -> Optional[str]:
+    """Çok worker'lı çalışmada Prometheus multiprocess dizinini hazırla
+
+    Worker süreçleri ortam değişkenini devralır; dizin worker'lar
+    prometheus_client'ı import etmeden önce ayarlanmalıdır.
+    """
+    path = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        if workers <= 1:
+            return None
+        path = tempfile.mkdtemp(prefix="prometheus-")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+    # Önceki çalıştırmadan kalan worker dosyaları toplamı bozar
+    os.makedirs(path, exist_ok=True)
+    for stale in glob.glob(os.path.join(path, "*.db")):
+        os.remove(stale)
+    return path
+
+def main(argv: Optional[List[str]] = None) -> None:
+    config = build_config(parse_args(argv))
+    logging.basicConfig(level=config["log_level"].upper())
+    # Worker'lar ortamı devralır; süreç içi cache'ler çok worker'lı çalıştıklarını buradan bilir
+    os.environ["WEB_CONCURRENCY"] = str(config["workers"])
+    metrics_dir = prepare_metrics_dir(config["workers"])
+    if metrics_dir:
+        logger.info(f"Prometheus multiprocess metrics in {metrics_dir}")
+    logger.info(
+        f"Starting API: {config['workers']} worker(s), loop={config['loop']}, "
+        f"http={config['http']}, reload={config['reload']}"
+    )
+    uvicorn.run(APP_IMPORT_PATH, **config)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# backend/app/shared/cache.py
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import threading
+import time
+
+_MISSING = object()
+
+class TTLCache:
+    """Boyutu sınırlı, süre aşımlı (TTL) LRU cache"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, timer: Callable[[], float] = time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize en az 1 olmalıdır")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Key'e ait değeri getir, yoksa veya süresi dolmuşsa default döndür"""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Değeri cache'e yaz, kapasite aşılırsa en eski kaydı at"""
+        expires_at = self._timer() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Tek bir key'i cache'ten sil"""
+        with self._lock:
+            return self._data.pop(key, _MISSING) is not _MISSING
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Koşulu sağlayan tüm key'leri cache'ten sil"""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Cache'i tamamen boşalt"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss sayaçlarını döndür"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
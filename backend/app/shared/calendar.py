@@ -0,0 +1,128 @@
+# backend/app/shared/calendar.py
+
+from typing import Any, Dict, Iterable, Optional, Sequence, Union
+from datetime import date, datetime
+import numpy as np
+
+DEFAULT_WEEKMASK = "1111100"  # Pazartesi-Cuma
+
+DateLike = Union[date, datetime, str, np.datetime64]
+DateArray = Union[Sequence[DateLike], np.ndarray]
+
+def _to_day(value: DateLike) -> np.datetime64:
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value, "D")
+
+def _to_days(values: DateArray) -> np.ndarray:
+    if isinstance(values, np.ndarray) and values.dtype == "datetime64[D]":
+        return values
+    return np.array([_to_day(v) for v in values], dtype="datetime64[D]")
+
+class WorkCalendar:
+    """Çalışma günü takvimi: hafta maskesi, tatiller ve çalışılan istisna günleri
+
+    Sayma ve gün ekleme işlemleri numpy.busday_count/busday_offset ile
+    kapalı formda yapılır; *_batch metotları tüm task dizisini tek seferde
+    hesaplar. working_days, hafta maskesine göre tatil olup çalışılan
+    günlerdir (ör. telafi cumartesisi).
+    """
+
+    def __init__(
+        self,
+        weekmask: str = DEFAULT_WEEKMASK,
+        holidays: Iterable[DateLike] = (),
+        working_days: Iterable[DateLike] = (),
+    ):
+        if len(weekmask) != 7 or set(weekmask) - {"0", "1"} or "1" not in weekmask:
+            raise ValueError("weekmask 7 karakterlik 0/1 dizisi olmalı ve en az bir çalışma günü içermelidir")
+        self.weekmask = weekmask
+        self._busdaycal = np.busdaycalendar(weekmask=weekmask, holidays=_to_days(list(holidays)))
+        self.holidays = self._busdaycal.holidays
+        # Sadece maskeye göre çalışılmayan günler istisna olarak anlamlıdır
+        extra = np.unique(_to_days(list(working_days)))
+        self.working_days = extra[~np.is_busday(extra, busdaycal=self._busdaycal)]
+
+    @classmethod
+    def from_settings(cls, settings: Optional[Dict[str, Any]]) -> "WorkCalendar":
+        """Proje settings["calendar"] değerinden takvim oluştur"""
+        calendar = (settings or {}).get("calendar") or {}
+        return cls(
+            weekmask=calendar.get("weekmask", DEFAULT_WEEKMASK),
+            holidays=calendar.get("holidays", ()),
+            working_days=calendar.get("working_days", ()),
+        )
+
+    def to_settings(self) -> Dict[str, Any]:
+        """Takvimi settings["calendar"] formatına çevir"""
+        return {
+            "weekmask": self.weekmask,
+            "holidays": [str(d) for d in self.holidays],
+            "working_days": [str(d) for d in self.working_days],
+        }
+
+    def _count_extra(self, starts: np.ndarray, ends_exclusive: np.ndarray) -> np.ndarray:
+        """[start, end) aralığındaki istisna çalışma günü sayısı"""
+        if not self.working_days.size:
+            return np.zeros(np.broadcast(starts, ends_exclusive).shape, dtype=np.int64)
+        return (
+            np.searchsorted(self.working_days, ends_exclusive, side="left")
+            - np.searchsorted(self.working_days, starts, side="left")
+        )
+
+    def is_work_day(self, value: DateLike) -> bool:
+        """Tarih çalışma günü mü"""
+        day = _to_day(value)
+        if np.is_busday(day, busdaycal=self._busdaycal):
+            return True
+        return bool(self.working_days.size and day in self.working_days)
+
+    def count_work_days_batch(self, starts: DateArray, ends: DateArray) -> np.ndarray:
+        """[start, end] (dahil) aralıklarındaki çalışma günü sayıları"""
+        starts, ends = _to_days(starts), _to_days(ends)
+        ends_exclusive = ends + np.timedelta64(1, "D")
+        counts = np.busday_count(starts, ends_exclusive, busdaycal=self._busdaycal)
+        counts = counts + self._count_extra(starts, ends_exclusive)
+        return np.where(ends >= starts, counts, 0)
+
+    def count_work_days(self, start: DateLike, end: DateLike) -> int:
+        """[start, end] (dahil) aralığındaki çalışma günü sayısı"""
+        return int(self.count_work_days_batch([start], [end])[0])
+
+    def add_work_days_batch(self, starts: DateArray, offsets: Union[Sequence[int], np.ndarray]) -> np.ndarray:
+        """Her start'ı ilk çalışma gününe yuvarla ve offset kadar çalışma günü ilerlet"""
+        starts = _to_days(starts)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if not self.working_days.size:
+            return np.busday_offset(starts, offsets, roll="forward", busdaycal=self._busdaycal)
+
+        # İstisna günleri varken: count(start, x) >= offset + 1 olan en küçük x'i
+        # vektörel ikili arama ile bul (count monoton artandır)
+        targets = offsets + 1
+        working_per_week = self.weekmask.count("1")
+        span = (targets * 7) // working_per_week + 7 + len(self.holidays)
+        lo = starts
+        hi = starts + span.astype("timedelta64[D]")
+        while True:
+            active = lo < hi
+            if not active.any():
+                return lo
+            mid = lo + ((hi - lo) // 2)
+            enough = self.count_work_days_batch(starts, mid) >= targets
+            hi = np.where(active & enough, mid, hi)
+            lo = np.where(active & ~enough, mid + np.timedelta64(1, "D"), lo)
+
+    def add_work_days(self, start: DateLike, offset: int) -> date:
+        """start'ı ilk çalışma gününe yuvarla ve offset kadar çalışma günü ilerlet"""
+        return self.add_work_days_batch([start], [offset])[0].astype(date)
+
+    def next_work_day_after(self, value: DateLike) -> date:
+        """value'dan sonraki (value hariç) ilk çalışma günü
+
+        value çalışma günü olmasa da (ör. cumartesi biten task) doğrudan
+        sonraki çalışma gününü verir; add_work_days(value, 1) ise önce
+        ileri yuvarlayıp bir gün daha eklerdi.
+        """
+        return self.add_work_days(_to_day(value) + np.timedelta64(1, "D"), 0)
+
+DEFAULT_CALENDAR = WorkCalendar()
@@ -0,0 +1,185 @@
+# backend/app/shared/metrics.py
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+import functools
+import inspect
+import os
+import threading
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+    generate_latest, multiprocess
+)
+from pymongo import monitoring
+
+from app.shared.profiling import record_mongo_command
+
+# Çok worker'lı kurulumda her worker değerlerini bu dizindeki dosyalara yazar
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+HTTP_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MONGO_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+UNMATCHED_ROUTE = "<unmatched>"
+NO_OPERATION = "<none>"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "İşlenen HTTP istekleri", ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP istek süresi (yanıtın son baytına kadar)",
+    ["method", "route"], buckets=HTTP_LATENCY_BUCKETS
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "İşlenmekte olan HTTP istekleri",
+    ["method"], multiprocess_mode="livesum"
+)
+SERVICE_CALL_DURATION = Histogram(
+    "service_call_duration_seconds", "Servis metodu süresi",
+    ["operation"], buckets=HTTP_LATENCY_BUCKETS
+)
+MONGO_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds", "MongoDB komut süresi (sürücünün ölçtüğü round trip)",
+    ["command", "collection", "operation"], buckets=MONGO_LATENCY_BUCKETS
+)
+MONGO_COMMAND_FAILURES = Counter(
+    "mongodb_command_failures_total", "Hata dönen MongoDB komutları",
+    ["command", "collection", "operation"]
+)
+
+# Mongo komutlarını çağıran servis metoduna bağlamak için (Motor executor'a context'i kopyalar)
+current_operation: ContextVar[str] = ContextVar("current_operation", default=NO_OPERATION)
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Her Mongo komutunun süresini komut, koleksiyon ve servis metodu bazında kaydeder
+
+    Süre, profil açık istekte isteğin mongo toplamına da eklenir.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Tuple[Any, int], Tuple[str, str, str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(event) -> Tuple[Any, int]:
+        return (event.connection_id, event.request_id)
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        if event.command_name == "getMore":
+            collection = event.command.get("collection")
+        labels = (
+            event.command_name,
+            collection if isinstance(collection, str) else "",
+            current_operation.get(),
+        )
+        with self._lock:
+            self._pending[self._key(event)] = labels
+
+    def _finish(self, event) -> Optional[Tuple[str, str, str]]:
+        with self._lock:
+            return self._pending.pop(self._key(event), None)
+
+    def succeeded(self, event):
+        labels = self._finish(event)
+        record_mongo_command(event.duration_micros)
+        if labels is not None:
+            MONGO_COMMAND_DURATION.labels(*labels).observe(event.duration_micros / 1e6)
+
+    def failed(self, event):
+        labels = self._finish(event)
+        record_mongo_command(event.duration_micros)
+        if labels is not None:
+            MONGO_COMMAND_DURATION.labels(*labels).observe(event.duration_micros / 1e6)
+            MONGO_COMMAND_FAILURES.labels(*labels).inc()
+
+mongo_command_metrics = MongoCommandMetrics()
+
+def instrument_service(cls):
+    """Sınıfın async metotlarını süre ölçümü ve Mongo komut etiketlemesiyle sar
+
+    Metot süresi service_call_duration_seconds'a yazılır; metot içinde
+    çalışan Mongo komutları operation="Sınıf.metot" etiketini alır.
+    İç içe çağrılarda en içteki metot geçerlidir.
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith("__") or not inspect.iscoroutinefunction(method):
+            continue
+        setattr(cls, name, _instrument(method, f"{cls.__name__}.{name}"))
+    return cls
+
+def _instrument(method, operation: str):
+    histogram = SERVICE_CALL_DURATION.labels(operation)
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        token = current_operation.set(operation)
+        start = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start)
+            current_operation.reset(token)
+
+    return wrapper
+
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+class MetricsMiddleware:
+    """İstek sayısı, süre histogramı ve eşzamanlı istek sayısı (ASGI middleware)
+
+    Route etiketi eşleşen route şablonudur (ör. /api/projects/{project_id}),
+    böylece etiket sayısı id'lerle büyümez. Akış yanıtlarında süre son
+    parça gönderilene kadar ölçülür.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            route = _route_label(scope)
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+
+def multiprocess_enabled() -> bool:
+    return bool(os.getenv(MULTIPROC_DIR_ENV))
+
+def mark_worker_exit() -> None:
+    """Kapanan worker'ın canlı gauge değerlerini toplamdan çıkar"""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(os.getpid())
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Prometheus text formatında metrikler ve content type
+
+    Çok worker'lı kurulumda tüm worker'ların dosyaları toplanır.
+    """
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
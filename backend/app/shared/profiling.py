@@ -0,0 +1,303 @@
+# backend/app/shared/profiling.py
+
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import cProfile
+import logging
+import os
+import re
+import threading
+import time
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# İstek bazında açma: "X-Profile: 1" faz dökümü, "X-Profile: cprofile" ek olarak cProfile dosyası
+PROFILE_HEADER = b"x-profile"
+CAPTURE_VALUE = b"cprofile"
+UNACCOUNTED_PHASE = "other"
+# Uzun ömürlü akış yanıtları (SSE) profillenmez ve yavaş sayılmaz
+STREAM_CONTENT_TYPE = b"text/event-stream"
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+class ProfilingSettings:
+    """PROFILING_* ortam değişkenleri"""
+
+    def __init__(self):
+        self.enabled = _env_bool("PROFILING_ENABLED")  # Tüm istekler
+        self.header_enabled = _env_bool("PROFILING_HEADER_ENABLED")
+        self.slow_ms = float(os.getenv("PROFILING_SLOW_MS", "500"))
+        self.directory = os.getenv("PROFILING_DIR") or None  # cProfile dosyaları; boşsa yazılmaz
+        self.capture_all = _env_bool("PROFILING_CAPTURE")  # PROFILING_ENABLED ile her isteği cProfile'la
+        # Tek cProfile ölçümünün süre sınırı; aşılırsa o ana kadarki veri yazılır (0: sınırsız)
+        self.capture_max_seconds = float(os.getenv("PROFILING_CAPTURE_MAX_SECONDS", "30"))
+
+settings = ProfilingSettings()
+
+class RequestProfile:
+    """Tek isteğin fazlara ayrılmış süreleri
+
+    Fazlar iç içe açılabilir; süreler dışlayıcıdır (iç faz çalışırken dış
+    fazın sayacı durur). Hiçbir faza girmeyen süre "other" altında
+    raporlanır (routing, response_model doğrulaması vb.). Mongo komut
+    süreleri sürücüden ayrıca toplanır.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.mongo_ms = 0.0
+        self.mongo_commands = 0
+        self._stack: List[List[Any]] = []  # [faz adı, başlangıç]
+        self._lock = threading.Lock()
+
+    def enter(self, name: str) -> None:
+        now = time.perf_counter()
+        if self._stack:
+            parent = self._stack[-1]
+            self.phases[parent[0]] = self.phases.get(parent[0], 0.0) + now - parent[1]
+        self._stack.append([name, now])
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def exit(self) -> None:
+        now = time.perf_counter()
+        name, started = self._stack.pop()
+        self.phases[name] = self.phases.get(name, 0.0) + now - started
+        if self._stack:
+            self._stack[-1][1] = now
+
+    def add_mongo_command(self, duration_micros: int) -> None:
+        # Sürücü callback'i executor thread'inde çalışır
+        with self._lock:
+            self.mongo_ms += duration_micros / 1000
+            self.mongo_commands += 1
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def breakdown(self) -> Dict[str, float]:
+        """Faz -> ms; toplamdan kalan süre "other" fazına yazılır"""
+        phases = {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()}
+        phases[UNACCOUNTED_PHASE] = round(max(self.elapsed_ms() - sum(phases.values()), 0.0), 3)
+        return phases
+
+    def server_timing(self) -> str:
+        """Server-Timing başlığı (tarayıcı geliştirici araçlarında görünür)"""
+        entries = [f"{name};dur={ms}" for name, ms in self.breakdown().items()]
+        entries.append(f"mongo;dur={round(self.mongo_ms, 3)};desc=\"{self.mongo_commands} commands\"")
+        entries.append(f"total;dur={round(self.elapsed_ms(), 3)}")
+        return ", ".join(entries)
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+
+def current_profile() -> Optional[RequestProfile]:
+    return _current_profile.get()
+
+class _Phase:
+    __slots__ = ("name", "profile")
+
+    def __init__(self, name: str, profile: RequestProfile):
+        self.name = name
+        self.profile = profile
+
+    def __enter__(self):
+        self.profile.enter(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profile.exit()
+        return False
+
+class _NoopPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NOOP_PHASE = _NoopPhase()
+
+def phase(name: str):
+    """Profil açıksa bloğun süresini verilen faza yaz
+
+    Kullanım: with phase("query"): ...  Profil kapalıyken paylaşılan boş
+    bir context manager döner; sıcak yolda maliyeti bir ContextVar okumasıdır.
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return _NOOP_PHASE
+    return _Phase(name, profile)
+
+def record_mongo_command(duration_micros: int) -> None:
+    """Komut süresini aktif isteğin profiline ekle (CommandListener'dan çağrılır)"""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.add_mongo_command(duration_micros)
+
+# Python aynı anda tek profiler'a izin verir
+_capture_lock = threading.Lock()
+
+def _profile_path(directory: str, method: str, route: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+    return os.path.join(directory, f"{stamp}-{method}-{slug}.prof")
+
+class _Capture:
+    """Tek isteğin cProfile ölçümü
+
+    Ölçüm istek bitince, süre sınırı dolunca ya da yanıt akışa dönüşünce
+    durdurulur ve profiler kilidi bırakılır; uzun bir istek diğer
+    isteklerin ölçülmesini engellemez.
+    """
+
+    def __init__(self, max_seconds: float):
+        self.profiler = cProfile.Profile()
+        self.truncated = False
+        self._active = True
+        self.profiler.enable()
+        self._timer = (
+            asyncio.get_running_loop().call_later(max_seconds, self.stop, True)
+            if max_seconds > 0 else None
+        )
+
+    def stop(self, truncated: bool = False) -> None:
+        if not self._active:
+            return
+        self._active = False
+        self.profiler.disable()
+        _capture_lock.release()
+        if self._timer is not None:
+            self._timer.cancel()
+        self.truncated = truncated
+
+class ProfilingMiddleware:
+    """Opt-in istek profili (ASGI middleware)
+
+    PROFILING_ENABLED ile tüm isteklerde, PROFILING_HEADER_ENABLED açıkken
+    X-Profile başlığıyla tek istekte çalışır. PROFILING_SLOW_MS'i aşan
+    istekler için faz dökümü yapılandırılmış log olarak yazılır; başlıkla
+    istenen yanıtlara Server-Timing eklenir. PROFILING_DIR ayarlıysa
+    cProfile çıktısı (snakeviz/pstats ile açılabilir) oraya kaydedilir.
+    cProfile event loop thread'inin tamamını ölçer; eşzamanlı isteklerin
+    kodu da dosyaya girebilir. Ölçüm PROFILING_CAPTURE_MAX_SECONDS ile
+    sınırlıdır; text/event-stream yanıtlarında hiç tutulmaz.
+    """
+
+    def __init__(self, app, profiling_settings: Optional[ProfilingSettings] = None):
+        self.app = app
+        self.settings = profiling_settings or settings
+
+    def _requested(self, scope) -> Tuple[bool, bool]:
+        """(header ile istendi mi, cProfile istendi mi)"""
+        if not self.settings.header_enabled:
+            return False, False
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                value = value.strip().lower()
+                if value in (b"", b"0", b"false", b"off"):
+                    return False, False
+                return True, value == CAPTURE_VALUE
+        return False, False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested, capture_requested = self._requested(scope)
+        if not (requested or self.settings.enabled):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        status_code = 500
+        streaming = False
+        capture = None
+
+        async def send_wrapper(message):
+            nonlocal status_code, streaming, capture
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+                if content_type.startswith(STREAM_CONTENT_TYPE):
+                    streaming = True
+                    if capture is not None:
+                        capture.stop()
+                        capture = None
+                if requested:
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", profile.server_timing().encode())
+                    ]
+            await send(message)
+
+        wants_capture = self.settings.directory and (capture_requested or self.settings.capture_all)
+        if wants_capture and _capture_lock.acquire(blocking=False):
+            capture = _Capture(self.settings.capture_max_seconds)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if capture is not None:
+                capture.stop()
+            _current_profile.reset(token)
+            self._report(scope, profile, status_code, requested, capture, streaming)
+
+    def _report(
+        self,
+        scope,
+        profile: RequestProfile,
+        status_code: int,
+        requested: bool,
+        capture: Optional[_Capture],
+        streaming: bool,
+    ) -> None:
+        total_ms = profile.elapsed_ms()
+        slow = not streaming and total_ms >= self.settings.slow_ms
+        if not (slow or requested):
+            return
+
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+        profile_file = None
+        if capture is not None:
+            try:
+                os.makedirs(self.settings.directory, exist_ok=True)
+                profile_file = _profile_path(self.settings.directory, scope["method"], route)
+                capture.profiler.dump_stats(profile_file)
+            except OSError as e:
+                logger.warning(f"Could not write profile: {e}")
+                profile_file = None
+
+        record = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route,
+            "status": status_code,
+            "total_ms": round(total_ms, 3),
+            "phases": profile.breakdown(),
+            "calls": profile.calls,
+            "mongo": {"commands": profile.mongo_commands, "ms": round(profile.mongo_ms, 3)},
+            "slow": slow,
+        }
+        if streaming:
+            record["streaming"] = True
+        if profile_file:
+            record["profile_file"] = profile_file
+            if capture.truncated:
+                record["profile_truncated_after_s"] = self.settings.capture_max_seconds
+        message = f"Request profile: {orjson.dumps(record).decode()}"
+        if slow:
+            logger.warning(message)
+        else:
+            logger.info(message)
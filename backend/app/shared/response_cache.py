@@ -0,0 +1,284 @@
+# backend/app/shared/response_cache.py
+
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Sequence
+import logging
+import os
+import threading
+import time
+
+import orjson
+
+from app.shared.cache import TTLCache
+from app.shared.profiling import phase
+from app.shared.utils import json_default
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "rc"
+
+def configured_workers() -> int:
+    """Uygulamayı çalıştıran worker süreci sayısı (app.serve WEB_CONCURRENCY'yi ayarlar)"""
+    try:
+        return max(int(os.getenv("WEB_CONCURRENCY") or "1"), 1)
+    except ValueError:
+        return 1
+
+class MemoryCacheBackend:
+    """Süreç içi backend (testler ve tek worker'lı kurulumlar için)
+
+    Versiyonlar süreç başınadır; birden çok worker'da bir worker'ın
+    invalidate'i diğerlerini etkilemez, bu yüzden çok worker'lı
+    kurulumda create_response_cache bu backend'le cache'i kapatır.
+    """
+
+    name = "memory"
+
+    def __init__(self, maxsize: int = 2048):
+        self._entries = TTLCache(maxsize=maxsize, ttl=300)
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries.set(key, value, ttl=ttl)
+
+    async def get_versions(self, names: Sequence[str]) -> list:
+        with self._lock:
+            return [self._versions.setdefault(name, 0) for name in names]
+
+    async def bump_versions(self, names: Sequence[str]) -> None:
+        with self._lock:
+            for name in names:
+                self._versions[name] = self._versions.get(name, 0) + 1
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+class RedisCacheBackend:
+    """Tüm worker'ların paylaştığı Redis backend'i"""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis  # Opsiyonel bağımlılık
+
+        self._redis = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._redis.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._redis.set(key, value, px=int(ttl * 1000))
+
+    async def get_versions(self, names: Sequence[str]) -> list:
+        versions = await self._redis.mget(names)
+        missing = [name for name, version in zip(names, versions) if version is None]
+        if missing:
+            # Silinmiş (evict edilmiş) bir versiyon 0'dan başlarsa eski kayıtlar
+            # tekrar geçerli olur; bu yüzden zaman tabanlı bir başlangıç değeri kullanılır
+            seed = time.time_ns()
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for name in missing:
+                    pipe.set(name, seed, nx=True)
+                await pipe.execute()
+            versions = await self._redis.mget(names)
+        return [int(version or 0) for version in versions]
+
+    async def bump_versions(self, names: Sequence[str]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for name in names:
+                pipe.incr(name)
+            await pipe.execute()
+
+    async def close(self) -> None:
+        await self._redis.close()
+
+class ResponseCache:
+    """Versiyonlu anahtarlarla okuma sonuçlarını önbelleğe alır
+
+    Her kayıt bağlı olduğu versiyon sayaçlarını (ör. project:<id>,
+    tasks:<id>, user:<email>) anahtarında taşır. Yazma işlemleri ilgili
+    sayacı artırır; eski anahtarlar bir daha okunmaz ve TTL ile düşer.
+    Backend hataları isteği bozmaz, cache miss olarak sayılır.
+    """
+
+    def __init__(self, backend, ttl: float = 300.0, latency_window: int = 1024, enabled: bool = True):
+        self.backend = backend
+        self.ttl = ttl
+        # False: versiyonlar worker'lar arasında paylaşılmıyor; her okuma loader'a gider
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.invalidations = 0
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+
+    def _version_name(self, scope: str) -> str:
+        return f"{KEY_PREFIX}:v:{scope}"
+
+    async def get_or_load(
+        self,
+        name: str,
+        scopes: Sequence[str],
+        params: Sequence[Any],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Cache'teki değeri döndür, yoksa loader ile yükleyip yaz
+
+        name: sonucun türü (ör. "tasks"), scopes: bağlı olunan versiyon
+        sayaçları, params: sonucu belirleyen diğer argümanlar.
+        """
+        if not self.enabled:
+            return await loader()
+
+        key = None
+        start = time.perf_counter()
+        with phase("cache"):
+            try:
+                versions = await self.backend.get_versions([self._version_name(s) for s in scopes])
+                key = ":".join(
+                    [KEY_PREFIX, name]
+                    + [f"{scope}@{version}" for scope, version in zip(scopes, versions)]
+                    + [str(param) for param in params]
+                )
+                cached = await self.backend.get(key)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Response cache read failed: {e}")
+                cached = None
+            finally:
+                self._latencies.append((time.perf_counter() - start) * 1000)
+
+            if cached is not None:
+                self.hits += 1
+                return orjson.loads(cached)
+
+        self.misses += 1
+        value = await loader()
+        if key is not None and value is not None:
+            with phase("cache"):
+                try:
+                    await self.backend.set(
+                        key, orjson.dumps(value, default=json_default, option=orjson.OPT_NON_STR_KEYS), self.ttl
+                    )
+                except Exception as e:
+                    self.errors += 1
+                    logger.warning(f"Response cache write failed: {e}")
+        return value
+
+    async def scope_version(self, scope: str) -> Optional[int]:
+        """Scope'un güncel versiyonu; versiyonlar paylaşılmıyorsa ya da backend hatasında None"""
+        if not self.enabled:
+            return None
+        try:
+            return (await self.backend.get_versions([self._version_name(scope)]))[0]
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Response cache version read failed: {e}")
+            return None
+
+    async def invalidate(self, *scopes: str) -> None:
+        """Scope'ların versiyonunu artırarak bağlı tüm kayıtları geçersiz kıl"""
+        scopes = [scope for scope in dict.fromkeys(scopes) if scope]
+        if not scopes:
+            return
+        try:
+            await self.backend.bump_versions([self._version_name(s) for s in scopes])
+            self.invalidations += len(scopes)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Response cache invalidation failed: {e}")
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss sayaçları ve cache okuma gecikmesi"""
+        lookups = self.hits + self.misses
+        latencies = sorted(self._latencies)
+        return {
+            "backend": self.backend.name,
+            "enabled": self.enabled,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "lookup_ms_p50": round(latencies[len(latencies) // 2], 3) if latencies else 0.0,
+            "lookup_ms_p95": round(latencies[int(len(latencies) * 0.95)], 3) if latencies else 0.0,
+        }
+
+class ScopedLocalCache:
+    """Süreç içi TTLCache; kayıtlar response cache scope versiyonuyla doğrulanır
+
+    Değer, yüklenmeden önce okunan scope versiyonuyla saklanır; okumada
+    versiyon değişmişse kayıt kullanılmaz. Versiyonlar Redis'teyken bir
+    worker'daki invalidate tüm worker'ların yerel kayıtlarını düşürür.
+    Paylaşılan versiyon yoksa (cache kapalı ya da backend hatası) kayıtlar
+    en fazla fallback_ttl saniye yaşar.
+    """
+
+    def __init__(self, cache: ResponseCache, maxsize: int, ttl: float, fallback_ttl: float):
+        self.cache = cache
+        self.fallback_ttl = min(fallback_ttl, ttl)
+        self._local = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get_or_load(self, scope: str, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Kayıt geçerliyse döndür, yoksa loader ile yükle (None cache'lenmez)"""
+        version = await self.cache.scope_version(scope)
+        entry = self._local.get((scope, key))
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        value = await loader()
+        if value is not None:
+            ttl = None if version is not None else self.fallback_ttl
+            self._local.set((scope, key), (version, value), ttl=ttl)
+        return value
+
+    async def invalidate(self, scope: str) -> None:
+        """Scope'a bağlı kayıtları bu worker'da sil, diğer worker'lar için versiyonu artır"""
+        self._local.invalidate_where(lambda local_key: local_key[0] == scope)
+        await self.cache.invalidate(scope)
+
+    def clear(self) -> None:
+        self._local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._local.stats(), "shared_versions": self.cache.enabled, "fallback_ttl": self.fallback_ttl}
+
+def create_response_cache() -> ResponseCache:
+    """RESPONSE_CACHE_BACKEND (redis | memory) ve REDIS_URL'e göre cache oluştur
+
+    Bellek backend'i sadece tek worker'da tutarlıdır: bir worker'daki yazım
+    diğerinin kayıtlarını geçersiz kılamaz ve DB'den üretilen ETag'lerle
+    eski gövde güncel ETag altında dönebilir. Çok worker'lı kurulumda
+    Redis yoksa cache kapatılır.
+    """
+    ttl = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+    redis_url = os.getenv("REDIS_URL")
+    backend_name = os.getenv("RESPONSE_CACHE_BACKEND", "redis" if redis_url else "memory").lower()
+
+    if backend_name == "redis":
+        try:
+            return ResponseCache(RedisCacheBackend(redis_url or "redis://localhost:6379/0"), ttl=ttl)
+        except ImportError:
+            logger.warning("redis paketi kurulu değil; response cache bellek içi çalışacak")
+
+    maxsize = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048"))
+    workers = configured_workers()
+    if workers > 1:
+        logger.warning(
+            f"In-memory response cache disabled: {workers} workers cannot share invalidations; "
+            f"set REDIS_URL to enable caching"
+        )
+        return ResponseCache(MemoryCacheBackend(maxsize=maxsize), ttl=ttl, enabled=False)
+    return ResponseCache(MemoryCacheBackend(maxsize=maxsize), ttl=ttl)
+
+response_cache = create_response_cache()
+
+# Versiyonları paylaşılamayan kurulumda yerel cache kayıtlarının üst süresi
+LOCAL_CACHE_FALLBACK_TTL_SECONDS = float(os.getenv("LOCAL_CACHE_FALLBACK_TTL_SECONDS", "5"))
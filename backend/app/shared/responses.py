@@ -0,0 +1,53 @@
+# backend/app/shared/responses.py
+
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response, status
+from fastapi.responses import ORJSONResponse
+
+from app.shared.profiling import phase
+from app.shared.utils import json_default
+
+def dump_json(content: Any) -> bytes:
+    """API yanıtlarının ortak orjson serileştirmesi
+
+    Export gibi response sınıfı dışında üretilen gövdeler de bunu kullanır;
+    tarih ve ObjectId'ler liste endpoint'leriyle aynı biçimde yazılır.
+    """
+    return orjson.dumps(
+        content,
+        default=json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+class FastJSONResponse(ORJSONResponse):
+    """orjson ile serileştiren varsayılan response sınıfı
+
+    datetime/date/Enum/numpy orjson tarafından doğrudan, ObjectId ve
+    diğer BSON tipleri json_default ile çevrilir; ham Mongo dokümanları
+    Pydantic'e uğramadan döndürülebilir.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with phase("serialize"):
+            return dump_json(content)
+
+# Yanıtlar tarayıcıda saklanabilir ama her kullanımda ETag ile doğrulanmalı
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match başlığı verilen ETag'i içeriyor mu (zayıf karşılaştırma, RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+def not_modified_response(etag: str) -> Response:
+    """Gövdesiz 304 yanıtı"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    )
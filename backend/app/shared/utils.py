@@ -1,8 +1,13 @@
-from typing import Dict, Any, List, Optional
-from datetime import datetime, date
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, date, time
+from enum import Enum
 from bson import ObjectId
+import base64
+import json
 import re
 
+from app.shared.calendar import DEFAULT_CALENDAR, WorkCalendar
+
 def to_camel_case(snake_str: str) -> str:
     """Snake case'i camel case'e çevir"""
     components = snake_str.split('_')
@@ -25,6 +30,23 @@ def serialize_object_id(obj_id: ObjectId) -> str:
     """ObjectId'yi string'e çevir"""
     return str(obj_id)
 
+def json_default(value: Any) -> Any:
+    """json.dumps için ObjectId/datetime/date dönüşümü"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"{type(value).__name__} JSON'a çevrilemez")
+
+def prepare_for_mongo(data: Dict[str, Any]) -> Dict[str, Any]:
+    """BSON'un desteklemediği date değerlerini gece yarısı datetime'ına çevir"""
+    return {
+        k: datetime.combine(v, time.min) if isinstance(v, date) and not isinstance(v, datetime) else v
+        for k, v in data.items()
+    }
+
 def validate_email(email: str) -> bool:
     """Email formatını doğrula"""
     email_pattern = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
@@ -58,6 +80,20 @@ def create_pagination_info(total: int, skip: int, limit: int) -> Dict[str, Any]:
         "total_pages": (total + limit - 1) // limit
     }
 
+def encode_cursor(created_at: datetime, obj_id: ObjectId) -> str:
+    """Keyset pagination için (created_at, _id) çiftini opak cursor'a çevir"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": str(obj_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """Opak cursor'ı (created_at, _id) çiftine çevir"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), ObjectId(payload["i"])
+    except Exception:
+        raise ValueError("Geçersiz cursor değeri")
+
 def format_error_message(field: str, error: str) -> str:
     """Error mesajını formatla"""
     field_map = {
@@ -82,24 +118,19 @@ def calculate_duration_days(start_date: date, end_date: date) -> int:
         return (end_date - start_date).days + 1
     return 0
 
-def is_work_day(date_obj: date) -> bool:
-    """Tarih iş günü mü kontrol et (Pazartesi-Cuma)"""
-    return date_obj.weekday() < 5
+def is_work_day(date_obj: date, calendar: Optional[WorkCalendar] = None) -> bool:
+    """Tarih iş günü mü kontrol et (varsayılan: Pazartesi-Cuma)"""
+    return (calendar or DEFAULT_CALENDAR).is_work_day(date_obj)
 
-def calculate_work_days(start_date: date, end_date: date) -> int:
-    """İki tarih arasındaki iş günü sayısını hesapla"""
+def calculate_work_days(start_date: date, end_date: date, calendar: Optional[WorkCalendar] = None) -> int:
+    """İki tarih arasındaki (dahil) iş günü sayısını hesapla"""
     if not start_date or not end_date:
         return 0
-    
-    work_days = 0
-    current_date = start_date
-    
-    while current_date <= end_date:
-        if is_work_day(current_date):
-            work_days += 1
-        current_date = current_date.replace(day=current_date.day + 1)
-    
-    return work_days
+    return (calendar or DEFAULT_CALENDAR).count_work_days(start_date, end_date)
+
+def add_work_days(start_date: date, work_days: int, calendar: Optional[WorkCalendar] = None) -> date:
+    """Başlangıcı ilk iş gününe yuvarla ve work_days kadar iş günü ilerlet"""
+    return (calendar or DEFAULT_CALENDAR).add_work_days(start_date, work_days)
 
 def normalize_text(text: str) -> str:
     """Metni normalize et (trim, lowercase)"""
@@ -0,0 +1,105 @@
+# backend/benchmarks/load_test.py
+# Çalışan bir API sunucusuna sabit eşzamanlılıkla yük verip throughput ve
+# gecikme yüzdeliklerini ölçer.
+#
+# Tek süreç (eski kurulum) ile çok worker'lı başlatıcıyı karşılaştırmak için,
+# backend dizininden ve çalışan bir MongoDB ile:
+#   uvicorn app.main:app --port 8000 --reload          # 1) eski kurulum
+#   python -m benchmarks.load_test --url http://localhost:8000
+#   python -m app.serve --port 8000                    # 2) production başlatıcı
+#   python -m benchmarks.load_test --url http://localhost:8000
+#
+# Varsayılan senaryo bir kullanıcı ve --tasks adet task'lı bir proje oluşturur,
+# ardından /health, proje listesi ve task listesi endpoint'lerini döner.
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List
+
+import httpx
+
+async def setup_scenario(client: httpx.AsyncClient, task_count: int) -> Dict[str, Dict[str, str]]:
+    """Test kullanıcısı ve task'lı proje oluştur, (yol -> başlıklar) döndür"""
+    email = f"load-{uuid.uuid4().hex[:8]}@example.com"
+    await client.post("/api/auth/register", json={
+        "email": email, "full_name": "Load Test", "password": "loadtest123"
+    })
+    login = await client.post("/api/auth/login", data={"username": email, "password": "loadtest123"})
+    login.raise_for_status()
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    project = await client.post("/api/projects/", json={"name": "Load Test"}, headers=headers)
+    project.raise_for_status()
+    project_id = project.json()["_id"]
+    for start in range(0, task_count, 1000):
+        operations = [
+            {"op": "create", "data": {"name": f"Task {i}", "effort_hours": 8}}
+            for i in range(start, min(start + 1000, task_count))
+        ]
+        response = await client.post(
+            f"/api/projects/{project_id}/tasks/bulk", json={"operations": operations}, headers=headers
+        )
+        response.raise_for_status()
+
+    return {
+        "/health": {},
+        "/api/projects/": headers,
+        f"/api/projects/{project_id}/tasks": headers,
+    }
+
+async def worker(client, targets, deadline, timings, statuses):
+    i = 0
+    while time.perf_counter() < deadline:
+        path, headers = targets[i % len(targets)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            response = await client.get(path, headers=headers)
+            statuses[response.status_code] += 1
+        except httpx.HTTPError as e:
+            statuses[type(e).__name__] += 1
+            continue
+        timings.append((time.perf_counter() - start) * 1000)
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * pct / 100), len(values) - 1)]
+
+async def main(args: argparse.Namespace):
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+        targets = list((await setup_scenario(client, args.tasks)).items())
+
+        # Isınma: bağlantılar ve worker cache'leri
+        await asyncio.gather(*(client.get(path, headers=headers) for path, headers in targets * 4))
+
+        timings: List[float] = []
+        statuses: Counter = Counter()
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            worker(client, targets, deadline, timings, statuses) for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    print(f"{args.url}  concurrency={args.concurrency}  duration={elapsed:.1f}s  tasks={args.tasks}")
+    print(
+        f"requests={len(timings)}  rps={len(timings) / elapsed:.1f}  "
+        f"p50={statistics.median(timings) if timings else 0:.1f}ms  "
+        f"p95={percentile(timings, 95):.1f}ms  p99={percentile(timings, 99):.1f}ms"
+    )
+    print(f"status={dict(statuses)}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API yük testi")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=20.0, help="Saniye")
+    parser.add_argument("--tasks", type=int, default=500, help="Test projesindeki task sayısı")
+    asyncio.run(main(parser.parse_args()))
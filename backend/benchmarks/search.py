@@ -0,0 +1,211 @@
+# backend/benchmarks/search.py
+# Task arama aggregate'inin (text index + $facet) gecikmesini ölçer.
+#
+# Kullanım (backend dizininden, çalışan bir MongoDB ile):
+#   MONGODB_URL=mongodb://localhost:27017 python -m benchmarks.search [task_count] [project_count] [repeat]
+#
+# Varsayılan 1M task'ı 200 projeye dağıtır (tek seferlik seed birkaç dakika
+# sürer; aynı boyuttaki veri varsa tekrar kullanılır). Her senaryo için
+# TaskService.search_tasks çağrısının p50/p95 süresi ve explain'den dönen
+# incelenen anahtar/doküman sayıları yazdırılır. Tek proje senaryoları hem
+# proje taramasıyla (SEARCH_PROJECT_SCAN_MAX_TASKS) hem text index'le
+# ölçülür. --output=<dosya> raporu ayrıca dosyaya yazar
+# (ör. benchmarks/results/search.txt), --drop ile veri silinir.
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.database import db, create_indexes
+from app.projects import services
+from app.projects.search import build_search_pipeline
+from app.projects.services import TASK_OUTPUT_PROJECTION, TaskService
+
+DATABASE_NAME = "pm_benchmark_search"
+USER_EMAIL = "bench@example.com"
+BATCH_SIZE = 10000
+
+# Kelime frekansları Zipf benzeri: baştaki kelimeler yaygın, sondakiler nadir
+VOCABULARY = [
+    "api", "login", "rapor", "tasarım", "test", "veritabanı", "entegrasyon", "mobil",
+    "ödeme", "bildirim", "performans", "güvenlik", "arama", "dashboard", "export",
+    "migration", "cache", "kuyruk", "fatura", "onboarding", "takvim", "yetki",
+    "loglama", "izleme", "yedekleme", "sertifika", "webhook", "çeviri", "erişilebilirlik",
+    "kvkk",
+]
+TAGS = ["backend", "frontend", "bug", "feature", "urgent", "tech-debt", "design", "ops"]
+STATUSES = ["not_started", "in_progress", "completed", "on_hold", "cancelled"]
+PRIORITIES = ["low", "medium", "high", "critical"]
+
+def make_task(rng: random.Random, project_id: ObjectId, base: datetime) -> dict:
+    words = rng.choices(VOCABULARY, weights=[1 / (i + 1) for i in range(len(VOCABULARY))], k=6)
+    created_at = base + timedelta(minutes=rng.randint(0, 500000))
+    return {
+        "project_id": project_id,
+        "name": " ".join(words[:3]).capitalize(),
+        "description": " ".join(words[3:]) + " için yapılacak iş",
+        "task_type": "task",
+        "status": rng.choice(STATUSES),
+        "priority": rng.choice(PRIORITIES),
+        "assigned_to": f"user{rng.randint(0, 49)}@example.com",
+        "tags": rng.sample(TAGS, rng.randint(0, 3)),
+        "effort_hours": rng.randint(1, 40),
+        "completion_percentage": 0,
+        "dependencies": [],
+        "created_by": USER_EMAIL,
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+async def seed(task_count: int, project_count: int) -> list:
+    """Projeleri ve task'ları oluştur (aynı boyutta veri varsa tekrar kullan)"""
+    database = db.database
+    project_ids = [p["_id"] async for p in database.projects.find({}, {"_id": 1})]
+    if len(project_ids) == project_count and await database.tasks.estimated_document_count() == task_count:
+        return project_ids
+
+    await database.projects.drop()
+    await database.tasks.drop()
+    now = datetime.utcnow()
+    result = await database.projects.insert_many([
+        {"name": f"Project {i}", "owner": USER_EMAIL, "team_members": [], "settings": {},
+         "created_at": now, "updated_at": now}
+        for i in range(project_count)
+    ])
+    project_ids = result.inserted_ids
+
+    rng = random.Random(7)
+    base = datetime(2023, 1, 1)
+    started = time.perf_counter()
+    for start in range(0, task_count, BATCH_SIZE):
+        batch = [
+            make_task(rng, project_ids[i % project_count], base)
+            for i in range(start, min(start + BATCH_SIZE, task_count))
+        ]
+        await database.tasks.insert_many(batch, ordered=False)
+    print(f"seeded {task_count} tasks in {time.perf_counter() - started:.1f}s")
+    return project_ids
+
+def report(lines: list, line: str = "") -> None:
+    print(line)
+    lines.append(line)
+
+def set_project_scan(enabled: bool) -> None:
+    """search_tasks'in küçük projelerde text index yerine proje taraması yapıp yapmayacağı"""
+    services.SEARCH_PROJECT_SCAN_MAX_TASKS = (
+        int(os.getenv("SEARCH_PROJECT_SCAN_MAX_TASKS", "20000")) if enabled else 0
+    )
+
+async def explain(service: TaskService, project_ids, query, filters) -> str:
+    """Sorgunun seçilen plan, incelenen anahtar ve doküman sayıları"""
+    scan_terms = None
+    if query and len(project_ids) == 1:
+        scan_terms = await service._project_scan_terms(project_ids[0], query)
+    pipeline = build_search_pipeline(
+        project_ids, query, filters, TASK_OUTPUT_PROJECTION, 0, 20, scan_terms
+    )
+    result = await db.database.command(
+        "explain", {"aggregate": "tasks", "pipeline": pipeline, "cursor": {}},
+        verbosity="executionStats"
+    )
+    cursor = result if "queryPlanner" in result else result.get("stages", [{}])[0].get("$cursor", {})
+    stats = cursor.get("executionStats", {})
+    plan = cursor.get("queryPlanner", {}).get("winningPlan", {})
+    index_names = []
+    while plan:
+        if plan.get("indexName"):
+            index_names.append(plan["indexName"])
+        plan = plan.get("inputStage") or (plan.get("inputStages") or [None])[0]
+    return (
+        f"keys={stats.get('totalKeysExamined', '?')} docs={stats.get('totalDocsExamined', '?')} "
+        f"index={','.join(index_names) or '-'}"
+    )
+
+async def measure(service: TaskService, lines: list, name: str, repeat: int, **kwargs) -> None:
+    timings = []
+    total = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await service.search_tasks(USER_EMAIL, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+        total = result.total
+    timings.sort()
+    report(
+        lines,
+        f"{name:<44} total={total:>7}  p50={statistics.median(timings):>7.2f}ms  "
+        f"p95={timings[int(len(timings) * 0.95) - 1]:>7.2f}ms"
+    )
+
+async def main(task_count: int, project_count: int, repeat: int, drop: bool, output: str = None):
+    db.client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    db.database = db.client[DATABASE_NAME]
+    try:
+        project_ids = await seed(task_count, project_count)
+        await create_indexes()
+
+        service = TaskService()
+        project_id = str(project_ids[0])
+        per_project = task_count // project_count
+        server = await db.database.command("buildInfo")
+        lines: list = []
+        report(lines, f"MongoDB {server.get('version')}, {datetime.utcnow():%Y-%m-%d}")
+        report(lines, f"{task_count} tasks, {project_count} projects (~{per_project} tasks/project)")
+        report(lines)
+
+        scenarios = [
+            ("project: rare word", {"query": "kvkk", "project_id": project_id}),
+            ("project: common word", {"query": "api", "project_id": project_id}),
+            ("project: two words + filters", {
+                "query": "ödeme bildirim", "project_id": project_id,
+                "filters": {"status": ["in_progress"], "tags": ["backend"]},
+            }),
+            ("project: filters only", {"project_id": project_id, "filters": {"priority": ["high"]}}),
+            ("all projects: rare word", {"query": "kvkk"}),
+            ("all projects: common word", {"query": "api"}),
+        ]
+        runs = []
+        for name, kwargs in scenarios:
+            runs.append((name, kwargs, True))
+            if "project_id" in kwargs and "query" in kwargs:
+                runs.append((f"{name} [text index]", kwargs, False))
+
+        for name, kwargs, scan in runs:
+            set_project_scan(scan)
+            await service.search_tasks(USER_EMAIL, **kwargs)  # Isınma
+            await measure(service, lines, name, repeat, **kwargs)
+
+        report(lines)
+        for name, kwargs, scan in runs:
+            set_project_scan(scan)
+            ids = [ObjectId(kwargs["project_id"])] if "project_id" in kwargs else project_ids
+            plan = await explain(service, ids, kwargs.get("query"), kwargs.get("filters"))
+            report(lines, f"{name:<44} {plan}")
+        set_project_scan(True)
+
+        if output:
+            os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+            with open(output, "w") as f:
+                f.write("\n".join(lines) + "\n")
+            print(f"report written to {output}")
+    finally:
+        if drop:
+            await db.client.drop_database(DATABASE_NAME)
+        db.client.close()
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    output = next((arg.split("=", 1)[1] for arg in sys.argv[1:] if arg.startswith("--output=")), None)
+    asyncio.run(main(
+        int(args[0]) if len(args) > 0 else 1_000_000,
+        int(args[1]) if len(args) > 1 else 200,
+        int(args[2]) if len(args) > 2 else 50,
+        "--drop" in sys.argv,
+        output
+    ))
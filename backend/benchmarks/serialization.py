@@ -0,0 +1,95 @@
+# backend/benchmarks/serialization.py
+# Task listesi yanıtının serileştirme maliyetini iki yol için karşılaştırır:
+#   model:  Task(**doc) -> response_model=List[Task] doğrulaması -> stdlib json
+#   fast:   task_output_document(doc) -> FastJSONResponse (orjson)
+#
+# Kullanım (backend dizininden, veritabanı gerekmez):
+#   python -m benchmarks.serialization [task_count] [repeat]
+
+import asyncio
+import copy
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.projects.models import Task
+from app.projects.services import task_output_document
+from app.shared.responses import FastJSONResponse
+
+def make_documents(count: int) -> List[dict]:
+    """Mongo'dan dönen ham task dokümanlarına benzeyen veri üret"""
+    project_id = ObjectId()
+    rng = random.Random(42)
+    base = datetime(2024, 1, 1)
+    ids = [ObjectId() for _ in range(count)]
+    documents = []
+    for i, task_id in enumerate(ids):
+        start = base + timedelta(days=rng.randint(0, 300))
+        documents.append({
+            "_id": task_id,
+            "project_id": project_id,
+            "name": f"Task {i}",
+            "description": " ".join(["Lorem ipsum dolor sit amet"] * 3),
+            "task_type": rng.choice(["task", "task", "epic", "milestone"]),
+            "status": rng.choice(["not_started", "in_progress", "completed"]),
+            "priority": rng.choice(["low", "medium", "high"]),
+            "start_date": start,
+            "end_date": start + timedelta(days=rng.randint(1, 20)),
+            "duration_days": rng.randint(1, 20),
+            "effort_hours": float(rng.randint(1, 80)),
+            "completion_percentage": float(rng.randint(0, 100)),
+            "assigned_to": f"user{rng.randint(0, 20)}@example.com",
+            "dependencies": [str(d) for d in rng.sample(ids[:i], min(i, 2))],
+            "parent_epic": None,
+            "tags": ["backend", "api"],
+            "custom_fields": {"estimate": rng.randint(1, 8)},
+            "created_by": "bench@example.com",
+            "created_at": base,
+            "updated_at": base,
+        })
+    return documents
+
+async def model_path(documents: List[dict], field) -> bytes:
+    tasks = [Task(**task_data) for task_data in documents]
+    content = await serialize_response(field=field, response_content=tasks)
+    return JSONResponse(content=content).body
+
+async def fast_path(documents: List[dict], field) -> bytes:
+    return FastJSONResponse(content=[task_output_document(task_data) for task_data in documents]).body
+
+async def measure(name: str, path, documents: List[dict], repeat: int, field) -> bytes:
+    timings = []
+    body = b""
+    for _ in range(repeat):
+        batch = copy.deepcopy(documents)  # Ham doküman yerinde değiştirilir
+        start = time.perf_counter()
+        body = await path(batch, field)
+        timings.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{name:<6} p50={statistics.median(timings):>8.1f}ms  "
+        f"min={min(timings):>8.1f}ms  size={len(body) / 1024:.0f}KB"
+    )
+    return body
+
+async def main(count: int, repeat: int):
+    documents = make_documents(count)
+    field = create_response_field(name="response", type_=List[Task])
+    print(f"{count} task, {repeat} tekrar")
+    model_body = await measure("model", model_path, documents, repeat, field)
+    fast_body = await measure("fast", fast_path, documents, repeat, field)
+    print(f"aynı çıktı: {json.loads(model_body) == json.loads(fast_body)}")
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    ))
@@ -0,0 +1,314 @@
+# backend/benchmarks/suite.py
+# API'yi süreç içinde (ASGI) çalıştırıp auth/proje/task/timeline endpoint'lerinin
+# throughput ve p50/p95/p99 gecikmelerini ölçer; sonucu JSON olarak yazar ve
+# kayıtlı bir baseline ile karşılaştırır.
+#
+# Kullanım (backend dizininden):
+#   pip install -r benchmarks/requirements.txt
+#   python -m benchmarks.suite                                  # mongomock, 10/1000 task
+#   python -m benchmarks.suite --sizes 10,1000,50000 --output results.json
+#   python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+#   python -m benchmarks.suite --baseline benchmarks/baseline.json   # regresyonda çıkış kodu 1
+#   MONGODB_URL=mongodb://localhost:27017 python -m benchmarks.suite --backend mongo
+#
+# mongomock sonuçları sorgu planlarını değil Python tarafındaki sıcak yolları
+# (doğrulama, serileştirme, cache) yansıtır; baseline aynı makine ve aynı
+# backend ile alınmalıdır. "cold" senaryolarında her istekten önce task
+# response cache'i geçersiz kılınır (süreye dahil edilmez).
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from bson import ObjectId
+
+from app.database import db, create_indexes
+from app.main import app
+from app.shared.response_cache import response_cache
+
+DATABASE_NAME = "pm_benchmark_suite"
+PASSWORD = "bench123"
+SEED_BATCH_SIZE = 5000
+
+STATUSES = ["not_started", "in_progress", "completed", "on_hold"]
+PRIORITIES = ["low", "medium", "high", "critical"]
+TAGS = ["backend", "frontend", "bug", "feature", "ops"]
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: str  # {project_id} / {task_id} yer tutucuları
+    data: Optional[Callable[[int], Dict[str, Any]]] = None  # form (login)
+    json: Optional[Callable[[int], Dict[str, Any]]] = None
+    authenticated: bool = True
+    cold: bool = False  # Her istekten önce task cache'ini geçersiz kıl
+    requests: Optional[int] = None  # --requests'i ezer (ör. bcrypt'li login)
+
+SCENARIOS = [
+    Scenario("auth.login", "POST", "/api/auth/login", authenticated=False, requests=20,
+             data=lambda i: {"username": "bench@example.com", "password": PASSWORD}),
+    Scenario("auth.me", "GET", "/api/auth/me"),
+    Scenario("projects.list", "GET", "/api/projects/"),
+    Scenario("projects.get", "GET", "/api/projects/{project_id}"),
+    Scenario("tasks.list", "GET", "/api/projects/{project_id}/tasks"),
+    Scenario("tasks.list.cold", "GET", "/api/projects/{project_id}/tasks", cold=True),
+    Scenario("tasks.page", "GET", "/api/projects/{project_id}/tasks/page?limit=50"),
+    Scenario("tasks.get", "GET", "/api/projects/{project_id}/tasks/{task_id}"),
+    Scenario("tasks.create", "POST", "/api/projects/{project_id}/tasks",
+             json=lambda i: {"name": f"Bench task {i}", "effort_hours": 4}),
+    Scenario("tasks.update", "PUT", "/api/projects/{project_id}/tasks/{task_id}",
+             json=lambda i: {"completion_percentage": i % 100}),
+    Scenario("timeline", "GET", "/api/projects/{project_id}/timeline"),
+    Scenario("timeline.cold", "GET", "/api/projects/{project_id}/timeline", cold=True),
+]
+
+def make_tasks(project_id: ObjectId, count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Tekrarlanabilir sentetik task dokümanları (bağımlılık zinciri ve epic'lerle)"""
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    ids = [ObjectId() for _ in range(count)]
+    epics = ids[: max(count // 50, 1)]  # İlk task'lar epic, diğerleri bunlara bağlı
+    tasks = []
+    for i, task_id in enumerate(ids):
+        start = base + timedelta(days=rng.randint(0, 365))
+        duration = rng.randint(1, 15)
+        created_at = base + timedelta(seconds=i)
+        tasks.append({
+            "_id": task_id,
+            "project_id": project_id,
+            "name": f"Task {i}",
+            "description": f"Synthetic task {i} for benchmarking",
+            "task_type": "epic" if i < len(epics) else "task",
+            "status": rng.choice(STATUSES),
+            "priority": rng.choice(PRIORITIES),
+            "start_date": start,
+            "end_date": start + timedelta(days=duration),
+            "duration_days": duration,
+            "effort_hours": float(rng.randint(1, 40)),
+            "completion_percentage": float(rng.randint(0, 100)),
+            "assigned_to": f"user{rng.randint(0, 19)}@example.com",
+            "parent_epic": str(rng.choice(epics)) if i >= len(epics) else None,
+            "dependencies": [str(ids[i - 1])] if i > len(epics) and rng.random() < 0.3 else [],
+            "tags": rng.sample(TAGS, rng.randint(0, 2)),
+            "created_by": "bench@example.com",
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+    return tasks
+
+async def use_database(backend: str) -> Callable[[], Awaitable[None]]:
+    """db global'ini seçilen backend'e bağla, temizleme fonksiyonunu döndür"""
+    if backend == "mongo":
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        db.client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+        await db.client.drop_database(DATABASE_NAME)
+    else:
+        from mongomock_motor import AsyncMongoMockClient
+
+        db.client = AsyncMongoMockClient()
+    db.database = db.client[DATABASE_NAME]
+    db.analytics_database = None
+    await create_indexes()
+
+    async def cleanup():
+        if backend == "mongo":
+            await db.client.drop_database(DATABASE_NAME)
+            db.client.close()
+
+    return cleanup
+
+async def setup(client: httpx.AsyncClient, size: int) -> Dict[str, Any]:
+    """Kullanıcı, proje ve size adet task oluştur"""
+    await client.post("/api/auth/register", json={
+        "email": "bench@example.com", "full_name": "Bench User", "password": PASSWORD
+    })
+    login = await client.post("/api/auth/login", data={"username": "bench@example.com", "password": PASSWORD})
+    login.raise_for_status()
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    project = await client.post("/api/projects/", json={"name": f"Bench {size}"}, headers=headers)
+    project.raise_for_status()
+    project_id = project.json()["_id"]
+
+    tasks = make_tasks(ObjectId(project_id), size)
+    for start in range(0, len(tasks), SEED_BATCH_SIZE):
+        await db.database.tasks.insert_many(tasks[start:start + SEED_BATCH_SIZE])
+    await response_cache.invalidate(f"tasks:{project_id}")
+
+    return {"headers": headers, "project_id": project_id, "task_id": str(tasks[len(tasks) // 2]["_id"])}
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * pct / 100), len(values) - 1)]
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    context: Dict[str, Any],
+    requests: int,
+    concurrency: int,
+    max_seconds: float,
+) -> Dict[str, Any]:
+    """Senaryoyu concurrency kadar eşzamanlı istekle çalıştır"""
+    path = scenario.path.format(project_id=context["project_id"], task_id=context["task_id"])
+    headers = context["headers"] if scenario.authenticated else {}
+    total = scenario.requests or requests
+    timings: List[float] = []
+    statuses: Counter = Counter()
+    counter = iter(range(total))
+    started = time.perf_counter()
+    deadline = started + max_seconds
+
+    async def worker():
+        for i in counter:
+            if time.perf_counter() > deadline:
+                return
+            if scenario.cold:
+                await response_cache.invalidate(f"tasks:{context['project_id']}")
+            kwargs: Dict[str, Any] = {"headers": headers}
+            if scenario.data:
+                kwargs["data"] = scenario.data(i)
+            if scenario.json:
+                kwargs["json"] = scenario.json(i)
+            start = time.perf_counter()
+            response = await client.request(scenario.method, path, **kwargs)
+            timings.append((time.perf_counter() - start) * 1000)
+            statuses[response.status_code] += 1
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    elapsed = time.perf_counter() - started
+    errors = sum(count for code, count in statuses.items() if code >= 400)
+    return {
+        "requests": len(timings),
+        "errors": errors,
+        "throughput_rps": round(len(timings) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(timings), 3) if timings else 0.0,
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+    }
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, min_delta_ms: float) -> List[str]:
+    """p95'i baseline'dan tolerance oranı ve min_delta_ms'ten fazla kötüleşen senaryolar"""
+    regressions = []
+    for size, scenarios in baseline.get("results", {}).items():
+        for name, base in scenarios.items():
+            current = results["results"].get(size, {}).get(name)
+            if current is None:
+                continue
+            limit = max(base["p95_ms"] * (1 + tolerance), base["p95_ms"] + min_delta_ms)
+            status = "ok"
+            if current["p95_ms"] > limit:
+                status = "REGRESSION"
+                regressions.append(f"{size}/{name}: p95 {base['p95_ms']}ms -> {current['p95_ms']}ms")
+            elif current["errors"] > base.get("errors", 0):
+                status = "REGRESSION"
+                regressions.append(f"{size}/{name}: errors {base.get('errors', 0)} -> {current['errors']}")
+            print(
+                f"  {size:>6} {name:<18} p95 {base['p95_ms']:>9.2f} -> {current['p95_ms']:>9.2f}ms  "
+                f"rps {base['throughput_rps']:>8.1f} -> {current['throughput_rps']:>8.1f}  {status}"
+            )
+    return regressions
+
+async def main(args: argparse.Namespace) -> int:
+    sizes = [int(size) for size in args.sizes.split(",")]
+    selected = [s for s in SCENARIOS if not args.scenarios or s.name in args.scenarios.split(",")]
+    results: Dict[str, Any] = {
+        "meta": {
+            "backend": args.backend,
+            "sizes": sizes,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "git_revision": git_revision(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        },
+        "results": {},
+    }
+
+    transport = httpx.ASGITransport(app=app)
+    for size in sizes:
+        cleanup = await use_database(args.backend)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+                seed_started = time.perf_counter()
+                context = await setup(client, size)
+                print(f"\n{size} tasks (seeded in {time.perf_counter() - seed_started:.1f}s)")
+                size_results = results["results"][str(size)] = {}
+                for scenario in selected:
+                    # Isınma
+                    await run_scenario(client, scenario, context, min(args.concurrency, 5), 1, args.max_seconds)
+                    stats = await run_scenario(
+                        client, scenario, context, args.requests, args.concurrency, args.max_seconds
+                    )
+                    size_results[scenario.name] = stats
+                    print(
+                        f"  {scenario.name:<18} n={stats['requests']:>5}  rps={stats['throughput_rps']:>8.1f}  "
+                        f"p50={stats['p50_ms']:>8.2f}ms  p95={stats['p95_ms']:>8.2f}ms  "
+                        f"p99={stats['p99_ms']:>8.2f}ms  errors={stats['errors']}"
+                    )
+        finally:
+            await cleanup()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\nComparison with {args.baseline} ({baseline['meta'].get('git_revision')}):")
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            return 1
+        print("\nNo regressions")
+    return 0
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="API benchmark suite")
+    parser.add_argument("--backend", choices=["mongomock", "mongo"], default="mongomock")
+    parser.add_argument("--sizes", default="10,1000", help="Virgülle ayrılmış proje task sayıları")
+    parser.add_argument("--scenarios", default="", help="Sadece bu senaryolar (virgülle ayrılmış)")
+    parser.add_argument("--requests", type=int, default=200, help="Senaryo başına istek sayısı")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--max-seconds", type=float, default=20.0, help="Senaryo başına süre sınırı")
+    parser.add_argument("--output", help="Sonuç JSON dosyası")
+    parser.add_argument("--save-baseline", help="Sonucu baseline olarak kaydet")
+    parser.add_argument("--baseline", help="Karşılaştırılacak baseline JSON dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="İzin verilen p95 artışı (oran)")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="Bu kadar ms altındaki artışlar gürültü sayılır")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
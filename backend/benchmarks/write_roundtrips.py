@@ -0,0 +1,112 @@
+# backend/benchmarks/write_roundtrips.py
+# Yazma endpoint'lerinin istek başına kaç MongoDB komutu çalıştırdığını ölçer.
+#
+# Kullanım (backend dizininden, çalışan bir MongoDB ile):
+#   MONGODB_URL=mongodb://localhost:27017 python -m benchmarks.write_roundtrips [iterations]
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+
+import httpx
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from app.database import db, create_indexes
+from app.main import app
+
+DATABASE_NAME = "pm_benchmark_roundtrips"
+IGNORED_COMMANDS = {"endSessions", "hello", "isMaster", "ismaster", "ping"}
+
+class CommandCounter(monitoring.CommandListener):
+    """Çalışan Mongo komutlarını sayar"""
+
+    def __init__(self):
+        self.commands = Counter()
+
+    def started(self, event):
+        if event.command_name not in IGNORED_COMMANDS:
+            self.commands[event.command_name] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+async def measure(client, counter, name, make_request, iterations):
+    """Endpoint'i çağırıp istek başına round trip sayısını ve süresini ölç"""
+    timings = []
+    commands = Counter()
+    for i in range(iterations):
+        method, url, kwargs = make_request(i)
+        counter.commands.clear()
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        commands.update(counter.commands)
+
+    per_request = {k: round(v / iterations, 2) for k, v in commands.items()}
+    print(
+        f"{name:<32} round_trips={sum(commands.values()) / iterations:>4.1f}  "
+        f"p50={statistics.median(timings):>7.2f}ms  {per_request}"
+    )
+
+async def main(iterations: int):
+    counter = CommandCounter()
+    db.client = AsyncIOMotorClient(
+        os.getenv("MONGODB_URL", "mongodb://localhost:27017"),
+        event_listeners=[counter]
+    )
+    await db.client.drop_database(DATABASE_NAME)
+    db.database = db.client[DATABASE_NAME]
+    await create_indexes()
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await client.post("/api/auth/register", json={
+                "email": "bench@example.com", "full_name": "Bench User", "password": "bench123"
+            })
+            login = await client.post(
+                "/api/auth/login", data={"username": "bench@example.com", "password": "bench123"}
+            )
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+            await client.get("/api/auth/me", headers=headers)  # Principal cache'i ısıt
+
+            project_id = (await client.post(
+                "/api/projects/", json={"name": "Bench"}, headers=headers
+            )).json()["_id"]
+            task_id = (await client.post(
+                f"/api/projects/{project_id}/tasks", json={"name": "Seed"}, headers=headers
+            )).json()["_id"]
+
+            await measure(client, counter, "POST /api/auth/register", lambda i: (
+                "POST", "/api/auth/register",
+                {"json": {"email": f"user{i}@example.com", "full_name": "Bench User", "password": "bench123"}}
+            ), iterations)
+            await measure(client, counter, "POST /api/projects/", lambda i: (
+                "POST", "/api/projects/", {"json": {"name": f"Project {i}"}, "headers": headers}
+            ), iterations)
+            await measure(client, counter, "PUT /api/projects/{id}", lambda i: (
+                "PUT", f"/api/projects/{project_id}",
+                {"json": {"description": f"Revision {i}"}, "headers": headers}
+            ), iterations)
+            await measure(client, counter, "POST /api/projects/{id}/tasks", lambda i: (
+                "POST", f"/api/projects/{project_id}/tasks",
+                {"json": {"name": f"Task {i}"}, "headers": headers}
+            ), iterations)
+            await measure(client, counter, "PUT /api/projects/{id}/tasks/{id}", lambda i: (
+                "PUT", f"/api/projects/{project_id}/tasks/{task_id}",
+                {"json": {"completion_percentage": i % 100}, "headers": headers}
+            ), iterations)
+    finally:
+        await db.client.drop_database(DATABASE_NAME)
+        db.client.close()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
@@ -84,6 +84,46 @@ export interface TaskUpdate {
   custom_fields?: Record<string, any>;
 }
 
+export interface TaskCounts {
+  total_tasks: number;
+  by_status: Record<string, number>;
+  by_type: Record<string, number>;
+  by_priority: Record<string, number>;
+  overdue_tasks: number;
+}
+
+export interface ProjectTaskSummary extends TaskCounts {
+  project_id: string;
+  name: string;
+  status: Project['status'];
+}
+
+export interface DashboardSummary {
+  projects: ProjectTaskSummary[];
+  totals: TaskCounts;
+  recent_tasks: Task[];
+}
+
+export type ProjectEventType =
+  | 'task.created'
+  | 'task.updated'
+  | 'task.deleted'
+  | 'project.updated'
+  | 'project.deleted'
+  | 'resync';
+
+export interface ProjectEvent {
+  type: ProjectEventType;
+  project_id: string;
+  task_id?: string;
+  task?: Task;
+  fields?: Record<string, any> | null;
+}
+
+const PROJECT_EVENT_TYPES: ProjectEventType[] = [
+  'task.created', 'task.updated', 'task.deleted', 'project.updated', 'project.deleted', 'resync',
+];
+
 export interface LoginData {
   access_token: string;
   token_type: string;
@@ -168,6 +208,10 @@ class ApiClient {
     return this.request<Project[]>('/api/projects/');
   }
 
+  async getDashboardSummary(): Promise<DashboardSummary> {
+    return this.request<DashboardSummary>('/api/projects/dashboard');
+  }
+
   async getProject(projectId: string): Promise<Project> {
     return this.request<Project>(`/api/projects/${projectId}`);
   }
@@ -241,6 +285,25 @@ class ApiClient {
   async getProjectTimeline(projectId: string): Promise<any> {
     return this.request<any>(`/api/projects/${projectId}/timeline`);
   }
+
+  // Proje değişikliklerini Server-Sent Events ile dinle; dönen fonksiyon bağlantıyı kapatır.
+  // EventSource header gönderemediği için token query parametresiyle iletilir.
+  subscribeProjectEvents(projectId: string, onEvent: (event: ProjectEvent) => void): () => void {
+    const params = new URLSearchParams();
+    if (this.token) params.append('access_token', this.token);
+    const source = new EventSource(`${API_BASE_URL}/api/projects/${projectId}/events?${params.toString()}`);
+
+    const handler = (message: MessageEvent) => {
+      try {
+        onEvent(JSON.parse(message.data) as ProjectEvent);
+      } catch (err) {
+        console.error('Proje olayı okunamadı:', err);
+      }
+    };
+    PROJECT_EVENT_TYPES.forEach(type => source.addEventListener(type, handler as EventListener));
+
+    return () => source.close();
+  }
 }
 
 export const apiClient = new ApiClient();
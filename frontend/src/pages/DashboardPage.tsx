@@ -91,43 +91,25 @@ const DashboardPage: React.FC<DashboardPageProps> = ({
     }
 
     setTasksLoading(true);
-    const allTasks: Task[] = [];
-    let totalTasks = 0;
-    let completedTasks = 0;
-    let inProgressTasks = 0;
 
     try {
-      // Son 3 aktif projeden task'ları al
-      const activeProjects = projects
-        .filter(p => p.status === 'in_progress')
-        .slice(0, 3);
-
-      for (const project of activeProjects) {
-        try {
-          const tasks = await apiClient.getProjectTasks(project.id);
-          allTasks.push(...tasks.map(task => ({ ...task, projectName: project.name })));
-          
-          totalTasks += tasks.length;
-          completedTasks += tasks.filter(t => t.status === 'completed').length;
-          inProgressTasks += tasks.filter(t => t.status === 'in_progress').length;
-        } catch (err) {
-          console.error(`Error loading tasks for project ${project.id}:`, err);
-        }
-      }
+      // Tüm projelerin task özetini tek istekte al
+      const summary = await apiClient.getDashboardSummary();
+      const projectNames = new Map(summary.projects.map(p => [p.project_id, p.name]));
 
-      // En son oluşturulan task'ları al
-      const sortedTasks = allTasks
-        .sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime())
-        .slice(0, 5);
+      setRecentTasks(
+        summary.recent_tasks.map(task => ({
+          ...task,
+          projectName: projectNames.get(task.project_id),
+        }))
+      );
 
-      setRecentTasks(sortedTasks);
-      
       // Task istatistiklerini güncelle
       setStats(prev => ({
         ...prev,
-        totalTasks,
-        completedTasks,
-        inProgressTasks,
+        totalTasks: summary.totals.total_tasks,
+        completedTasks: summary.totals.by_status.completed || 0,
+        inProgressTasks: summary.totals.by_status.in_progress || 0,
       }));
 
     } catch (err) {
@@ -37,6 +37,26 @@ const ProjectDetailPage: React.FC = () => {
     }
   }, [taskFilter, projectId]);
 
+  // Diğer kullanıcıların değişikliklerini canlı olarak al
+  useEffect(() => {
+    if (!projectId) return;
+
+    const unsubscribe = apiClient.subscribeProjectEvents(projectId, (event) => {
+      switch (event.type) {
+        case 'project.deleted':
+          navigate('/projects');
+          break;
+        case 'project.updated':
+          apiClient.getProject(projectId).then(setProject).catch(() => undefined);
+          break;
+        default:
+          // Filtre sunucuda uygulandığı için task olaylarında liste yeniden yüklenir
+          loadTasks();
+      }
+    });
+    return unsubscribe;
+  }, [projectId, taskFilter, navigate]);
+
   const loadProjectData = async () => {
     try {
       setLoading(true);